@@ -7,54 +7,136 @@ Entry point for the game with menu support
 import pygame
 import sys
 from src.core.game_state import GameState
+from src.core.simulation_thread import SimulationThread
+from src.core.advisor import LookaheadAdvisor
 from src.ui.screen_manager import ScreenManager
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from src.ui.frame_scheduler import FrameScheduler
+from src.ui.input_mapper import InputMapper
+from src.ui.layout import get_layout
+from src.ui.presenter import Presenter
+from src.assets.audio_manager import get_audio_manager
+from src.assets.texture_generator import get_texture_generator
+from src.assets.job_system import get_job_system
+from settings import (
+    THREADED_SIMULATION, AUDIO_BUFFER, ENTITY_STRESS_COUNT, RENDER_PRESETS, RENDER_PRESET, FULLSCREEN
+)
 
 
 def main():
     """Main game loop"""
+    threaded = THREADED_SIMULATION or '--threaded' in sys.argv[1:]
+    stress_entities = '--stress-entities' in sys.argv[1:]
+    preset = 'performance' if '--performance' in sys.argv[1:] else RENDER_PRESET
+    fullscreen = FULLSCREEN or '--fullscreen' in sys.argv[1:]
+    texture_report = '--texture-report' in sys.argv[1:]
+    # Small mixer buffer so synthesized key tones start within a frame
+    pygame.mixer.pre_init(buffer=AUDIO_BUFFER)
     pygame.init()
     
-    # Create game window
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Create game window; screens draw into the presenter's render target
+    # at the preset resolution and it is scaled to fit the window
+    render_size = RENDER_PRESETS[preset]
+    get_layout().resize(render_size)
+    presenter = Presenter(render_size, fullscreen)
+    screen = presenter.target
     pygame.display.set_caption("Breach - Management Horror")
-    clock = pygame.time.Clock()
+    scheduler = FrameScheduler()
+    input_mapper = InputMapper(transform=presenter.to_render)
+    input_mapper.install()
+    
+    def setup_game(new_state):
+        """Prepare each new game before it starts running"""
+        if stress_entities:
+            new_state.entities.stress(ENTITY_STRESS_COUNT)
     
     # Initialize game state and UI
     game_state = GameState()
-    screen_manager = ScreenManager(game_state)
+    advisor = LookaheadAdvisor()
+    screen_manager = ScreenManager(game_state, on_game_created=setup_game, advisor=advisor)
+    simulation = None
+    last_screen = None
+    audio = get_audio_manager()
+    jobs = get_job_system()
+    audio_state = None
+    ambience_on = False
     
     # Main game loop
     running = True
     while running:
-        # Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        # Wait for the next frame (blocks on input while the screen is static)
+        events = scheduler.wait(screen_manager.get_animation_fps())
+        
+        # Input: named actions go only to the active screen
+        for action, value in input_mapper.translate(events):
+            if action == 'quit':
                 running = False
+            elif action == 'fullscreen':
+                presenter.toggle_fullscreen()
+                scheduler.request_render()
+            elif action == 'resize':
+                presenter.resized()
+                scheduler.request_render()
+            else:
+                if action in ('click', 'confirm', 'station'):
+                    audio.play_ui('click')
+                screen_manager.handle_action(action, value)
+        
+        # Hook audio up to each new game before it starts running
+        if screen_manager.game_state is not audio_state:
+            audio_state = screen_manager.game_state
+            audio_state.add_event_listener(audio.on_game_event)
+            audio_state.time_manager.add_phase_listener(audio.set_ambience)
+            ambience_on = False
+        if screen_manager.is_playing() != ambience_on:
+            ambience_on = screen_manager.is_playing()
+            audio.set_ambience(audio_state.time_manager.is_night() if ambience_on else None)
+        
+        if threaded:
+            # (Re)start the simulation thread when a new game begins
+            game_state = screen_manager.game_state
+            if screen_manager.is_playing() and (simulation is None or simulation.game_state is not game_state):
+                if simulation is not None:
+                    simulation.stop()
+                simulation = SimulationThread(game_state)
+                screen_manager.command_sink = simulation.submit
+                simulation.start()
             
-            # Exit on ESC key
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
+            # Render from the last published state; never waits on the simulation
+            screen_manager.update(simulation.latest() if simulation else None)
+        else:
+            # Update game state
+            if screen_manager.is_playing():
+                screen_manager.game_state.update(scheduler.delta_time)
             
-            # Pass event to screen manager
-            screen_manager.handle_event(event)
+            # Update UI
+            screen_manager.update()
         
-        # Update game state
-        delta_time = clock.get_time() / 1000.0  # Convert ms to seconds
-        game_state.update(delta_time)
+        # Collect finished forecast runs (shown on the control panel)
+        advisor.poll()
         
-        # Update UI
-        screen_manager.update()
+        # Turn finished background generation into surfaces/sounds
+        if jobs.update():
+            scheduler.request_render()
         
-        # Render
-        screen.fill((0, 0, 0))  # Black background
-        screen_manager.render(screen)
-        pygame.display.flip()
+        # Render (static screens only when something changed)
+        if screen_manager.current_screen is not last_screen:
+            last_screen = screen_manager.current_screen
+            scheduler.request_render()
+        if scheduler.needs_render:
+            screen.fill((0, 0, 0))  # Black background
+            screen_manager.render(screen)
+            presenter.present()
+            scheduler.frame_rendered()
         
-        # Control frame rate
-        clock.tick(FPS)
+        audio.update()
     
+    if simulation is not None:
+        simulation.stop()
+    advisor.shutdown()
+    audio.shutdown()
+    jobs.shutdown()
+    if texture_report:
+        get_texture_generator().print_memory_report()
     pygame.quit()
     sys.exit()
 
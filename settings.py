@@ -1,12 +1,26 @@
 # Game Settings and Constants
 # Breach - Management Horror
 
-import pygame
-
 # ========== SCREEN SETTINGS ==========
-SCREEN_WIDTH = 1280
+SCREEN_WIDTH = 1280  # Layout grid: screens are laid out in these units at any resolution
 SCREEN_HEIGHT = 720
+RENDER_PRESETS = {
+    'quality': (1280, 720),
+    'performance': (640, 360),  # For weak machines; scaled up to the window
+}
+RENDER_PRESET = 'quality'  # Internal render resolution (or pass --performance)
+WINDOW_RESIZABLE = True
+FULLSCREEN = False  # Start fullscreen (or pass --fullscreen); F11 toggles
+SMOOTH_SCALING = True  # smoothscale to window sizes that aren't a whole multiple
 FPS = 60
+SCREEN_SNAPSHOT_CACHE_BYTES = 20 * 1024 * 1024  # Last frames of recently left screens (the 5 stations at 1280x720)
+SCREEN_TRANSITION_MS = 150  # Cross-fade from a screen's snapshot to the live screen
+IDLE_FPS = 4  # Wake-up rate while the screen is static and there is no input
+INPUT_ACTIVE_SECONDS = 0.5  # Stay at full FPS this long after input
+MAX_FRAME_DELTA = 0.25  # Longest real-time step fed to the simulation per frame
+PALETTE_RENDERING = True  # 8-bit scenes with palette-swap sanity effects
+THREADED_SIMULATION = False  # Run GameState on its own thread (or pass --threaded)
+SIMULATION_RATE = 60  # Fixed simulation steps per real second when threaded
 
 # ========== COLORS ==========
 COLOR_BLACK = (0, 0, 0)
@@ -28,6 +42,7 @@ DAY_START = 8  # 08:00
 NIGHT_START = 20  # 20:00
 SECONDS_PER_GAME_MINUTE = 0.5  # 1 real second = 2 game minutes
 SECONDS_PER_GAME_HOUR = 30  # 30 real seconds = 1 game hour
+TICKS_PER_GAME_MINUTE = 60  # Integer clock resolution (1 tick = 1 game second)
 
 # ========== RESOURCE SETTINGS ==========
 # Format: (max_amount, day_consumption, night_consumption, critical_level)
@@ -69,10 +84,11 @@ RESOURCES = {
     }
 }
 
+# duration is in game minutes
 SPECIAL_RESOURCES = {
-    'sedatives': {'max': 10, 'sanity_effect': -30},
-    'isotopes': {'max': 8, 'sensor_bonus': 5},
-    'director_logs': {'max': 20}
+    'sedatives': {'max': 10, 'start': 3, 'sanity_effect': -30, 'fuel_mult': 1.15, 'duration': 60},
+    'isotopes': {'max': 8, 'start': 3, 'sensor_bonus': 5, 'duration': 720},
+    'director_logs': {'max': 20, 'start': 0}
 }
 
 # ========== SANITY SETTINGS ==========
@@ -94,7 +110,8 @@ SANITY_MODIFIERS = {
     'sedative': -30  # one-time
 }
 
-FRACTURED_TIMEOUT = 600  # 10 minutes at sanity 100 = GAME OVER
+FRACTURED_TIMEOUT = 600  # Game seconds: 10 game minutes fractured = GAME OVER
+SANITY_HYSTERESIS = 2  # Points below a threshold before falling back to a calmer state
 
 # ========== DIFFICULTY SETTINGS ==========
 DIFFICULTIES = {
@@ -128,9 +145,117 @@ REPAIR_COSTS = {
     'insane': {'generator': 8, 'heating': 6, 'ventilation': 5, 'lighting': 4}
 }
 
+# Effect of a completed repair: modifier applied for `duration` game minutes
+REPAIR_EFFECTS = {
+    'generator': {'target': 'fuel', 'multiplier': 0.8, 'duration': 1440},
+    'heating': {'target': 'food', 'multiplier': 0.8, 'duration': 1440},
+    'ventilation': {'target': 'water', 'multiplier': 0.8, 'duration': 1440},
+    'lighting': {'target': 'batteries', 'multiplier': 0.75, 'duration': 1440}
+}
+
+# ========== STATIONS ==========
+STATIONS = ['observation', 'control_panel', 'monitors', 'laboratory', 'journal']
+MONITOR_BATTERY_DRAIN = -2.0  # per hour while watching the cameras (1 per 30 minutes)
+LOG_READING_MINUTES = 10  # Game minutes one reading session lasts
+
+# ========== ENTITIES ==========
+# Station layout: room -> connected rooms. Camera rooms match the monitor feeds.
+STATION_ROOMS = {
+    'Zone': ('Roof', 'Entrance', 'Engine Room'),
+    'Roof': ('Zone', 'Corridor'),
+    'Entrance': ('Zone', 'Corridor'),
+    'Engine Room': ('Zone', 'Corridor'),
+    'Corridor': ('Roof', 'Entrance', 'Engine Room', 'Station'),
+    'Station': ('Corridor',),
+}
+ENTITY_SPAWN_ROOM = 'Zone'
+ENTITY_TARGET_ROOM = 'Station'
+ENTITY_MAX = 4  # Manifestations active at once (anomalous events spawn them)
+ENTITY_DECISION_MINUTES = 240  # Mean game minutes between decisions at zero aggression
+ENTITY_NIGHT_AGGRESSION = 1.8  # Aggression multiplier at night
+ENTITY_RETREAT_CHANCE = 0.6  # Chance a decision that doesn't advance backs off instead
+ENTITY_STRESS_COUNT = 5000  # Entities spawned by --stress-entities
+
+# ========== SNAPSHOTS ==========
+REWIND_HISTORY_HOURS = 2  # Game hours of per-minute snapshots kept for rewind
+
+# ========== LOOKAHEAD ADVISOR ==========
+ADVISOR_RUNS_PER_OPTION = 16  # Seeded simulations per choice
+ADVISOR_HORIZON_HOURS = 24  # How far ahead each simulation runs
+ADVISOR_WORKERS = 2  # Background processes
+
+# ========== PLAYTEST ENVIRONMENT ==========
+ENV_STEP_MINUTES = 10  # Game minutes simulated per agent step
+ENV_MAX_STEPS = TOTAL_DAYS * 24 * 6  # Whole game at 10 minutes per step
+
+# ========== CAMERA FEEDS ==========
+CAMERA_FEED_BACKGROUND_FPS = 4  # Refresh rate of cameras other than the selected one
+CAMERA_FEED_BUDGET_MS = 3.0  # Per-frame time allowed for background feed refreshes
+NOISE_FRAME_COUNT = 8  # Precomputed static frames per pool
+NOISE_FRAME_MARGIN = 64  # Extra pixels per side for random offsets
+NOISE_MAX_ALPHA = 170  # Static opacity at full intensity
+NOISE_SIGNAL_LOSS = 0.8  # Intensity above which the picture can drop out
+
+# ========== LIGHTING ==========
+# Fuel thresholds are fractions of the reserve above the critical level
+# (where the game is lost), so every mode is reached while still playing
+LIGHT_LOW_FUEL = 0.3  # Reserve below which the lights dim and flicker
+LIGHT_GENERATOR_OUT = 0.1  # Reserve below which the generator stops (batteries only)
+LIGHT_AMBIENT = 0.06  # Light level with no power at all
+FLASHLIGHT_RADIUS = 260  # Pixels
+LIGHT_FLICKER_STEPS = 64  # Length of the precomputed flicker sequence
+
+# ========== PARTICLES ==========
+PARTICLE_CAPACITY = 16000  # Most anomaly particles alive at once
+
+# ========== ANOMALY MAP ==========
+ANOMALY_MAP_TILE = 128  # Tile size in pixels
+ANOMALY_MAP_MAX_ZOOM = 4  # Zoom levels 0..max, each doubles the scale
+ANOMALY_MAP_GRID = 64  # Spatial index cells per side
+ANOMALY_MAP_TILE_CACHE = 256  # Rendered tiles kept across all zoom levels
+ANOMALY_MAP_BUDGET_MS = 4.0  # Most time spent rendering new tiles per frame
+
 # ========== MINI-GAME SETTINGS ==========
 SPECTROMETER_DIFFICULTY = 4  # Number of peaks to match
 MORSE_CODE_LENGTH = 8  # Characters in morse code puzzle
+MORSE_TONE_HZ = 700
+MORSE_UNIT_MS = 80  # Length of a dot; dash = 3 units
+MORSE_VOLUME = 0.4
+SPECTRUM_BINS = 200  # Spectrometer channels
+SPECTRUM_HISTORY = 16  # Readings averaged on the spectrometer display
+SPECTRUM_NOISE = 0.35  # Reading noise (std) before calibration; peaks are 0.45-1.0 high
+SENSOR_CALIBRATION_GAIN = 0.15  # Noise is divided by 1 + gain * sensor_accuracy
+PEAK_MATCH_TOLERANCE = 0.03  # Marker distance (fraction of the band) for a good match
+MAGNETOMETER_SAMPLES = 120  # Samples visible per magnetometer trace
+MAGNETOMETER_RATE = 30  # Magnetometer samples per second
+
+# ========== TEXT ==========
+TEXT_LAYOUT_CACHE = 64  # Wrapped texts remembered per font
+TYPEWRITER_CPS = 45  # Characters revealed per second in the journal
+JOURNAL_NOTES = (
+    "Station-7, first entry.\n"
+    "The previous director left in a hurry: coffee still in the mug, the generator log "
+    "stopped mid-sentence. The relief crew is due in twenty days.\n"
+    "Keep the generator fed. Watch the monitors at night. Write everything down, "
+    "especially the things that cannot be true."
+)
+
+# ========== AUDIO ==========
+AUDIO_CHANNELS = 16  # Mixer channels shared by all sound effects
+SOUND_CACHE_BYTES = 32 * 1024 * 1024  # Decoded sound effects kept in memory
+AMBIENT_CROSSFADE_MS = 3000  # Day/night ambience crossfade (fade out + fade in)
+AMBIENT_VOLUME = 0.6
+AUDIO_RESERVED_CHANNELS = 1  # Channels outside the pool (Morse radio)
+AUDIO_BUFFER = 512  # Mixer buffer in samples; ~12 ms at 44.1 kHz keeps key tones under a frame
+
+# ========== BACKGROUND JOBS ==========
+JOB_WORKERS = 2  # Threads generating textures, noise and audio buffers
+JOB_UPLOAD_BUDGET_MS = 2.0  # Main-thread time per frame for turning results into surfaces/sounds
+
+# ========== TEXTURES ==========
+TEXTURE_BAKE_CACHE = True  # Keep expensive procedural textures on disk between runs
+TEXTURE_BAKE_DIR = 'cache/textures'  # Relative to the project root
+TEXTURE_BAKE_VERSION = 1  # Bump when a texture builder changes to ignore old bakes
 
 # ========== TEXTURE PATHS ==========
 TEXTURE_PATHS = {
@@ -21,6 +21,7 @@ class AssetLoader:
             # Если запущено как скрипт Python
             project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+        self.project_root = project_root
         self.assets_dir = os.path.join(project_root, "assets", "images")
         self.cache: Dict[str, pygame.Surface] = {}
         self.missing_assets: set = set()
@@ -0,0 +1,275 @@
+"""
+Audio Manager for Breach
+Streamed day/night ambience, a byte-budgeted sound cache and a prioritized
+channel pool. Nothing called from game code touches the disk.
+"""
+import os
+import queue
+import re
+import sys
+import threading
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pygame
+from settings import (
+    SOUND_PATHS, AUDIO_CHANNELS, AUDIO_RESERVED_CHANNELS, SOUND_CACHE_BYTES,
+    AMBIENT_CROSSFADE_MS, AMBIENT_VOLUME
+)
+
+AUDIO_EXTENSIONS = ('.ogg', '.wav', '.mp3', '.flac')
+
+# Channel priority by sound category; higher may steal from lower
+PRIORITIES = {
+    'ui': 1,
+    'routine': 2,
+    'anomalous': 3,
+    'critical': 4,
+}
+
+
+def sound_key(name: str) -> str:
+    """File stem for an event or sound name ("Dimensional Breach" -> dimensional_breach)"""
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+class AudioManager:
+    """Plays ambience and sound effects without blocking the frame
+
+    Public methods only queue work; update() runs it once per frame on the
+    main thread, so they can be called from the simulation thread too.
+    Sounds are decoded by a background loader thread; a sound that is not
+    loaded yet is requested and skipped rather than waited for.
+    """
+
+    def __init__(self):
+        if getattr(sys, 'frozen', False):
+            project_root = os.path.dirname(sys.executable)
+        else:
+            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        self.enabled = self._init_mixer()
+        self.files: Dict[str, Dict[str, str]] = {
+            category: self._scan(os.path.join(project_root, path))
+            for category, path in SOUND_PATHS.items()
+        }
+
+        # Sound cache, least recently used first
+        self.cache: 'OrderedDict[str, Tuple[pygame.mixer.Sound, int]]' = OrderedDict()
+        self.cache_bytes = 0
+        self.pending: set = set()
+        self.load_requests: 'queue.SimpleQueue[Optional[str]]' = queue.SimpleQueue()
+        self.loaded: Deque[Tuple[str, pygame.mixer.Sound]] = deque()
+        self.commands: Deque[tuple] = deque()
+
+        # Channel pool: priority of what each channel is playing
+        self.channels: List[pygame.mixer.Channel] = []
+        self.channel_priority: List[int] = []
+        self.channel_started: List[int] = []
+
+        # Ambience crossfade state
+        self.ambience: Optional[str] = None  # Track playing or fading in
+        self.next_ambience: Optional[str] = None
+        self.fade_start = 0
+        self.fading_out = False
+
+        if self.enabled:
+            pygame.mixer.set_num_channels(AUDIO_CHANNELS + AUDIO_RESERVED_CHANNELS)
+            self.channels = [pygame.mixer.Channel(i) for i in range(AUDIO_CHANNELS)]
+            self.channel_priority = [0] * AUDIO_CHANNELS
+            self.channel_started = [0] * AUDIO_CHANNELS
+
+            self.loader = threading.Thread(target=self._load_worker, name='audio-loader', daemon=True)
+            self.loader.start()
+            # Warm the cache with every short sound, within the budget
+            for category in ('events', 'ui'):
+                for key in self.files[category]:
+                    self._request(key)
+
+    def _init_mixer(self) -> bool:
+        """Start the mixer if possible; without an audio device stay silent"""
+        if pygame.mixer.get_init() is None:
+            try:
+                pygame.mixer.init()
+            except pygame.error:
+                return False
+        return True
+
+    def _scan(self, directory: str) -> Dict[str, str]:
+        """Map file stems to paths for the audio files in a directory"""
+        if not os.path.isdir(directory):
+            return {}
+        files = {}
+        for filename in os.listdir(directory):
+            stem, ext = os.path.splitext(filename)
+            if ext.lower() in AUDIO_EXTENSIONS:
+                files[sound_key(stem)] = os.path.join(directory, filename)
+        return files
+
+    # ---- Public API (any thread, never blocks) ----
+
+    def play(self, name: str, category: str = 'routine') -> None:
+        """Queue a sound effect by event or file name"""
+        self.commands.append(('play', sound_key(name), PRIORITIES.get(category, 1)))
+
+    def play_ui(self, name: str) -> None:
+        """Queue a UI sound"""
+        self.commands.append(('play', sound_key(name), PRIORITIES['ui']))
+
+    def on_game_event(self, event: dict) -> None:
+        """GameState event listener: play the sound for a triggered event"""
+        self.play(event['name'], event.get('type', 'routine'))
+
+    def set_ambience(self, is_night: Optional[bool]) -> None:
+        """Crossfade to the day or night ambience (None fades out)"""
+        track = None if is_night is None else ('night' if is_night else 'day')
+        self.commands.append(('ambience', track))
+
+    def reserved_channel(self, index: int = 0) -> Optional[pygame.mixer.Channel]:
+        """A channel outside the pool that effects never steal (main thread only)"""
+        if not self.enabled or index >= AUDIO_RESERVED_CHANNELS:
+            return None
+        return pygame.mixer.Channel(AUDIO_CHANNELS + index)
+
+    # ---- Main thread ----
+
+    def update(self) -> None:
+        """Run queued work; call once per frame"""
+        if not self.enabled:
+            self.commands.clear()
+            return
+
+        while self.loaded:
+            key, sound = self.loaded.popleft()
+            self._store(key, sound)
+
+        while self.commands:
+            command = self.commands.popleft()
+            if command[0] == 'play':
+                self._play(command[1], command[2])
+            else:
+                self._crossfade(command[1])
+
+        self._update_fade()
+
+    def _play(self, key: str, priority: int) -> None:
+        """Start a cached sound on a free or stolen channel"""
+        entry = self.cache.get(key)
+        if entry is None:
+            self._request(key)
+            return
+        self.cache.move_to_end(key)
+
+        index = self._pick_channel(priority)
+        if index is None:
+            return
+        self.channels[index].play(entry[0])
+        self.channel_priority[index] = priority
+        self.channel_started[index] = pygame.time.get_ticks()
+
+    def _pick_channel(self, priority: int) -> Optional[int]:
+        """Free channel, else steal the oldest of the lowest priority not above ours"""
+        victim = None
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+            if self.channel_priority[index] <= priority:
+                if victim is None or (self.channel_priority[index], self.channel_started[index]) < \
+                        (self.channel_priority[victim], self.channel_started[victim]):
+                    victim = index
+        if victim is not None:
+            self.channels[victim].stop()
+        return victim
+
+    # ---- Sound cache ----
+
+    def _request(self, key: str) -> None:
+        """Ask the loader thread for a sound that is not cached"""
+        if key in self.cache or key in self.pending:
+            return
+        if key in self.files['events'] or key in self.files['ui']:
+            self.pending.add(key)
+            self.load_requests.put(key)
+
+    def _load_worker(self) -> None:
+        """Decode sounds off the main thread"""
+        while True:
+            key = self.load_requests.get()
+            if key is None:
+                return
+            path = self.files['events'].get(key) or self.files['ui'].get(key)
+            try:
+                self.loaded.append((key, pygame.mixer.Sound(path)))
+            except (pygame.error, FileNotFoundError):
+                self.loaded.append((key, None))
+
+    def _store(self, key: str, sound: Optional[pygame.mixer.Sound]) -> None:
+        """Add a decoded sound, evicting least recently used ones over budget"""
+        self.pending.discard(key)
+        if sound is None:
+            return
+        frequency, sample_format, channels = pygame.mixer.get_init()
+        size = int(sound.get_length() * frequency * channels * abs(sample_format) // 8)
+        if size > SOUND_CACHE_BYTES:
+            return
+        self.cache[key] = (sound, size)
+        self.cache_bytes += size
+        while self.cache_bytes > SOUND_CACHE_BYTES:
+            _, (_, evicted) = self.cache.popitem(last=False)
+            self.cache_bytes -= evicted
+
+    # ---- Ambience ----
+
+    def _crossfade(self, track: Optional[str]) -> None:
+        """Begin fading from the current ambience to another track"""
+        if track == self.ambience and not self.fading_out:
+            return
+        self.next_ambience = track
+        if self.ambience is None:
+            self._start_ambience()
+        elif not self.fading_out:
+            self.fading_out = True
+            self.fade_start = pygame.time.get_ticks()
+
+    def _start_ambience(self) -> None:
+        """Start streaming the next ambient track with a fade in"""
+        self.ambience = self.next_ambience
+        self.fading_out = False
+        path = self.files['ambient'].get(self.ambience) if self.ambience else None
+        if path is None:
+            pygame.mixer.music.stop()
+            self.ambience = None
+            return
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(AMBIENT_VOLUME)
+        pygame.mixer.music.play(loops=-1, fade_ms=AMBIENT_CROSSFADE_MS // 2)
+
+    def _update_fade(self) -> None:
+        """Ramp the outgoing track down, then switch tracks"""
+        if not self.fading_out:
+            return
+        half = AMBIENT_CROSSFADE_MS // 2
+        progress = (pygame.time.get_ticks() - self.fade_start) / half
+        if progress >= 1.0:
+            self._start_ambience()
+        else:
+            pygame.mixer.music.set_volume(AMBIENT_VOLUME * (1.0 - progress))
+
+    def shutdown(self) -> None:
+        """Stop the loader thread and all playback"""
+        if self.enabled:
+            self.load_requests.put(None)
+            pygame.mixer.music.stop()
+            pygame.mixer.stop()
+
+
+# Global audio manager
+_audio_manager: Optional[AudioManager] = None
+
+
+def get_audio_manager() -> AudioManager:
+    """Get the global audio manager"""
+    global _audio_manager
+    if _audio_manager is None:
+        _audio_manager = AudioManager()
+    return _audio_manager
@@ -0,0 +1,198 @@
+"""
+Job System for Breach
+Procedural generation on background worker threads, results uploaded on
+the main thread within a per-frame time slice
+"""
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+from settings import JOB_WORKERS, JOB_UPLOAD_BUDGET_MS
+
+
+PackedPixels = Tuple[bytes, Tuple[int, int]]
+
+
+def pack_pixels(rgb: np.ndarray) -> PackedPixels:
+    """(w, h, 3) pixels to BGRA bytes on a worker, so upload is a single copy"""
+    width, height = rgb.shape[:2]
+    packed = np.empty((height, width, 4), dtype=np.uint8)
+    packed[..., :3] = rgb.transpose(1, 0, 2)[..., ::-1]
+    packed[..., 3] = 255
+    return packed.tobytes(), (width, height)
+
+
+def unpack_surface(pixels: PackedPixels) -> pygame.Surface:
+    """Display-format surface from pack_pixels() output (main thread)"""
+    data, size = pixels
+    return pygame.image.frombuffer(data, size, 'BGRA').convert()
+
+
+class Job:
+    """One unit of generation work"""
+
+    __slots__ = ('build', 'upload', 'group', 'order', 'on_error')
+
+    def __init__(self, build: Callable[[], Any], upload: Callable[[Any], None],
+                 group: Optional[str], order: int,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        self.build = build
+        self.upload = upload
+        self.group = group
+        self.order = order
+        self.on_error = on_error
+
+
+class JobSystem:
+    """Small thread pool for generation jobs
+
+    A job's build() runs on a worker and must work on plain data only
+    (NumPy arrays, bytes, files): no Surfaces, pygame.draw or pygame.image,
+    with or without a display. Its upload(result) runs
+    in update() on the main thread, where surfaces are converted and
+    Sounds made. Uploads stop once the frame's time slice is spent (at
+    least one runs per frame), the rest wait for the next frame. If build()
+    or upload() raises, the job's on_error(exception) runs instead, also on
+    the main thread, so owners can forget the pending request or build it
+    another way; without one the error is printed.
+
+    Workers pick the pending job whose group is the active screen first,
+    then the screens likely to be visited next in the given order, then
+    everything else; ties go to the oldest job. Threads rather than
+    processes: the heavy parts are NumPy and zlib calls that release
+    the GIL, and results need no pickling.
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS, budget_ms: float = JOB_UPLOAD_BUDGET_MS):
+        self.worker_count = workers
+        self.budget = budget_ms / 1000.0
+        self.condition = threading.Condition()
+        self.pending: List[Job] = []
+        self.finished: Deque[Tuple[Job, Any, Optional[Exception]]] = deque()
+        self.in_flight = 0
+        self.order = itertools.count()
+        self.focus: Optional[str] = None
+        self.likely: Tuple[str, ...] = ()
+        self.threads: List[threading.Thread] = []
+        self.running = True
+
+    def submit(self, build: Callable[[], Any], upload: Callable[[Any], None],
+               group: Optional[str] = None,
+               on_error: Optional[Callable[[Exception], None]] = None) -> None:
+        """Queue a job; group is the screen that needs the result"""
+        with self.condition:
+            self.pending.append(Job(build, upload, group, next(self.order), on_error))
+            self.condition.notify()
+        if not self.threads:
+            for index in range(self.worker_count):
+                thread = threading.Thread(target=self._worker, name=f'job-worker-{index}', daemon=True)
+                thread.start()
+                self.threads.append(thread)
+
+    def set_focus(self, active: Optional[str], likely: Sequence[str] = ()) -> None:
+        """Screen on view and the screens expected next (most likely first)"""
+        with self.condition:
+            self.focus = active
+            self.likely = tuple(likely)
+
+    def _priority(self, job: Job) -> Tuple[int, int]:
+        """Sort key for a pending job (lower runs first)"""
+        if job.group is not None and job.group == self.focus:
+            rank = 0
+        elif job.group in self.likely:
+            rank = 1 + self.likely.index(job.group)
+        else:
+            rank = 1 + len(self.likely)
+        return rank, job.order
+
+    def _next(self) -> Optional[Job]:
+        """Block until a job is available; None once shut down"""
+        with self.condition:
+            while self.running and not self.pending:
+                self.condition.wait()
+            if not self.running:
+                return None
+            job = min(self.pending, key=self._priority)
+            self.pending.remove(job)
+            self.in_flight += 1
+            return job
+
+    def _worker(self) -> None:
+        """Run builds off the main thread"""
+        while True:
+            job = self._next()
+            if job is None:
+                return
+            try:
+                result, error = job.build(), None
+            except Exception as e:
+                result, error = None, e
+            self.finished.append((job, result, error))
+            with self.condition:
+                self.in_flight -= 1
+                self.condition.notify_all()
+
+    def update(self) -> int:
+        """Upload finished results within the time slice; returns how many ran"""
+        deadline = time.perf_counter() + self.budget
+        uploaded = 0
+        while self.finished and (uploaded == 0 or time.perf_counter() < deadline):
+            self._complete(*self.finished.popleft())
+            uploaded += 1
+        return uploaded
+
+    def _complete(self, job: Job, result: Any, error: Optional[Exception]) -> None:
+        """Upload a finished job's result, or report its failure to the owner"""
+        if error is None:
+            try:
+                job.upload(result)
+                return
+            except Exception as e:
+                error = e
+        if job.on_error is not None:
+            job.on_error(error)
+        else:
+            print(f"⚠️ Ошибка фоновой задачи: {error}")
+
+    def is_idle(self) -> bool:
+        """True when nothing is queued, building or waiting for upload"""
+        with self.condition:
+            return not self.pending and not self.in_flight and not self.finished
+
+    def finish(self, timeout: Optional[float] = None) -> None:
+        """Wait for every queued job and upload all results (loading screens, tools)"""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self.condition:
+            while self.pending or self.in_flight:
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+        while self.finished:
+            self._complete(*self.finished.popleft())
+
+    def shutdown(self) -> None:
+        """Stop the workers; queued jobs are dropped"""
+        with self.condition:
+            self.running = False
+            self.pending.clear()
+            self.condition.notify_all()
+        for thread in self.threads:
+            thread.join(timeout=1.0)
+        self.threads = []
+
+
+# Global job system
+_job_system: Optional[JobSystem] = None
+
+
+def get_job_system() -> JobSystem:
+    """Get the global job system"""
+    global _job_system
+    if _job_system is None:
+        _job_system = JobSystem()
+    return _job_system
@@ -0,0 +1,158 @@
+"""
+Morse Synthesizer for Breach
+Radio tones built once with NumPy and assembled into cached messages
+"""
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pygame
+from src.assets.job_system import JobSystem
+from settings import MORSE_TONE_HZ, MORSE_UNIT_MS, MORSE_VOLUME
+
+MORSE_CODE = {
+    'A': '.-', 'B': '-...', 'C': '-.-.', 'D': '-..', 'E': '.', 'F': '..-.',
+    'G': '--.', 'H': '....', 'I': '..', 'J': '.---', 'K': '-.-', 'L': '.-..',
+    'M': '--', 'N': '-.', 'O': '---', 'P': '.--.', 'Q': '--.-', 'R': '.-.',
+    'S': '...', 'T': '-', 'U': '..-', 'V': '...-', 'W': '.--', 'X': '-..-',
+    'Y': '-.--', 'Z': '--..',
+    '0': '-----', '1': '.----', '2': '..---', '3': '...--', '4': '....-',
+    '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.',
+}
+
+
+class MorseSynth:
+    """Dot, dash, gap and static buffers synthesized once at startup
+
+    Messages are a single np.concatenate of those buffers (no per-sample
+    Python) and are cached by content; prepare() builds one on a job
+    system worker ahead of time. The key tone is a prebuilt looping
+    Sound on a reserved channel, so pressing the key only costs a
+    Channel.play call and the tone starts within one mixer buffer.
+    """
+
+    def __init__(self, channel: Optional[pygame.mixer.Channel] = None,
+                 frequency: float = MORSE_TONE_HZ, unit_ms: int = MORSE_UNIT_MS):
+        self.enabled = pygame.mixer.get_init() is not None
+        self.channel = channel
+        self.messages: Dict[Tuple[str, bool], pygame.mixer.Sound] = {}
+        self.preparing: Set[Tuple[str, bool]] = set()
+        if not self.enabled:
+            return
+
+        self.rate, sample_format, self.channels = pygame.mixer.get_init()
+        self.dtype = np.int16 if abs(sample_format) == 16 else np.int8 if abs(sample_format) == 8 else np.int32
+        self.amplitude = np.iinfo(self.dtype).max * MORSE_VOLUME
+        unit = int(self.rate * unit_ms / 1000)
+
+        # Base buffers, mono float in -1..1
+        self.dot = self._tone(unit, frequency)
+        self.dash = self._tone(unit * 3, frequency)
+        self.element_gap = np.zeros(unit, dtype=np.float32)
+        self.letter_gap = np.zeros(unit * 3, dtype=np.float32)
+        self.word_gap = np.zeros(unit * 7, dtype=np.float32)
+        rng = np.random.default_rng(0)
+        self.static = (rng.standard_normal(self.rate) * 0.08).astype(np.float32)
+
+        # Continuous key tone: a whole number of periods so it loops cleanly
+        period = self.rate / frequency
+        periods = max(1, int(round(unit / period)))
+        samples = np.arange(int(round(periods * period)))
+        self.key_tone = self._to_sound(np.sin(2 * np.pi * frequency * samples / self.rate))
+
+    def _tone(self, length: int, frequency: float) -> np.ndarray:
+        """Sine tone with short attack/release ramps so it doesn't click"""
+        samples = np.arange(length)
+        tone = np.sin(2 * np.pi * frequency * samples / self.rate).astype(np.float32)
+        ramp = min(length // 4, int(self.rate * 0.005))
+        if ramp:
+            envelope = np.linspace(0.0, 1.0, ramp, dtype=np.float32)
+            tone[:ramp] *= envelope
+            tone[-ramp:] *= envelope[::-1]
+        return tone
+
+    def _to_samples(self, mono: np.ndarray) -> np.ndarray:
+        """Convert a mono float buffer into samples in the mixer's format"""
+        samples = (np.clip(mono, -1.0, 1.0) * self.amplitude).astype(self.dtype)
+        if self.channels > 1:
+            samples = np.repeat(samples[:, None], self.channels, axis=1)
+        return np.ascontiguousarray(samples)
+
+    def _to_sound(self, mono: np.ndarray) -> pygame.mixer.Sound:
+        """Convert a mono float buffer into a Sound in the mixer's format"""
+        return pygame.sndarray.make_sound(self._to_samples(mono))
+
+    def encode(self, text: str) -> str:
+        """Text to dots and dashes, letters separated by spaces, words by ' / '"""
+        return ' / '.join(' '.join(MORSE_CODE[char] for char in word if char in MORSE_CODE)
+                          for word in text.upper().split())
+
+    def message_sound(self, text: str, with_static: bool = True) -> Optional[pygame.mixer.Sound]:
+        """Sound for a whole message (cached by content)"""
+        if not self.enabled:
+            return None
+        key = (text.upper(), with_static)
+        sound = self.messages.get(key)
+        if sound is None:
+            sound = self.messages[key] = pygame.sndarray.make_sound(self._message_samples(text, with_static))
+        return sound
+
+    def prepare(self, text: str, jobs: JobSystem, group: Optional[str] = None,
+                with_static: bool = True) -> None:
+        """Synthesize a message in the background so playing it costs nothing"""
+        key = (text.upper(), with_static)
+        if not self.enabled or key in self.messages or key in self.preparing:
+            return
+        self.preparing.add(key)
+
+        def upload(samples: np.ndarray) -> None:
+            self.preparing.discard(key)
+            if key not in self.messages:
+                self.messages[key] = pygame.sndarray.make_sound(samples)
+
+        def failed(error: Exception) -> None:
+            # message_sound() builds it on the spot when it is played
+            self.preparing.discard(key)
+            print(f"⚠️ Не удалось подготовить сообщение: {error}")
+
+        jobs.submit(lambda: self._message_samples(text, with_static), upload, group, failed)
+
+    def _message_samples(self, text: str, with_static: bool) -> np.ndarray:
+        """Mixer-format samples for a message (NumPy only; worker-safe)"""
+        parts: List[np.ndarray] = []
+        for word_index, word in enumerate(text.upper().split()):
+            if word_index:
+                parts.append(self.word_gap)
+            letters = [MORSE_CODE[char] for char in word if char in MORSE_CODE]
+            for letter_index, code in enumerate(letters):
+                if letter_index:
+                    parts.append(self.letter_gap)
+                for element_index, element in enumerate(code):
+                    if element_index:
+                        parts.append(self.element_gap)
+                    parts.append(self.dot if element == '.' else self.dash)
+        parts.append(self.word_gap)
+        buffer = np.concatenate(parts)
+
+        if with_static:
+            # Tile the static loop under the whole message
+            repeats = -(-len(buffer) // len(self.static))
+            buffer = buffer + np.tile(self.static, repeats)[:len(buffer)]
+        return self._to_samples(buffer)
+
+    def play_message(self, text: str, with_static: bool = True) -> float:
+        """Transmit a message, returns its length in seconds"""
+        sound = self.message_sound(text, with_static)
+        if sound is None or self.channel is None:
+            return 0.0
+        self.channel.play(sound)
+        return sound.get_length()
+
+    def key_down(self) -> None:
+        """Start the key tone (loops until key_up)"""
+        if self.enabled and self.channel is not None:
+            self.channel.play(self.key_tone, loops=-1)
+
+    def key_up(self) -> None:
+        """Stop the key tone"""
+        if self.enabled and self.channel is not None:
+            self.channel.stop()
@@ -0,0 +1,85 @@
+"""
+Noise Frames for Breach
+Camera static and scanline overlays precomputed with NumPy
+"""
+import random
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pygame
+from src.assets.job_system import JobSystem, PackedPixels, pack_pixels, unpack_surface
+from settings import NOISE_FRAME_COUNT, NOISE_FRAME_MARGIN, NOISE_MAX_ALPHA, NOISE_SIGNAL_LOSS
+
+
+def noise_frame_pixels(width: int, height: int, seed: np.random.SeedSequence) -> PackedPixels:
+    """One static frame as packed pixels (safe to run on a worker)"""
+    generator = np.random.default_rng(seed)
+    # Gray static, darker on every other row, plus a few torn bright rows
+    noise = generator.integers(0, 256, (width, height), dtype=np.uint8)
+    noise[:, 1::2] >>= 1
+    torn = generator.integers(0, height, 6)
+    noise[:, torn] = np.maximum(noise[:, torn], 200)
+    return pack_pixels(np.repeat(noise[:, :, None], 3, axis=2))
+
+
+class NoiseFramePool:
+    """Pool of static frames built once and cycled with random offsets
+
+    Frames are a little larger than the feeds they cover, so blitting a
+    random window of a random frame gives far more variety than the pool
+    size while costing one blit per feed refresh. Given a job system, the
+    frames are generated on its workers (one job per frame) and join the
+    pool as they are uploaded; until the first arrives only the scanlines
+    are drawn.
+    """
+
+    def __init__(self, size: Tuple[int, int], frame_count: int = NOISE_FRAME_COUNT,
+                 seed: Optional[int] = None, jobs: Optional[JobSystem] = None,
+                 group: Optional[str] = None):
+        self.size = size
+        self.rng = random.Random(seed)
+        width, height = size[0] + NOISE_FRAME_MARGIN, size[1] + NOISE_FRAME_MARGIN
+
+        self.frames: List[pygame.Surface] = []
+        for frame_seed in np.random.SeedSequence(seed).spawn(frame_count):
+            if jobs is None:
+                self._add_frame(noise_frame_pixels(width, height, frame_seed))
+            else:
+                jobs.submit(lambda frame_seed=frame_seed: noise_frame_pixels(width, height, frame_seed),
+                            self._add_frame, group)
+
+        # Static scanline overlay: every other row darkened
+        self.scanlines = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        self.scanlines.fill((0, 0, 0, 0))
+        alpha = pygame.surfarray.pixels_alpha(self.scanlines)
+        alpha[:, ::2] = 70
+        del alpha  # Release the surface lock
+
+    def _add_frame(self, pixels: PackedPixels) -> None:
+        """Turn generated pixels into a display-format frame"""
+        self.frames.append(unpack_surface(pixels))
+
+    def draw(self, surface: pygame.Surface, intensity: float) -> bool:
+        """Overlay static at an intensity in 0..1 onto a feed surface
+
+        Returns True if the frame was a full signal loss.
+        """
+        if not self.frames:
+            surface.blit(self.scanlines, (0, 0))
+            return False
+        frame = self.frames[self.rng.randrange(len(self.frames))]
+        area = pygame.Rect(self.rng.randrange(NOISE_FRAME_MARGIN),
+                           self.rng.randrange(NOISE_FRAME_MARGIN), *surface.get_size())
+
+        # Past the threshold, occasionally drop the picture entirely
+        lost = intensity > NOISE_SIGNAL_LOSS and self.rng.random() < intensity - NOISE_SIGNAL_LOSS
+        frame.set_alpha(255 if lost else int(NOISE_MAX_ALPHA * intensity))
+        surface.blit(frame, (0, 0), area)
+        surface.blit(self.scanlines, (0, 0))
+        return lost
+
+
+def feed_noise_intensity(battery_fraction: float, proximity: float) -> float:
+    """Static intensity for a feed from battery level and anomaly proximity"""
+    intensity = 0.1 + 0.5 * (1.0 - battery_fraction) + 0.5 * proximity
+    return max(0.0, min(1.0, intensity))
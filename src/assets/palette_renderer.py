@@ -0,0 +1,115 @@
+"""
+Palette Renderer for Breach
+8-bit palettized scenes whose sanity color effects are palette swaps
+"""
+from typing import List, Tuple
+
+import numpy as np
+import pygame
+
+Palette = List[Tuple[int, int, int]]
+
+_BUCKETS = 1 << 15  # 5 bits per channel
+
+
+def quantize_pixels(rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Palette indices (w, h) and a fitted 256-color palette for (w, h, 3) pixels
+
+    Colors are bucketed at 5 bits per channel, the 256 most used buckets
+    (by their mean color) become the palette and every bucket maps to its
+    nearest palette entry. NumPy only, so it can run on a worker thread.
+    """
+    rgb = rgb.astype(np.int32)
+    bins = ((rgb[..., 0] >> 3) << 10) | ((rgb[..., 1] >> 3) << 5) | (rgb[..., 2] >> 3)
+    flat_bins = bins.ravel()
+
+    counts = np.bincount(flat_bins, minlength=_BUCKETS)
+    used = np.nonzero(counts)[0]
+    means = np.zeros((_BUCKETS, 3))
+    for channel in range(3):
+        sums = np.bincount(flat_bins, weights=rgb[..., channel].ravel(), minlength=_BUCKETS)
+        means[used, channel] = sums[used] / counts[used]
+
+    popular = used[np.argsort(counts[used])[::-1][:256]]
+    palette = means[popular]
+
+    # Nearest palette entry for every used bucket
+    distance = ((means[used][:, None, :] - palette[None, :, :]) ** 2).sum(axis=2)
+    lut = np.zeros(_BUCKETS, dtype=np.uint8)
+    lut[used] = distance.argmin(axis=1)
+
+    base = np.zeros((256, 3), dtype=np.uint8)
+    base[:len(palette)] = np.round(palette).astype(np.uint8)
+    return lut[bins], base
+
+
+def quantize_surface(source: pygame.Surface) -> Tuple[pygame.Surface, np.ndarray]:
+    """Convert a 24/32-bit surface to an 8-bit one with a fitted palette
+
+    See quantize_pixels(). Runs once per scene.
+    """
+    indices, base = quantize_pixels(pygame.surfarray.array3d(source))
+    surface = pygame.Surface(source.get_size(), depth=8)
+    surface.set_palette([tuple(color) for color in base])
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels[:] = indices
+    del pixels  # Release the surface lock
+    return surface, base
+
+
+def sanity_palette(base: np.ndarray, state: str, time_ms: int) -> Palette:
+    """Color effects for a sanity state, applied to 256 palette entries only"""
+    colors = base.astype(np.float32)
+    if state == 'stable':
+        return [tuple(color) for color in base]
+
+    luma = colors @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    if state == 'anxious':
+        # Washed out, with the odd brightness stutter (screen_flicker)
+        colors = colors * 0.7 + luma[:, None] * 0.3
+        if (time_ms // 90) % 23 == 0:
+            colors *= 0.6
+    elif state == 'panicked':
+        # Everything bleeds toward red (visual_hallucination)
+        pulse = 0.45 + 0.1 * np.sin(time_ms / 300.0)
+        red = np.stack([luma * 1.4 + 30, luma * 0.35, luma * 0.35], axis=1)
+        colors = colors * (1 - pulse) + red * pulse
+    elif state == 'fractured':
+        # Rotating channels with bursts of full inversion (color_inversion)
+        colors = np.roll(colors, (time_ms // 400) % 3, axis=1)
+        if (time_ms // 150) % 7 == 0:
+            colors = 255 - colors
+    return [tuple(color) for color in np.clip(colors, 0, 255).astype(np.uint8)]
+
+
+class PalettizedScene:
+    """Static scene kept as 8-bit indices; effects only rewrite the palette
+
+    Blitting the 8-bit surface to the display is the single per-frame
+    conversion to the display format.
+    """
+
+    def __init__(self, source: pygame.Surface):
+        self.surface, self.base_palette = quantize_surface(source)
+        self.state = None
+        self.palette_key = None
+
+    @classmethod
+    def from_quantized(cls, quantized: pygame.Surface) -> 'PalettizedScene':
+        """Scene from an already quantized 8-bit surface (left untouched)"""
+        scene = cls.__new__(cls)
+        scene.surface = quantized.copy()  # Palette swaps must not reach the shared one
+        scene.base_palette = np.array(quantized.get_palette(), dtype=np.uint8)[:, :3]
+        scene.state = None
+        scene.palette_key = None
+        return scene
+
+    def render(self, target: pygame.Surface, position: Tuple[int, int], state: str = 'stable') -> None:
+        """Draw the scene with the color effects for a sanity state"""
+        time_ms = pygame.time.get_ticks()
+        # The effects only change on these time steps; skip redundant swaps
+        key = (state, time_ms // 30)
+        if key != self.palette_key:
+            self.surface.set_palette(sanity_palette(self.base_palette, state, time_ms))
+            self.palette_key = key
+        target.blit(self.surface, position)
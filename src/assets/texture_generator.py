@@ -1,35 +1,271 @@
 """
 Texture Generator for Breach
-Loads PNG images from assets/images/ instead of generating them
+Shared procedural textures, memoized by (kind, size, params) and
+optionally baked to disk
 """
+import hashlib
+import os
+import struct
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
 import pygame
 from src.assets.asset_loader import get_asset_loader
+from src.assets.job_system import get_job_system
+from src.assets.view_renderer import ViewRenderer
+from src.assets.palette_renderer import quantize_pixels
+from settings import TEXTURE_BAKE_CACHE, TEXTURE_BAKE_DIR, TEXTURE_BAKE_VERSION
+
+Size = Tuple[int, int]
+TextureKey = Tuple[str, Size, tuple]
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    """One length-prefixed, CRC-checked PNG chunk"""
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def indexed_png(pixels: Tuple[np.ndarray, np.ndarray]) -> bytes:
+    """8-bit palettized PNG from (w, h) palette indices and a palette
+
+    Plain NumPy and zlib, so baked textures can be encoded on a worker.
+    """
+    indices, palette = pixels
+    width, height = indices.shape
+    rows = np.zeros((height, width + 1), dtype=np.uint8)  # Filter byte 0 per row
+    rows[:, 1:] = indices.T
+    header = struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n'
+            + _png_chunk(b'IHDR', header)
+            + _png_chunk(b'PLTE', np.ascontiguousarray(palette, dtype=np.uint8).tobytes())
+            + _png_chunk(b'IDAT', zlib.compress(rows.tobytes(), 6))
+            + _png_chunk(b'IEND', b''))
 
 
 class TextureGenerator:
-    """Generates or loads textures for the game"""
+    """Procedural texture service
+
+    get(kind, size, **params) builds a texture once and hands the same
+    surface to every caller asking for the same kind, size and params, so
+    callers must treat it as read-only (copy before drawing into it).
+    Kinds registered with bake=True are also written to TEXTURE_BAKE_DIR
+    as PNG and loaded from there on later runs instead of being rebuilt.
+
+    request() is the non-blocking variant for kinds that have a worker
+    builder: a miss draws whatever needs pygame on the spot, queues the
+    NumPy part on the job system and returns None; the texture appears in
+    the cache when the job is uploaded. If the job fails, later requests
+    for that texture build it with get() instead.
+    """
 
     def __init__(self):
         self.asset_loader = get_asset_loader()
-        print("🎨 TextureGenerator инициализирован (загрузка PNG)")
+        self.view_renderer = ViewRenderer()
+        self.textures: Dict[TextureKey, pygame.Surface] = {}
+        self.bake_dir = os.path.join(self.asset_loader.project_root, TEXTURE_BAKE_DIR)
+        self.baked_loads = 0
+        # kind -> (builder(size, **params), bake to disk)
+        self.kinds: Dict[str, Tuple[Callable[..., pygame.Surface], bool]] = {
+            'fill': (self._build_fill, False),
+            'image': (self._build_image, False),
+            'view': (self._build_view, False),
+            'quantized_view': (self._build_quantized_view, True),
+        }
+        # kind -> (source(size, **params) on the main thread, source -> pixels
+        # on a worker (NumPy only), pixels -> PNG bytes for the bake cache on
+        # the worker, pixels -> surface on the main thread)
+        self.worker_kinds: Dict[str, Tuple[Callable[..., object], Callable[[object], object],
+                                           Callable[[object], bytes],
+                                           Callable[[object], pygame.Surface]]] = {
+            'quantized_view': (self._view_pixels, quantize_pixels, indexed_png, self._indexed_surface),
+        }
+        self.requested = set()
+        self.failed = set()  # Keys whose worker build raised
+        print("🎨 TextureGenerator инициализирован")
 
-    def generate_screen_background(self, width: int, height: int) -> pygame.Surface:
-        """
-        Загрузи фон экрана
-        Для MainMenu используется bg_main_menu.png
-        Для других экранов нужны свои фоны
-        """
-        # Пока используем заглушку - позже добавим другие фоны
-        surface = pygame.Surface((width, height))
-        surface.fill((20, 20, 30))  # Тёмный фон по умолчанию
+    def get(self, kind: str, size: Size, **params) -> pygame.Surface:
+        """Shared texture for (kind, size, params); build or load it on first use"""
+        size = (int(size[0]), int(size[1]))
+        key = (kind, size, tuple(sorted(params.items())))
+        texture = self.textures.get(key)
+        if texture is None:
+            builder, bake = self.kinds[kind]
+            texture = self._load_baked(key) if bake else None
+            if texture is None:
+                texture = builder(size, **params)
+                if bake:
+                    self._save_baked(key, texture)
+            self.textures[key] = texture
+        return texture
+
+    def request(self, kind: str, size: Size, group: Optional[str] = None,
+                **params) -> Optional[pygame.Surface]:
+        """Texture if it is ready (or baked); otherwise queue it and return None"""
+        size = (int(size[0]), int(size[1]))
+        key = (kind, size, tuple(sorted(params.items())))
+        texture = self.textures.get(key)
+        if texture is not None or kind not in self.worker_kinds or key in self.failed:
+            return texture if texture is not None else self.get(kind, size, **params)
+        if key in self.requested:
+            return None
+        _, bake = self.kinds[kind]
+        texture = self._load_baked(key) if bake else None
+        if texture is not None:
+            self.textures[key] = texture
+            return texture
+
+        prepare, pixels, encode, to_surface = self.worker_kinds[kind]
+        # Drawing uses pygame, which is not safe on workers; only the
+        # NumPy work after it is handed off
+        source = prepare(size, **params)
+        self.requested.add(key)
+
+        def build():
+            result = pixels(source)
+            if bake:
+                # Encoding the PNG is the slow part; keep it on the worker,
+                # from the raw pixels (no Surfaces off the main thread)
+                self._write_baked(key, encode(result))
+            return result
+
+        def upload(result):
+            self.requested.discard(key)
+            self.textures.setdefault(key, to_surface(result))
+
+        def failed(error):
+            self.requested.discard(key)
+            self.failed.add(key)
+            print(f"⚠️ Фоновая генерация {kind} {size} не удалась: {error}")
+
+        get_job_system().submit(build, upload, group, failed)
+        return None
+
+    # ---- Builders ----
+
+    def _build_fill(self, size: Size, color=(20, 20, 30)) -> pygame.Surface:
+        """Solid color"""
+        surface = pygame.Surface(size).convert()
+        surface.fill(color)
         return surface
 
-    def generate_title_bar(self, width: int, height: int) -> pygame.Surface:
-        """Загрузи заголовок"""
-        surface = pygame.Surface((width, height))
-        surface.fill((30, 30, 50))  # Заглушка
+    def _build_image(self, size: Size, name: str, fallback=(20, 20, 30)) -> pygame.Surface:
+        """PNG from assets/images scaled to size (solid fallback if missing)"""
+        image = self.asset_loader.load(name)
+        if image is None:
+            return self.get('fill', size, color=fallback)
+        if image.get_size() != size:
+            image = pygame.transform.smoothscale(image, size)
+        return image
+
+    def _build_view(self, size: Size, name: str) -> pygame.Surface:
+        """Observation window view drawn by ViewRenderer"""
+        return self.view_renderer.render_view(name, size).convert()
+
+    def _build_quantized_view(self, size: Size, name: str) -> pygame.Surface:
+        """8-bit view whose palette is the fitted base palette (see PalettizedScene)"""
+        return self._indexed_surface(quantize_pixels(self._view_pixels(size, name)))
+
+    def _view_pixels(self, size: Size, name: str) -> np.ndarray:
+        """(w, h, 3) pixels of a view drawn by ViewRenderer (main thread)"""
+        return pygame.surfarray.array3d(self.view_renderer.render_view(name, size))
+
+    def _indexed_surface(self, pixels: Tuple[np.ndarray, np.ndarray]) -> pygame.Surface:
+        """8-bit surface from palette indices and a palette"""
+        indices, base = pixels
+        surface = pygame.Surface(indices.shape, depth=8)
+        surface.set_palette([tuple(color) for color in base])
+        pygame.surfarray.blit_array(surface, indices)
         return surface
 
+    # ---- Bake cache ----
+
+    def _bake_path(self, key: TextureKey) -> str:
+        """File for a baked texture; the version is part of the name"""
+        kind, (width, height), _ = key
+        digest = hashlib.sha1(repr((TEXTURE_BAKE_VERSION, key)).encode()).hexdigest()[:12]
+        return os.path.join(self.bake_dir, f"{kind}_{width}x{height}_{digest}.png")
+
+    def _load_baked(self, key: TextureKey) -> Optional[pygame.Surface]:
+        """Baked texture from disk, or None"""
+        if not TEXTURE_BAKE_CACHE:
+            return None
+        path = self._bake_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            texture = pygame.image.load(path)
+        except pygame.error as e:
+            print(f"⚠️ Не удалось загрузить {path}: {e}")
+            return None
+        self.baked_loads += 1
+        # 8-bit textures keep their palette; others match the display format
+        return texture if texture.get_bitsize() == 8 else texture.convert()
+
+    def _save_baked(self, key: TextureKey, texture: pygame.Surface) -> None:
+        """Write a texture to the bake cache (main thread)"""
+        self._store_baked(key, lambda path: pygame.image.save(texture, path))
+
+    def _write_baked(self, key: TextureKey, png: bytes) -> None:
+        """Write already encoded PNG bytes to the bake cache (worker-safe)"""
+        def write(path: str) -> None:
+            with open(path, 'wb') as file:
+                file.write(png)
+        self._store_baked(key, write)
+
+    def _store_baked(self, key: TextureKey, write: Callable[[str], None]) -> None:
+        """Run write(path) into a temp file, then move it into place (errors are not fatal)"""
+        if not TEXTURE_BAKE_CACHE:
+            return
+        path = self._bake_path(key)
+        temp_path = path[:-4] + '.tmp.png'
+        try:
+            os.makedirs(self.bake_dir, exist_ok=True)
+            write(temp_path)
+            os.replace(temp_path, path)
+        except (OSError, pygame.error) as e:
+            print(f"⚠️ Не удалось сохранить {path}: {e}")
+
+    def clear_bake_cache(self) -> None:
+        """Delete every baked texture file"""
+        if os.path.isdir(self.bake_dir):
+            for filename in os.listdir(self.bake_dir):
+                if filename.endswith('.png'):
+                    os.remove(os.path.join(self.bake_dir, filename))
+
+    # ---- Memory ----
+
+    def memory_report(self) -> Dict[str, Dict[str, int]]:
+        """Textures held and pixel bytes used, per kind"""
+        report: Dict[str, Dict[str, int]] = {}
+        counted = set()
+        for (kind, _, _), texture in self.textures.items():
+            entry = report.setdefault(kind, {'count': 0, 'bytes': 0})
+            entry['count'] += 1
+            # A fallback can be the same surface as another kind's texture
+            if id(texture) not in counted:
+                counted.add(id(texture))
+                entry['bytes'] += texture.get_pitch() * texture.get_height()
+        return report
+
+    def print_memory_report(self) -> None:
+        """Print memory_report() as a table"""
+        report = self.memory_report()
+        total = sum(entry['bytes'] for entry in report.values())
+        print(f"🎨 Текстуры: {total / 1024 / 1024:.1f} MB, с диска: {self.baked_loads}")
+        for kind, entry in sorted(report.items(), key=lambda item: -item[1]['bytes']):
+            print(f"   {kind:16} {entry['count']:4}  {entry['bytes'] / 1024:9.0f} KB")
+
+    # ---- Screen textures ----
+
+    def generate_screen_background(self, width: int, height: int) -> pygame.Surface:
+        """Фон экрана (общий, не рисуй в него)"""
+        return self.get('fill', (width, height), color=(20, 20, 30))
+
+    def generate_title_bar(self, width: int, height: int) -> pygame.Surface:
+        """Заголовок (общий, не рисуй в него)"""
+        return self.get('fill', (width, height), color=(30, 30, 50))
+
 
 # Глобальный генератор текстур
 _texture_generator: TextureGenerator = None
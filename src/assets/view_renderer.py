@@ -14,6 +14,18 @@ class ViewRenderer:
     def __init__(self):
         self.forest_seed = 12345
 
+    def render_view(self, name: str, size: Tuple[int, int]) -> pygame.Surface:
+        """Draw a named view ('forest', 'table', 'control_room') into a new surface"""
+        surface = pygame.Surface(size)
+        surface.fill((20, 20, 30))
+        draw = {
+            'forest': self.draw_forest_view,
+            'table': self.draw_table,
+            'control_room': self.draw_control_room,
+        }[name]
+        draw(surface, surface.get_rect())
+        return surface
+
     def draw_forest_view(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         """Draw window view with forest, sky, and moon"""
         # Sky gradient (dark blue-green night sky)
@@ -26,12 +38,12 @@ class ViewRenderer:
                            (rect.x, rect.y + y),
                            (rect.x + rect.width, rect.y + y))
 
-        # Stars
-        random.seed(self.forest_seed)
+        # Stars (private generators, so drawing never disturbs the global random state)
+        rng = random.Random(self.forest_seed)
         for _ in range(30):
-            star_x = rect.x + random.randint(0, rect.width)
-            star_y = rect.y + random.randint(0, int(rect.height * 0.4))
-            star_brightness = random.randint(100, 255)
+            star_x = rect.x + rng.randint(0, rect.width)
+            star_y = rect.y + rng.randint(0, int(rect.height * 0.4))
+            star_brightness = rng.randint(100, 255)
             pygame.draw.circle(surface, (star_brightness, star_brightness, star_brightness),
                              (star_x, star_y), 1)
 
@@ -48,9 +60,9 @@ class ViewRenderer:
                         (rect.x + rect.width, tree_base), 3)
 
         # Distant trees
-        random.seed(self.forest_seed + 1)
+        rng = random.Random(self.forest_seed + 1)
         for x in range(rect.x, rect.x + rect.width, 40):
-            height = random.randint(50, 120)
+            height = rng.randint(50, 120)
             pygame.draw.line(surface, (5, 15, 5),
                            (x + 20, tree_base),
                            (x + 20, tree_base - height), 4)
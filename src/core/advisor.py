@@ -0,0 +1,185 @@
+"""
+Lookahead Advisor
+Estimates survival odds of day-phase choices with seeded what-if simulations
+running in a background process pool
+"""
+
+import multiprocessing
+import random
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from settings import (
+    ADVISOR_RUNS_PER_OPTION, ADVISOR_HORIZON_HOURS, ADVISOR_WORKERS,
+    REPAIR_COSTS
+)
+
+DEFAULT_OPTIONS = ['wait', 'sedative'] + [f'repair_{name}' for name in REPAIR_COSTS['normal']]
+
+
+def apply_option(game_state, option):
+    """Apply a named choice to a game state, returns False if not possible"""
+    if option == 'wait':
+        return True
+    if option == 'sedative':
+        return game_state.use_sedative()
+    if option.startswith('repair_'):
+        return game_state.repair(option[len('repair_'):])
+    return False
+
+
+def run_lookahead(snapshot, option, seed, horizon_hours):
+    """Simulate one seeded future from a snapshot (runs in a worker process)
+
+    Returns the ending type, or None if the game is still going at the horizon.
+    """
+    from src.core.game_state import GameState
+
+    game_state = GameState(snapshot.difficulty)
+    # restore() brings back both RNGs and every entity's pending decision
+    # without drawing from them, so reseeding here fully decides the run
+    game_state.restore(snapshot)
+    game_state.event_generator.rng.seed(seed)
+    game_state.entities.rng.seed(seed)
+    apply_option(game_state, option)
+
+    # Step one game minute at a time; hourly events still fire on schedule
+    for _ in range(int(horizon_hours * 60)):
+        game_state.advance_minutes(1)
+        if game_state.game_over:
+            break
+    return game_state.ending_type
+
+
+class LookaheadAdvisor:
+    """Runs what-if simulations for player choices without blocking the frame
+
+    evaluate() only submits work; poll() collects whatever runs have finished
+    since the last call, so estimates refine progressively. evaluate() may
+    be called from the simulation thread while the render thread polls.
+    """
+
+    def __init__(self, runs_per_option=ADVISOR_RUNS_PER_OPTION,
+                 horizon_hours=ADVISOR_HORIZON_HOURS, workers=ADVISOR_WORKERS):
+        """Initialize advisor (the process pool starts on first use)"""
+        self.runs_per_option = runs_per_option
+        self.horizon_hours = horizon_hours
+        self.workers = workers
+        self.executor = None
+        self.pending = []  # (option, future)
+        self.results = {}
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def evaluate(self, game_state, options=None, seed=None):
+        """Start evaluating options from the current state, replacing older work
+
+        The choices are day-phase decisions, so nothing is started at night
+        or once the game is over. Returns True if runs were submitted.
+        """
+        if game_state.game_over or game_state.time_manager.is_night():
+            return False
+        snapshot = game_state.snapshot()
+        options = options or DEFAULT_OPTIONS
+        rng = random.Random(seed)
+
+        with self.lock:
+            self._cancel()
+            if self.executor is None:
+                # Spawn, not fork: the game process already runs pygame, the
+                # mixer and worker threads, none of which rollouts need
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+            self.generation += 1
+            self.results = {option: {'runs': self.runs_per_option, 'completed': 0,
+                                     'survived': 0, 'endings': Counter()}
+                            for option in options}
+
+            # Interleave options so every estimate improves at the same pace
+            try:
+                for _ in range(self.runs_per_option):
+                    for option in options:
+                        run_seed = rng.getrandbits(32)
+                        future = self.executor.submit(run_lookahead, snapshot, option,
+                                                      run_seed, self.horizon_hours)
+                        self.pending.append((option, future))
+            except BrokenProcessPool as e:
+                # A worker died; drop the pool so the next evaluate() starts a new one
+                print(f"Advisor worker pool failed: {e}")
+                self._cancel()
+                self.results = {}
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+                return False
+        return True
+
+    def poll(self):
+        """Collect finished runs (never blocks), returns current estimates"""
+        with self.lock:
+            still_pending = []
+            for option, future in self.pending:
+                if not future.done():
+                    still_pending.append((option, future))
+                    continue
+                if future.cancelled() or future.exception() is not None:
+                    self.results[option]['runs'] -= 1
+                    continue
+
+                ending = future.result()
+                result = self.results[option]
+                result['completed'] += 1
+                result['endings'][ending or 'ongoing'] += 1
+                if ending != 'failure':
+                    result['survived'] += 1
+            self.pending = still_pending
+        return self.get_results()
+
+    def get_results(self):
+        """Get survival probability and expected ending for each option
+
+        survival is the share of runs that did not fail within the horizon;
+        it includes runs still going when the horizon was reached, whose
+        share is given separately as ongoing.
+        """
+        summary = {}
+        with self.lock:
+            for option, result in self.results.items():
+                completed = result['completed']
+                endings = result['endings']
+                summary[option] = {
+                    'completed': completed,
+                    'runs': result['runs'],
+                    'survival': result['survived'] / completed if completed else None,
+                    'ongoing': endings['ongoing'] / completed if completed else None,
+                    'expected_ending': endings.most_common(1)[0][0] if completed else None
+                }
+        return summary
+
+    def is_busy(self):
+        """Check if simulations are still running"""
+        return bool(self.pending)
+
+    def cancel(self):
+        """Drop queued runs (ones already running finish and are ignored)"""
+        with self.lock:
+            self._cancel()
+
+    def _cancel(self):
+        """cancel() with the lock held"""
+        for _, future in self.pending:
+            future.cancel()
+        self.pending = []
+
+    def clear(self):
+        """Drop queued runs and forget the estimates (new game)"""
+        with self.lock:
+            self._cancel()
+            self.results = {}
+
+    def shutdown(self):
+        """Stop the worker pool without waiting for it"""
+        self.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
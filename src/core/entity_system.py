@@ -0,0 +1,175 @@
+"""
+Entity System
+Anomalous manifestations moving through the station's room graph
+"""
+
+import random
+from array import array
+from collections import deque
+from settings import (
+    STATION_ROOMS, ENTITY_SPAWN_ROOM, ENTITY_TARGET_ROOM, ENTITY_MAX,
+    ENTITY_DECISION_MINUTES, ENTITY_NIGHT_AGGRESSION, ENTITY_RETREAT_CHANCE, DIFFICULTIES
+)
+
+ROOM_NAMES = tuple(STATION_ROOMS)
+ROOM_INDEX = {name: index for index, name in enumerate(ROOM_NAMES)}
+
+
+def shortest_paths(rooms=STATION_ROOMS):
+    """All-pairs (distance, next hops) tables for an unweighted room graph
+
+    One breadth-first search per room; next_hops[a][b] holds every
+    neighbour of a that lies on a shortest path to b, so a move is a table
+    lookup plus a choice between equally short routes.
+    """
+    names = tuple(rooms)
+    index = {name: i for i, name in enumerate(names)}
+    count = len(names)
+    distance = [[None] * count for _ in range(count)]
+    next_hops = [[()] * count for _ in range(count)]
+    for target in range(count):
+        # Search backwards from the target: the room we came from is the hop
+        distance[target][target] = 0
+        next_hops[target][target] = (target,)
+        queue = deque([target])
+        while queue:
+            room = queue.popleft()
+            for neighbour_name in rooms[names[room]]:
+                neighbour = index[neighbour_name]
+                if distance[neighbour][target] is None:
+                    distance[neighbour][target] = distance[room][target] + 1
+                    queue.append(neighbour)
+                if distance[neighbour][target] == distance[room][target] + 1:
+                    next_hops[neighbour][target] += (room,)
+    return distance, next_hops
+
+
+DISTANCE, NEXT_HOPS = shortest_paths()
+SPAWN = ROOM_INDEX[ENTITY_SPAWN_ROOM]
+TARGET = ROOM_INDEX[ENTITY_TARGET_ROOM]
+# 1.0 at the station, 0.0 at the spawn point
+CLOSENESS = tuple(1.0 - DISTANCE[room][TARGET] / DISTANCE[SPAWN][TARGET]
+                  for room in range(len(ROOM_NAMES)))
+
+
+class Entity:
+    """A single manifestation"""
+
+    __slots__ = ('room', 'timer', 'active')
+
+    def __init__(self, room):
+        self.room = room
+        self.timer = None
+        self.active = True
+
+
+class EntitySystem:
+    """Entities advancing on the station, one decision per scheduled timer
+
+    Nothing runs per frame: each entity schedules its next decision on the
+    game clock, so cost is proportional to decisions made, not to entities
+    alive. Occupancy per room is kept up to date on every move.
+    """
+
+    def __init__(self, difficulty, time_manager, on_breach=None, seed=None):
+        """Initialize with no entities"""
+        self.time_manager = time_manager
+        self.base_aggression = DIFFICULTIES[difficulty]['anomaly_event_chance']
+        self.on_breach = on_breach
+        self.rng = random.Random(seed)
+        self.entities = []
+        self.occupancy = [0] * len(ROOM_NAMES)
+        self.breaches = 0
+
+    def aggression(self):
+        """Chance that a decision moves toward the station"""
+        aggression = self.base_aggression
+        if self.time_manager.is_night():
+            aggression *= ENTITY_NIGHT_AGGRESSION
+        return min(0.95, aggression)
+
+    def spawn(self, count=1, limit=ENTITY_MAX):
+        """Add entities at the spawn room (up to limit alive; None = no limit)"""
+        if limit is not None:
+            count = min(count, limit - len(self.entities))
+        for _ in range(count):
+            entity = Entity(SPAWN)
+            self.entities.append(entity)
+            self.occupancy[SPAWN] += 1
+            self._schedule(entity)
+
+    def stress(self, count):
+        """Spawn a large population regardless of the cap (scaling tests)"""
+        self.spawn(count, limit=None)
+
+    def _schedule(self, entity, ticks=None):
+        """Schedule the entity's next decision (after `ticks` if given)"""
+        if ticks is not None:
+            entity.timer = self.time_manager.schedule_in_ticks(ticks, lambda: self._decide(entity))
+            return
+        # Aggressive entities decide more often
+        minutes = ENTITY_DECISION_MINUTES * self.rng.uniform(0.5, 1.5) / (1.0 + self.aggression())
+        entity.timer = self.time_manager.schedule_in(max(1, int(minutes)),
+                                                     lambda: self._decide(entity))
+
+    def _decide(self, entity):
+        """Advance, retreat or wait, then schedule the next decision"""
+        if not entity.active:
+            return
+        roll = self.rng.random()
+        aggression = self.aggression()
+        if roll < aggression:
+            self._move(entity, self.rng.choice(NEXT_HOPS[entity.room][TARGET]))
+        elif roll < aggression + (1.0 - aggression) * ENTITY_RETREAT_CHANCE:
+            self._move(entity, self.rng.choice(NEXT_HOPS[entity.room][SPAWN]))
+
+        if entity.room == TARGET:
+            self.breaches += 1
+            self._move(entity, SPAWN)  # Driven back out after reaching the station
+            if self.on_breach:
+                self.on_breach()
+        self._schedule(entity)
+
+    def _move(self, entity, room):
+        """Move an entity, keeping room occupancy current"""
+        self.occupancy[entity.room] -= 1
+        self.occupancy[room] += 1
+        entity.room = room
+
+    def clear(self):
+        """Remove every entity and cancel their timers"""
+        for entity in self.entities:
+            entity.active = False
+            if entity.timer is not None:
+                self.time_manager.cancel(entity.timer)
+        self.entities = []
+        self.occupancy = [0] * len(ROOM_NAMES)
+
+    def capture(self):
+        """Rooms (one byte each) and ticks until the next decision of the live entities"""
+        now = self.time_manager.ticks
+        delays = array('I', [max(1, entity.timer.expires - now)
+                             if entity.timer is not None and entity.timer.active else 1
+                             for entity in self.entities])
+        return bytes(entity.room for entity in self.entities), delays.tobytes()
+
+    def restore(self, rooms, delays, breaches):
+        """Replace every entity with ones at the captured rooms
+
+        Rewinding the clock drops pending one-shot timers, so each restored
+        entity re-arms its decision with the captured delay; no random
+        draws are made, so a replay matches the original run. The
+        population cap does not apply; the snapshot may have been taken
+        under stress().
+        """
+        self.clear()
+        for room, ticks in zip(rooms, array('I', delays)):
+            entity = Entity(room)
+            self.entities.append(entity)
+            self.occupancy[room] += 1
+            self._schedule(entity, ticks)
+        self.breaches = breaches
+
+    def get_occupancy(self):
+        """Entities per room name"""
+        return dict(zip(ROOM_NAMES, self.occupancy))
@@ -25,19 +25,22 @@ class EventGenerator:
         {'name': 'Anomaly Offer', 'type': 'critical', 'sanity': -30, 'resources': {}},
     ]
     
-    def __init__(self, difficulty='normal'):
+    def __init__(self, difficulty='normal', seed=None):
         """Initialize event generator"""
         self.difficulty = difficulty
         diff_config = DIFFICULTIES[difficulty]
         self.event_frequency = diff_config['event_frequency']
         self.anomaly_chance = diff_config['anomaly_event_chance']
         self.events_this_day = 0
+        # Own RNG so rendering code reseeding `random` cannot skew events,
+        # and so snapshots can capture and replay it
+        self.rng = random.Random(seed)
     
     def should_trigger_event(self):
         """Check if an event should trigger this hour"""
         # Events per day = frequency, so chance per hour
         chance_per_hour = self.event_frequency / 24.0
-        return random.random() < chance_per_hour
+        return self.rng.random() < chance_per_hour
     
     def generate_event(self, is_night=False):
         """Generate a random event"""
@@ -47,17 +50,17 @@ class EventGenerator:
         self.events_this_day += 1
         
         # Determine event type
-        roll = random.random()
+        roll = self.rng.random()
         if roll < 0.1:  # 10% critical
-            return random.choice(self.CRITICAL_EVENTS).copy()
+            return self.rng.choice(self.CRITICAL_EVENTS).copy()
         elif roll < (0.1 + self.anomaly_chance):
-            event = random.choice(self.ANOMALOUS_EVENTS).copy()
+            event = self.rng.choice(self.ANOMALOUS_EVENTS).copy()
             # Anomalous events only at night
             if not is_night:
                 return None
             return event
         else:  # Routine
-            return random.choice(self.ROUTINE_EVENTS).copy()
+            return self.rng.choice(self.ROUTINE_EVENTS).copy()
     
     def reset_day(self):
         """Reset event counter for new day"""
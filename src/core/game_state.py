@@ -3,12 +3,21 @@ Game State Manager
 Manages overall game state including resources, time, sanity, and difficulty
 """
 
+import random
 from datetime import datetime
+from types import MappingProxyType
 from src.core.resource_manager import ResourceManager
 from src.core.sanity_system import SanitySystem
-from src.core.time_manager import TimeManager
+from src.core.time_manager import TimeManager, GAME_SECONDS_PER_TICK
 from src.core.event_generator import EventGenerator
-from settings import TOTAL_DAYS, DIFFICULTIES
+from src.core.modifier_stack import ModifierStack
+from src.core.entity_system import EntitySystem
+from src.core.snapshot import GameSnapshot, SnapshotHistory
+from settings import (
+    TOTAL_DAYS, DIFFICULTIES, DAY_START, NIGHT_START, TICKS_PER_GAME_MINUTE,
+    SANITY_MODIFIERS, SPECIAL_RESOURCES, REPAIR_COSTS, REPAIR_EFFECTS,
+    REWIND_HISTORY_HOURS, STATIONS, MONITOR_BATTERY_DRAIN, LOG_READING_MINUTES
+)
 
 
 class GameState:
@@ -23,58 +32,147 @@ class GameState:
         
         # Initialize subsystems
         self.time_manager = TimeManager()
-        self.resource_manager = ResourceManager(difficulty)
-        self.sanity_system = SanitySystem(difficulty)
+        self.modifiers = ModifierStack(self.time_manager)
+        self.resource_manager = ResourceManager(difficulty, self.modifiers, self.time_manager)
+        self.sanity_system = SanitySystem(difficulty, self.modifiers)
         self.event_generator = EventGenerator(difficulty)
+        self.entities = EntitySystem(difficulty, self.time_manager, on_breach=self._on_entity_breach)
         
         # Game tracking
         self.events_triggered = []
         self.choices_made = []
         self.director_logs_found = []
         self.anomalies_observed = []
+        self.published = {}  # Immutable copies of the histories for get_status()
+        self.history = None  # SnapshotHistory once enable_history() is called
+        self.focus = STATIONS[0]  # Station the player is looking at
+        self.event_listeners = []  # callback(event) after an event is applied
+
+        # Clock-driven callbacks
+        self.time_manager.schedule_daily(DAY_START, 0, self.complete_day)
+        self.time_manager.schedule_hourly(self._on_hour)
+        self.time_manager.schedule_daily(NIGHT_START, 0, self._on_nightfall)
         
     def update(self, delta_time):
         """Update game state each frame"""
         if self.game_over:
             return
         
-        # Update time
-        self.time_manager.update(delta_time)
+        # Update time (scheduled callbacks fire inside)
+        ticks = self.time_manager.update(delta_time)
+        self._simulate(ticks)
+    
+    def advance_minutes(self, minutes):
+        """Advance the simulation by whole game minutes, independent of real time"""
+        if self.game_over:
+            return
+        ticks = int(minutes * TICKS_PER_GAME_MINUTE)
+        self.time_manager.advance_ticks(ticks)
+        self._simulate(ticks)
+    
+    def _simulate(self, ticks):
+        """Apply continuous effects for ticks that just elapsed on the clock"""
+        if self.game_over or ticks <= 0:
+            return
         
-        # Update resources based on current time period
-        self.resource_manager.update(self.time_manager.is_night(), delta_time)
+        # Update resources based on current time period (rates are per game hour)
+        game_seconds = ticks * GAME_SECONDS_PER_TICK
+        self.resource_manager.update(self.time_manager.is_night(), game_seconds)
         
-        # Update sanity based on environment
-        sanity_delta = 0
-        if self.time_manager.is_night():
-            sanity_delta -= 0.5  # Isolation penalty
-        if not self.resource_manager.has_light():
-            sanity_delta -= 1.0  # Darkness penalty
+        # Darkness applies for as long as there is no light
+        in_darkness = not self.resource_manager.has_light()
+        if in_darkness != self.modifiers.has_source('darkness'):
+            if in_darkness:
+                self.modifiers.add('darkness', 'sanity_drift', additive=SANITY_MODIFIERS['darkness'])
+            else:
+                self.modifiers.remove_source('darkness')
         
-        self.sanity_system.update(sanity_delta)
+        # Integrate sanity drift over elapsed game time
+        self.sanity_system.update(game_seconds)
         
         # Check for critical conditions
         if self.resource_manager.is_critical('fuel'):
             self.game_over = True
             self.ending_type = 'failure'
         
-        if self.sanity_system.is_fractured():
+        if self.sanity_system.is_broken():
             self.game_over = True
             self.ending_type = 'failure'
-        
-        # Check day completion
-        if self.time_manager.day_complete():
-            self.complete_day()
     
     def complete_day(self):
-        """Handle end of day logic"""
+        """Handle end of day logic (fires at DAY_START each morning)"""
         self.current_day += 1
+        self.time_manager.reset_day()
+        self.event_generator.reset_day()
         
         if self.current_day > TOTAL_DAYS:
             self.game_over = True
             self.ending_type = 'survival'  # Placeholder
+    
+    def _on_hour(self):
+        """Roll for a random event at the top of every game hour"""
+        if self.game_over:
+            return
+        event = self.event_generator.generate_event(self.time_manager.is_night())
+        if event:
+            self.trigger_event(event)
+    
+    def _on_nightfall(self):
+        """Apply isolation drift for the duration of the night"""
+        night_minutes = ((DAY_START - NIGHT_START) % 24) * 60
+        self.modifiers.add('isolation', 'sanity_drift',
+                           additive=SANITY_MODIFIERS['isolation'], duration=night_minutes)
+    
+    def use_sedative(self):
+        """Take a sedative: immediate sanity effect, extra fuel use for a while"""
+        if not self.resource_manager.use_special('sedatives'):
+            return False
+        config = SPECIAL_RESOURCES['sedatives']
+        self.sanity_system.modify(config['sanity_effect'])
+        self.modifiers.add('sedative', 'fuel', multiplier=config['fuel_mult'],
+                           duration=config['duration'])
+        return True
+    
+    def use_isotope(self):
+        """Calibrate anomaly sensors with an isotope"""
+        if not self.resource_manager.use_special('isotopes'):
+            return False
+        config = SPECIAL_RESOURCES['isotopes']
+        self.modifiers.add('isotope', 'sensor_accuracy', additive=config['sensor_bonus'],
+                           duration=config['duration'])
+        return True
+    
+    def set_focus(self, station):
+        """Switch the station the player is attending (monitors drain batteries)"""
+        if station not in STATIONS or station == self.focus:
+            return
+        self.focus = station
+        if station == 'monitors':
+            self.modifiers.add('monitors', 'batteries', additive=MONITOR_BATTERY_DRAIN)
         else:
-            self.time_manager.reset_day()
+            self.modifiers.remove_source('monitors')
+    
+    def read_logs(self):
+        """Spend a while reading logs and the journal"""
+        self.modifiers.remove_source('reading_logs')
+        self.modifiers.add('reading_logs', 'sanity_drift',
+                           additive=SANITY_MODIFIERS['reading_logs'],
+                           duration=LOG_READING_MINUTES)
+    
+    def repair(self, equipment):
+        """Spend parts to repair equipment, returns False if unaffordable"""
+        cost = REPAIR_COSTS[self.difficulty].get(equipment)
+        if cost is None or self.resource_manager.get('parts') < cost:
+            return False
+        self.resource_manager.modify('parts', -cost)
+        
+        effect = REPAIR_EFFECTS[equipment]
+        self.modifiers.remove_source(f'repair_{equipment}')
+        self.modifiers.add(f'repair_{equipment}', effect['target'],
+                           multiplier=effect.get('multiplier', 1.0),
+                           additive=effect.get('additive', 0.0),
+                           duration=effect['duration'])
+        return True
     
     def trigger_event(self, event):
         """Record triggered event"""
@@ -90,6 +188,42 @@ class GameState:
         if 'resources' in event:
             for resource, amount in event['resources'].items():
                 self.resource_manager.modify(resource, amount)
+        if event.get('type', 'routine') != 'routine':
+            self._record_anomaly(event)
+            self.entities.spawn()
+        
+        for callback in self.event_listeners:
+            callback(event)
+    
+    def _record_anomaly(self, event):
+        """Plot a non-routine event on the anomaly map
+        
+        The location is seeded from the event itself rather than drawn from
+        the event RNG, so recording it does not change which events follow.
+        """
+        time_string = self.time_manager.get_time_string()
+        rng = random.Random(f"{self.current_day}-{time_string}-{event['name']}-{len(self.anomalies_observed)}")
+        self.anomalies_observed.append({
+            'day': self.current_day,
+            'time': time_string,
+            'name': event['name'],
+            'type': event.get('type', 'anomalous'),
+            'x': rng.random(),  # Map position, 0..1 across the zone
+            'y': rng.random(),
+        })
+    
+    def _on_entity_breach(self):
+        """A manifestation reached the station"""
+        if not self.game_over:
+            self.sanity_system.apply_event('moderate')
+    
+    def add_event_listener(self, callback):
+        """Register callback(event), called whenever an event triggers
+        
+        Runs on whichever thread advances the simulation, so callbacks must
+        only hand work off (e.g. queue a sound), never block.
+        """
+        self.event_listeners.append(callback)
     
     def get_status(self):
         """Get current game status"""
@@ -98,12 +232,74 @@ class GameState:
             'time': self.time_manager.get_time_string(),
             'is_night': self.time_manager.is_night(),
             'resources': self.resource_manager.get_all(),
+            'fuel_critical_in': self.resource_manager.time_to_critical('fuel'),
+            'special_resources': self.resource_manager.get_all_special(),
+            'modifiers': self.modifiers.get_active(),
             'sanity': self.sanity_system.get_level(),
             'sanity_state': self.sanity_system.get_state(),
+            'event_count': len(self.events_triggered),
+            'last_event': self.events_triggered[-1]['event']['name'] if self.events_triggered else None,
+            'room_occupancy': self.entities.get_occupancy(),
+            'event_log': self._published('event_log', self.events_triggered, self._freeze_event),
+            'anomalies': self._published('anomalies', self.anomalies_observed, MappingProxyType),
             'game_over': self.game_over,
             'ending': self.ending_type
         }
     
+    def _published(self, name, history, freeze):
+        """Tuple of frozen copies of an append-only history
+        
+        Extended only by the entries added since the last call, so the status
+        can be handed to another thread without copying whole lists.
+        """
+        published = self.published.get(name, ())
+        if len(published) > len(history):
+            published = published[:len(history)]
+        if len(published) < len(history):
+            published += tuple(freeze(dict(entry)) for entry in history[len(published):])
+            self.published[name] = published
+        return published
+    
+    @staticmethod
+    def _freeze_event(record):
+        """Journal entry for a triggered event"""
+        return MappingProxyType({'day': record['day'], 'time': record['time'],
+                                 'name': record['event']['name']})
+    
+    def snapshot(self):
+        """Capture the simulation state as a compact GameSnapshot"""
+        return GameSnapshot.capture(self)
+    
+    def restore(self, snapshot):
+        """Restore state captured by snapshot() (same difficulty)"""
+        snapshot.apply(self)
+        self.published = {}  # Histories were truncated; republish from scratch
+    
+    def consult(self, advisor):
+        """Have a LookaheadAdvisor evaluate the day's choices from this state
+        
+        Sent as a command like the player's actions, so a threaded game is
+        snapshotted between simulation steps.
+        """
+        advisor.evaluate(self)
+    
+    def enable_history(self, hours=REWIND_HISTORY_HOURS):
+        """Record one snapshot per game minute for rewinding"""
+        if self.history is None:
+            self.history = SnapshotHistory(hours)
+            self.time_manager.schedule_every(1, self._record_history)
+    
+    def _record_history(self):
+        """Push the current state into the rewind history"""
+        self.history.record(GameSnapshot.capture(self))
+    
+    def rewind(self, minutes):
+        """Go back `minutes` game minutes, returns False if history is too short"""
+        if self.history is None:
+            return False
+        self.published = {}
+        return self.history.rewind(self, minutes)
+    
     def save_game(self, filename):
         """Save game state to file"""
         # Implemented in save_system.py
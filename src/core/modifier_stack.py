@@ -0,0 +1,139 @@
+"""
+Modifier Stack
+Timed multiplicative/additive modifiers with cached effective values
+"""
+
+
+class Modifier:
+    """A single active modifier"""
+
+    __slots__ = ('source', 'target', 'multiplier', 'additive', 'expires_tick', 'timer')
+
+    def __init__(self, source, target, multiplier=1.0, additive=0.0):
+        self.source = source
+        self.target = target
+        self.multiplier = multiplier
+        self.additive = additive
+        self.expires_tick = None
+        self.timer = None
+
+
+class ModifierStack:
+    """Stack of temporary effects applied to resource rates and sanity drift
+
+    Effective totals per target are rebuilt only when a modifier is added,
+    removed or expires, so per-frame lookups are plain dict reads.
+    Expiry is scheduled on the TimeManager clock.
+    """
+
+    def __init__(self, time_manager=None):
+        """Initialize empty stack"""
+        self.time_manager = time_manager
+        self.modifiers = []
+        self.totals = {}  # target -> (multiplier, additive)
+        self.listeners = []
+
+    def add(self, source, target, multiplier=1.0, additive=0.0, duration=None):
+        """Add a modifier, optionally expiring after duration game minutes"""
+        modifier = Modifier(source, target, multiplier, additive)
+        if duration is not None and self.time_manager:
+            modifier.timer = self.time_manager.schedule_in(
+                duration, lambda: self._expire(modifier))
+            modifier.expires_tick = modifier.timer.expires
+        self.modifiers.append(modifier)
+        self._rebuild()
+        return modifier
+
+    def remove(self, modifier):
+        """Remove a modifier before it expires"""
+        if modifier not in self.modifiers:
+            return
+        if modifier.timer and self.time_manager:
+            self.time_manager.cancel(modifier.timer)
+        self.modifiers.remove(modifier)
+        self._rebuild()
+
+    def remove_source(self, source):
+        """Remove all modifiers from a source"""
+        for modifier in [m for m in self.modifiers if m.source == source]:
+            self.remove(modifier)
+
+    def has_source(self, source):
+        """Check if any modifier from a source is active"""
+        return any(m.source == source for m in self.modifiers)
+
+    def add_listener(self, callback):
+        """Call callback() whenever the effective totals change"""
+        self.listeners.append(callback)
+
+    def get_multiplier(self, target):
+        """Get combined multiplier for a target"""
+        return self.totals.get(target, (1.0, 0.0))[0]
+
+    def get_additive(self, target):
+        """Get combined additive bonus for a target"""
+        return self.totals.get(target, (1.0, 0.0))[1]
+
+    def apply(self, target, base):
+        """Apply all modifiers for a target to a base value"""
+        multiplier, additive = self.totals.get(target, (1.0, 0.0))
+        return base * multiplier + additive
+
+    def get_active(self):
+        """Get active modifiers for display"""
+        active = []
+        for modifier in self.modifiers:
+            remaining = None
+            if modifier.expires_tick is not None:
+                ticks_left = modifier.expires_tick - self.time_manager.ticks
+                remaining = ticks_left / self.time_manager.ticks_per_minute
+            active.append({
+                'source': modifier.source,
+                'target': modifier.target,
+                'multiplier': modifier.multiplier,
+                'additive': modifier.additive,
+                'remaining_minutes': remaining
+            })
+        return active
+
+    def capture(self):
+        """Get active modifiers as plain tuples (remaining ticks or None)"""
+        now = self.time_manager.ticks if self.time_manager else 0
+        return [(m.source, m.target, m.multiplier, m.additive,
+                 None if m.expires_tick is None else m.expires_tick - now)
+                for m in self.modifiers]
+
+    def restore(self, entries):
+        """Replace all modifiers with ones produced by capture()"""
+        for modifier in self.modifiers:
+            if modifier.timer and self.time_manager:
+                self.time_manager.cancel(modifier.timer)
+        self.modifiers = []
+
+        for source, target, multiplier, additive, remaining in entries:
+            modifier = Modifier(source, target, multiplier, additive)
+            if remaining is not None and self.time_manager:
+                modifier.timer = self.time_manager.timers.schedule(
+                    remaining, lambda modifier=modifier: self._expire(modifier))
+                modifier.expires_tick = modifier.timer.expires
+            self.modifiers.append(modifier)
+        self._rebuild()
+
+    def _expire(self, modifier):
+        """Drop a modifier whose timer fired"""
+        if modifier in self.modifiers:
+            modifier.timer = None
+            self.modifiers.remove(modifier)
+            self._rebuild()
+
+    def _rebuild(self):
+        """Recompute effective totals and notify listeners"""
+        totals = {}
+        for modifier in self.modifiers:
+            multiplier, additive = totals.get(modifier.target, (1.0, 0.0))
+            totals[modifier.target] = (multiplier * modifier.multiplier,
+                                       additive + modifier.additive)
+        self.totals = totals
+
+        for callback in self.listeners:
+            callback()
@@ -0,0 +1,296 @@
+"""
+Playtest Environment
+Gymnasium-style reset/step wrapper around GameState for scripted and learned
+agents, plus a vectorized form (in-process or subprocess workers sharing
+observation arrays). Runs without pygame.
+"""
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.core.game_state import GameState
+from src.core.snapshot import RESOURCE_NAMES, SPECIAL_NAMES
+from src.core.sanity_system import STATE_NAMES
+from settings import (
+    RESOURCES, SPECIAL_RESOURCES, STATIONS, REPAIR_COSTS, TOTAL_DAYS,
+    ENV_STEP_MINUTES, ENV_MAX_STEPS
+)
+
+# Discrete action set
+ACTIONS = (
+    ['wait']
+    + [f'repair_{name}' for name in REPAIR_COSTS['normal']]
+    + ['sedative', 'read_logs']
+    + [f'focus_{station}' for station in STATIONS]
+)
+
+# Observation layout (float32):
+# resources (fraction of max), special resources (fraction of max), sanity,
+# sanity state, hour of day, is_night, day progress, focused station,
+# hours until fuel is critical (capped at a day)
+OBS_SIZE = len(RESOURCE_NAMES) + len(SPECIAL_NAMES) + 7
+
+_RESOURCE_MAX = [RESOURCES[name]['max'] for name in RESOURCE_NAMES]
+_SPECIAL_MAX = [SPECIAL_RESOURCES[name]['max'] for name in SPECIAL_NAMES]
+_STATE_SCALE = 1.0 / (len(STATE_NAMES) - 1)
+_STATION_SCALE = 1.0 / (len(STATIONS) - 1)
+
+# Rewards
+REWARD_STEP = 0.01
+REWARD_SURVIVAL = 10.0
+REWARD_FAILURE = -10.0
+
+
+class BreachEnv:
+    """Single headless game exposed as reset/step/observation"""
+
+    def __init__(self, difficulty='normal', step_minutes=ENV_STEP_MINUTES,
+                 max_steps=ENV_MAX_STEPS):
+        """Initialize environment"""
+        self.difficulty = difficulty
+        self.step_minutes = step_minutes
+        self.max_steps = max_steps
+        self.action_count = len(ACTIONS)
+        self.observation_size = OBS_SIZE
+
+        self.game_state = GameState(difficulty)
+        self.initial_snapshot = self.game_state.snapshot()
+        self.steps = 0
+        self.obs = np.zeros(OBS_SIZE, dtype=np.float32)
+
+    def reset(self, seed=None):
+        """Start a new game, returns (observation, info)"""
+        # Restoring the initial snapshot is much cheaper than building a GameState
+        self.game_state.restore(self.initial_snapshot)
+        # Both RNGs, so entity moves are as reproducible as events
+        self.game_state.event_generator.rng.seed(seed)
+        self.game_state.entities.rng.seed(seed)
+        self.steps = 0
+        self.write_observation(self.obs)
+        return self.obs, {}
+
+    def step(self, action):
+        """Apply an action and advance the game
+
+        Returns (observation, reward, terminated, truncated, info).
+        """
+        game_state = self.game_state
+        applied = self.apply_action(ACTIONS[action])
+        game_state.advance_minutes(self.step_minutes)
+        self.steps += 1
+
+        terminated = game_state.game_over
+        truncated = not terminated and self.steps >= self.max_steps
+        if terminated:
+            reward = REWARD_FAILURE if game_state.ending_type == 'failure' else REWARD_SURVIVAL
+        else:
+            reward = REWARD_STEP
+
+        self.write_observation(self.obs)
+        info = {'action_applied': applied, 'ending': game_state.ending_type}
+        return self.obs, reward, terminated, truncated, info
+
+    def apply_action(self, name):
+        """Apply a named action, returns False if it was not possible"""
+        game_state = self.game_state
+        if name == 'wait':
+            return True
+        if name == 'sedative':
+            return game_state.use_sedative()
+        if name == 'read_logs':
+            game_state.read_logs()
+            return True
+        if name.startswith('repair_'):
+            return game_state.repair(name[len('repair_'):])
+        if name.startswith('focus_'):
+            game_state.set_focus(name[len('focus_'):])
+            return True
+        return False
+
+    def write_observation(self, out):
+        """Write the current observation into a float32 array row"""
+        game_state = self.game_state
+        rm = game_state.resource_manager
+        tm = game_state.time_manager
+        ss = game_state.sanity_system
+
+        resources = rm.resources
+        special = rm.special_resources
+        values = [resources[name] / max_val for name, max_val in zip(RESOURCE_NAMES, _RESOURCE_MAX)]
+        values += [special[name] / max_val for name, max_val in zip(SPECIAL_NAMES, _SPECIAL_MAX)]
+
+        hours_left = rm.time_to_critical('fuel')
+        values += [
+            ss.sanity / 100.0,
+            ss.state_index * _STATE_SCALE,
+            tm.current_hour / 24.0,
+            1.0 if tm.is_night() else 0.0,
+            game_state.current_day / TOTAL_DAYS,
+            STATIONS.index(game_state.focus) * _STATION_SCALE,
+            1.0 if hours_left is None else min(hours_left, 24.0) / 24.0
+        ]
+        # One slice assignment is much cheaper than per-element numpy writes
+        out[:] = values
+
+
+def _worker(pipe, start, count, difficulty, step_minutes, max_steps, shm_names, num_envs):
+    """Subprocess loop stepping a slice of environments over shared arrays"""
+    blocks = [shared_memory.SharedMemory(name=name) for name in shm_names]
+    arrays = _map_arrays(blocks, num_envs)
+    obs, rewards, terminated, truncated, actions, final_obs = arrays
+    envs = [BreachEnv(difficulty, step_minutes, max_steps) for _ in range(count)]
+    for offset, env in enumerate(envs):
+        env.obs = obs[start + offset]
+
+    try:
+        while True:
+            command, payload = pipe.recv()
+            if command == 'step':
+                for offset, env in enumerate(envs):
+                    _step_into(env, start + offset, arrays)
+            elif command == 'reset':
+                for offset, env in enumerate(envs):
+                    seed = None if payload is None else payload + start + offset
+                    env.reset(seed)
+            elif command == 'close':
+                break
+            pipe.send(True)
+    finally:
+        del obs, rewards, terminated, truncated, actions, final_obs, arrays
+        for block in blocks:
+            block.close()
+
+
+def _step_into(env, index, arrays):
+    """Step one environment whose obs is row `index` (auto-resets)
+
+    On auto-reset the terminal observation is kept in row `index` of the
+    final observation array before reset() overwrites it.
+    """
+    obs, rewards, terminated, truncated, actions, final_obs = arrays
+    _, reward, done, cut, _ = env.step(int(actions[index]))
+    rewards[index] = reward
+    terminated[index] = done
+    truncated[index] = cut
+    if done or cut:
+        final_obs[index] = obs[index]
+        env.reset()
+
+
+_ARRAY_SPECS = (
+    (np.float32, (OBS_SIZE,)),  # observations
+    (np.float32, ()),  # rewards
+    (np.bool_, ()),  # terminated
+    (np.bool_, ()),  # truncated
+    (np.int64, ()),  # actions
+    (np.float32, (OBS_SIZE,)),  # final observations of finished episodes
+)
+
+
+def _map_arrays(blocks, num_envs):
+    """View shared memory blocks as numpy arrays"""
+    return [np.ndarray((num_envs,) + shape, dtype=dtype, buffer=block.buf)
+            for block, (dtype, shape) in zip(blocks, _ARRAY_SPECS)]
+
+
+class VectorBreachEnv:
+    """Many environments stepped in lockstep
+
+    With workers=0 all environments step in this process. Otherwise they are
+    split across subprocesses that read actions from and write observations,
+    rewards and done flags to shared memory, so only a one-word command
+    crosses each pipe per step. Finished environments reset automatically.
+    """
+
+    def __init__(self, num_envs, difficulty='normal', workers=0,
+                 step_minutes=ENV_STEP_MINUTES, max_steps=ENV_MAX_STEPS):
+        """Initialize vectorized environment"""
+        self.num_envs = num_envs
+        self.workers = workers
+        self.blocks = []
+        self.pipes = []
+        self.processes = []
+
+        if workers:
+            for dtype, shape in _ARRAY_SPECS:
+                size = max(1, int(np.prod((num_envs,) + shape)) * np.dtype(dtype).itemsize)
+                self.blocks.append(shared_memory.SharedMemory(create=True, size=size))
+            self.arrays = _map_arrays(self.blocks, num_envs)
+            self.envs = []
+
+            per_worker = -(-num_envs // workers)
+            names = [block.name for block in self.blocks]
+            for start in range(0, num_envs, per_worker):
+                count = min(per_worker, num_envs - start)
+                parent, child = mp.Pipe()
+                process = mp.Process(target=_worker, daemon=True, args=(
+                    child, start, count, difficulty, step_minutes, max_steps, names, num_envs))
+                process.start()
+                self.pipes.append(parent)
+                self.processes.append(process)
+        else:
+            self.arrays = [np.zeros((num_envs,) + shape, dtype=dtype)
+                           for dtype, shape in _ARRAY_SPECS]
+            self.envs = [BreachEnv(difficulty, step_minutes, max_steps)
+                         for _ in range(num_envs)]
+            # Each env writes its observation straight into its row
+            for index, env in enumerate(self.envs):
+                env.obs = self.arrays[0][index]
+
+        (self.obs, self.rewards, self.terminated, self.truncated, self.actions,
+         self.final_obs) = self.arrays
+
+    def reset(self, seed=None):
+        """Reset all environments, returns (observations, info)"""
+        if self.workers:
+            self._broadcast('reset', seed)
+        else:
+            for index, env in enumerate(self.envs):
+                env.reset(None if seed is None else seed + index)
+        return self.obs, {}
+
+    def step(self, actions):
+        """Step every environment with its action
+
+        Returns (observations, rewards, terminated, truncated, info). The
+        arrays are reused between calls; copy them to keep a history.
+        Finished environments have already been reset, so their row of
+        observations is the next episode's first; as in Gymnasium's vector
+        envs, info['final_obs'] holds the terminal observation for rows
+        where info['_final_obs'] is set.
+        """
+        self.actions[:] = actions
+        if self.workers:
+            self._broadcast('step')
+        else:
+            for index, env in enumerate(self.envs):
+                _step_into(env, index, self.arrays)
+        info = {'final_obs': self.final_obs,
+                '_final_obs': self.terminated | self.truncated}
+        return self.obs, self.rewards, self.terminated, self.truncated, info
+
+    def _broadcast(self, command, payload=None):
+        """Send a command to every worker and wait for all to finish"""
+        for pipe in self.pipes:
+            pipe.send((command, payload))
+        for pipe in self.pipes:
+            pipe.recv()
+
+    def close(self):
+        """Stop workers and free shared memory"""
+        for pipe in self.pipes:
+            pipe.send(('close', None))
+        for process in self.processes:
+            process.join(timeout=1)
+        self.pipes = []
+        self.processes = []
+
+        self.obs = self.rewards = self.terminated = self.truncated = self.actions = None
+        self.final_obs = None
+        self.arrays = []
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
@@ -3,13 +3,79 @@ Resource Manager
 Manages game resources (fuel, food, water, parts, batteries)
 """
 
-from settings import RESOURCES, DIFFICULTIES
+from bisect import bisect_right
+from settings import RESOURCES, SPECIAL_RESOURCES, DIFFICULTIES, DAY_START, NIGHT_START, TOTAL_DAYS
+
+FORECAST_HORIZON_HOURS = TOTAL_DAYS * 24
+
+
+class ResourceTrajectory:
+    """Projected resource levels as linear segments between phase changes
+    
+    Each segment is (start_tick, end_tick, levels_at_start, rates). With rates
+    held constant inside a phase this is the exact answer to "what happens
+    if nothing changes", with no per-tick simulation. Segments are generated
+    lazily, so a query near the present only pays for the first few.
+    """
+    
+    def __init__(self, resource_manager):
+        """Anchor a trajectory at the manager's current state"""
+        tm = resource_manager.time_manager
+        self.resource_manager = resource_manager
+        self.ticks_per_hour = tm.ticks_per_minute * 60
+        self.day_length = (NIGHT_START - DAY_START) * self.ticks_per_hour
+        self.night_length = 24 * self.ticks_per_hour - self.day_length
+        self.end_tick = tm.ticks + FORECAST_HORIZON_HOURS * self.ticks_per_hour
+        
+        self.starts = []
+        self.segments = []
+        self._next_tick = tm.ticks
+        self._next_levels = dict(resource_manager.resources)
+        self._next_is_night = tm.is_night()
+        self._next_length = tm.ticks_until_phase_change()
+    
+    def _extend(self):
+        """Append one more segment, returns False at the horizon"""
+        if self._next_tick >= self.end_tick:
+            return False
+        
+        rm = self.resource_manager
+        tick, levels, length = self._next_tick, self._next_levels, self._next_length
+        rates = rm.effective_rates['night' if self._next_is_night else 'day']
+        self.starts.append(tick)
+        self.segments.append((tick, tick + length, levels, rates))
+        
+        hours = length / self.ticks_per_hour
+        next_levels = dict(levels)
+        for resource_name, rate in rates.items():
+            max_val = rm.consumption_rates[resource_name]['max']
+            next_levels[resource_name] = max(0, min(max_val, levels[resource_name] + rate * hours))
+        
+        self._next_tick = tick + length
+        self._next_levels = next_levels
+        self._next_is_night = not self._next_is_night
+        self._next_length = self.night_length if self._next_is_night else self.day_length
+        return True
+    
+    def iter_segments(self):
+        """Iterate segments from the anchor, generating them on demand"""
+        index = 0
+        while index < len(self.segments) or self._extend():
+            yield self.segments[index]
+            index += 1
+    
+    def segment_at(self, tick):
+        """Get the segment containing an absolute tick (the last one past the horizon)"""
+        while self._next_tick <= tick and self._extend():
+            pass
+        index = max(0, bisect_right(self.starts, tick) - 1)
+        return self.segments[index]
 
 
 class ResourceManager:
     """Manages all game resources"""
     
-    def __init__(self, difficulty='normal'):
+    def __init__(self, difficulty='normal', modifiers=None, time_manager=None):
         """Initialize resource manager"""
         self.difficulty = difficulty
         self.difficulty_mult = DIFFICULTIES[difficulty]['resource_multiplier']
@@ -19,23 +85,61 @@ class ResourceManager:
         for resource, config in RESOURCES.items():
             self.resources[resource] = config['max']
         
+        # Special resources are discrete counts
+        self.special_resources = {}
+        for resource, config in SPECIAL_RESOURCES.items():
+            self.special_resources[resource] = config.get('start', 0)
+        
         # Track consumption rates
         self.consumption_rates = RESOURCES.copy()
+        
+        # Effective hourly rates per period, rebuilt when modifiers change
+        self.modifiers = modifiers
+        self.effective_rates = {}
+        self._rebuild_rates()
+        if modifiers is not None:
+            modifiers.add_listener(self._rebuild_rates)
+        
+        # Forecast cache: piecewise-linear trajectory anchored at a tick
+        self.time_manager = time_manager
+        self._trajectory = None
+        self._critical_ticks = {}
+        if time_manager is not None:
+            time_manager.add_phase_listener(lambda is_night: self._invalidate_forecast())
+    
+    def _rebuild_rates(self):
+        """Recompute effective hourly rates from difficulty and modifiers"""
+        rates = {'day': {}, 'night': {}}
+        for resource_name, resource_data in self.consumption_rates.items():
+            multiplier = self.difficulty_mult
+            additive = 0.0
+            if self.modifiers is not None:
+                multiplier *= self.modifiers.get_multiplier(resource_name)
+                additive = self.modifiers.get_additive(resource_name)
+            for period in rates:
+                rate = resource_data[self.difficulty][period] * multiplier + additive
+                if rate:
+                    rates[period][resource_name] = rate
+        self.effective_rates = rates
+        self._invalidate_forecast()
+    
+    def get_rate(self, resource_name, is_night):
+        """Get effective hourly rate for a resource"""
+        period = 'night' if is_night else 'day'
+        return self.effective_rates[period].get(resource_name, 0.0)
     
     def update(self, is_night, delta_time):
         """Update resource consumption based on time of day"""
         period = 'night' if is_night else 'day'
+        # Rates are per game hour; delta_time is in game seconds
+        hours = delta_time / 3600.0
         
-        for resource_name, resource_data in self.consumption_rates.items():
+        for resource_name, rate in self.effective_rates[period].items():
             if resource_name in self.resources:
-                # Get consumption rate for difficulty
-                consumption = resource_data[self.difficulty][period]
-                # Apply hourly consumption (delta_time is in seconds, convert to hours)
-                hourly_consumption = (consumption / 3600.0) * delta_time * self.difficulty_mult
-                self.resources[resource_name] += hourly_consumption
+                self.resources[resource_name] += rate * hours
                 
                 # Clamp to valid range
-                max_val = resource_data['max']
+                max_val = self.consumption_rates[resource_name]['max']
                 self.resources[resource_name] = max(0, min(max_val, self.resources[resource_name]))
     
     def get(self, resource_name):
@@ -49,6 +153,7 @@ class ResourceManager:
             max_val = config.get('max', 999)
             self.resources[resource_name] += amount
             self.resources[resource_name] = max(0, min(max_val, self.resources[resource_name]))
+            self._invalidate_forecast()
     
     def set(self, resource_name, amount):
         """Set resource to exact amount"""
@@ -56,6 +161,105 @@ class ResourceManager:
             config = RESOURCES.get(resource_name, {})
             max_val = config.get('max', 999)
             self.resources[resource_name] = max(0, min(max_val, amount))
+            self._invalidate_forecast()
+    
+    def restore(self, resources, special_resources):
+        """Overwrite all resource levels (used by GameState.restore)"""
+        self.resources = dict(resources)
+        self.special_resources = dict(special_resources)
+        self._invalidate_forecast()
+    
+    # ========== FORECAST ==========
+    
+    def _invalidate_forecast(self):
+        """Drop cached projections"""
+        self._trajectory = None
+        self._critical_ticks = {}
+    
+    def _get_trajectory(self):
+        """Get the cached trajectory, starting a new one from the current state"""
+        if self._trajectory is None:
+            self._trajectory = ResourceTrajectory(self)
+        return self._trajectory
+    
+    def _level_at(self, resource_name, tick):
+        """Projected level of a resource at an absolute tick"""
+        start_tick, _, levels, rates = self._get_trajectory().segment_at(tick)
+        max_val = self.consumption_rates[resource_name]['max']
+        hours = (tick - start_tick) / self.time_manager.ticks_per_minute / 60
+        return max(0, min(max_val, levels[resource_name] + rates.get(resource_name, 0.0) * hours))
+    
+    def forecast(self, hours):
+        """Project all resource levels `hours` game hours ahead
+        
+        Assumes current rates and modifiers stay as they are.
+        """
+        if self.time_manager is None:
+            return self.get_all()
+        ticks_per_hour = self.time_manager.ticks_per_minute * 60
+        target = self.time_manager.ticks + int(hours * ticks_per_hour)
+        return {name: self._level_at(name, target) for name in self.resources}
+    
+    def time_to_critical(self, resource_name):
+        """Game hours until a resource reaches its critical level
+        
+        Returns 0 if already critical, or None if it does not get there
+        within the forecast horizon.
+        """
+        if resource_name not in self.resources or self.time_manager is None:
+            return None
+        if self.is_critical(resource_name):
+            return 0.0
+        
+        if resource_name not in self._critical_ticks:
+            self._critical_ticks[resource_name] = self._find_critical_tick(resource_name)
+        
+        critical_tick = self._critical_ticks[resource_name]
+        if critical_tick is None:
+            return None
+        ticks_per_hour = self.time_manager.ticks_per_minute * 60
+        return max(0.0, (critical_tick - self.time_manager.ticks) / ticks_per_hour)
+    
+    def _find_critical_tick(self, resource_name):
+        """Solve each linear segment for the critical level crossing"""
+        # Never drains in either phase: no crossing, no need to project
+        if all(rates.get(resource_name, 0.0) >= 0 for rates in self.effective_rates.values()):
+            return None
+        
+        trajectory = self._get_trajectory()
+        ticks_per_hour = trajectory.ticks_per_hour
+        critical_level = RESOURCES[resource_name].get('critical', 0)
+        
+        for start_tick, end_tick, levels, rates in trajectory.iter_segments():
+            rate = rates.get(resource_name, 0.0)
+            level = levels[resource_name]
+            if level <= critical_level:
+                return start_tick
+            if rate >= 0:
+                continue
+            hours = (level - critical_level) / -rate
+            crossing = start_tick + hours * ticks_per_hour
+            if crossing <= end_tick:
+                return crossing
+        return None
+    
+    def get_special(self, resource_name):
+        """Get count of a special resource (sedatives, isotopes, logs)"""
+        return self.special_resources.get(resource_name, 0)
+    
+    def modify_special(self, resource_name, amount):
+        """Add or remove special resource units"""
+        if resource_name in self.special_resources:
+            max_val = SPECIAL_RESOURCES[resource_name]['max']
+            self.special_resources[resource_name] = max(
+                0, min(max_val, self.special_resources[resource_name] + amount))
+    
+    def use_special(self, resource_name):
+        """Consume one unit of a special resource, returns False if none left"""
+        if self.get_special(resource_name) <= 0:
+            return False
+        self.special_resources[resource_name] -= 1
+        return True
     
     def is_critical(self, resource_name):
         """Check if resource is at critical level"""
@@ -78,6 +282,10 @@ class ResourceManager:
         """Get all resources as dict"""
         return self.resources.copy()
     
+    def get_all_special(self):
+        """Get all special resources as dict"""
+        return self.special_resources.copy()
+    
     def get_status(self):
         """Get status of all resources"""
         status = {}
@@ -3,51 +3,128 @@ Sanity System
 Manages player sanity and mental state with difficulty scaling
 """
 
-from settings import SANITY_RANGES, SANITY_MODIFIERS, FRACTURED_TIMEOUT, DIFFICULTIES
+from bisect import bisect_right
+from settings import (
+    SANITY_RANGES, SANITY_MODIFIERS, FRACTURED_TIMEOUT, SANITY_HYSTERESIS, DIFFICULTIES
+)
+
+# Threshold table: lower bound of each state, ascending
+_STATE_TABLE = sorted((min_val, name) for name, (min_val, _) in SANITY_RANGES.items())
+STATE_THRESHOLDS = [min_val for min_val, _ in _STATE_TABLE]
+STATE_NAMES = [name for _, name in _STATE_TABLE]
+
+VISUAL_EFFECTS = {
+    'stable': [],
+    'anxious': ['audio_glitch', 'screen_flicker'],
+    'panicked': ['visual_hallucination', 'false_alarm'],
+    'fractured': ['severe_distortion', 'color_inversion']
+}
 
 
 class SanitySystem:
-    """Manages player sanity state"""
+    """Manages player sanity state
+    
+    Sanity is integrated over game time and the state is looked up from a
+    precomputed threshold table. Listeners registered with
+    add_transition_listener() are called only when the state changes.
+    """
     
-    def __init__(self, difficulty='normal'):
+    def __init__(self, difficulty='normal', modifiers=None, hysteresis=SANITY_HYSTERESIS):
         """Initialize sanity system"""
         self.difficulty = difficulty
         self.sanity = DIFFICULTIES[difficulty]['starting_sanity']
         self.sanity_penalty_mult = DIFFICULTIES[difficulty]['sanity_penalty_mult']
-        self.fractured_timer = 0
-        self.state = self._get_state()
-    
-    def _get_state(self):
-        """Determine sanity state based on current level"""
-        for state_name, (min_val, max_val) in SANITY_RANGES.items():
-            if min_val <= self.sanity <= max_val:
-                return state_name
-        return 'fractured'
-    
-    def update(self, delta_change):
-        """Update sanity based on accumulated changes"""
-        self.sanity += delta_change * self.sanity_penalty_mult
-        self.sanity = max(0, min(100, self.sanity))
+        self.fractured_timer = 0.0  # Game seconds spent fractured
+        self.broken = False
+        self.hysteresis = hysteresis
+        self.transition_listeners = []
+        self.state_index = self._lookup(self.sanity)
+        self.state = STATE_NAMES[self.state_index]
         
-        # Update state
-        new_state = self._get_state()
+        # Ongoing drift per game minute (darkness, isolation...), cached
+        self.modifiers = modifiers
+        self.drift_rate = 0.0
+        if modifiers is not None:
+            modifiers.add_listener(self._rebuild_drift)
+    
+    def _rebuild_drift(self):
+        """Recompute drift per minute from active modifiers"""
+        self.drift_rate = self.modifiers.apply('sanity_drift', 0.0)
+    
+    def get_drift_rate(self):
+        """Get current sanity drift per game minute"""
+        return self.drift_rate
+    
+    def add_transition_listener(self, callback):
+        """Call callback(old_state, new_state) whenever the state changes"""
+        self.transition_listeners.append(callback)
+    
+    @staticmethod
+    def _lookup(sanity):
+        """Get index of the state containing a sanity level"""
+        return max(0, bisect_right(STATE_THRESHOLDS, sanity) - 1)
+    
+    def _refresh_state(self):
+        """Re-derive state from the threshold table, applying hysteresis"""
+        # Worse states are entered at the threshold; falling back requires
+        # dropping a further `hysteresis` points so the state does not flap
+        current = self.state_index
+        new_index = self._lookup(self.sanity)
+        if new_index < current:
+            new_index = min(current, self._lookup(self.sanity + self.hysteresis))
+        
+        if new_index == current:
+            return
+        
+        old_state = self.state
+        self.state_index = new_index
+        self.state = STATE_NAMES[new_index]
+        if self.state != 'fractured':
+            self.fractured_timer = 0.0
+        for callback in self.transition_listeners:
+            callback(old_state, self.state)
+    
+    def restore(self, sanity, fractured_timer, broken):
+        """Overwrite sanity state (used by GameState.restore)"""
+        self.sanity = sanity
+        self.fractured_timer = fractured_timer
+        self.broken = broken
+        
+        # Restored levels are exact, so skip hysteresis but still notify
+        new_index = self._lookup(sanity)
+        if new_index != self.state_index:
+            old_state = self.state
+            self.state_index = new_index
+            self.state = STATE_NAMES[new_index]
+            for callback in self.transition_listeners:
+                callback(old_state, self.state)
+    
+    def update(self, delta_time):
+        """Integrate sanity drift over delta_time game seconds
+        
+        Returns True once sanity has stayed fractured for FRACTURED_TIMEOUT.
+        """
+        if delta_time <= 0:
+            return self.broken
+        
+        if self.drift_rate:
+            self.sanity += self.drift_rate * (delta_time / 60.0) * self.sanity_penalty_mult
+            self.sanity = max(0, min(100, self.sanity))
+            self._refresh_state()
         
         # Check fractured timeout
-        if new_state == 'fractured':
-            self.fractured_timer += 1
+        if self.state == 'fractured':
+            self.fractured_timer += delta_time
             if self.fractured_timer >= FRACTURED_TIMEOUT:
-                return True  # Game over
-        else:
-            self.fractured_timer = 0
+                self.broken = True
         
-        self.state = new_state
-        return False
+        return self.broken
     
     def modify(self, amount):
         """Modify sanity by specific amount"""
         self.sanity += amount * self.sanity_penalty_mult
         self.sanity = max(0, min(100, self.sanity))
-        self.state = self._get_state()
+        self._refresh_state()
     
     def apply_event(self, event_severity):
         """Apply sanity penalty from events"""
@@ -88,12 +165,10 @@ class SanitySystem:
         """Check if sanity is stable"""
         return self.state == 'stable'
     
+    def is_broken(self):
+        """Check if sanity stayed fractured long enough to end the game"""
+        return self.broken
+    
     def get_visual_effects(self):
         """Get visual effects to apply based on sanity state"""
-        effects = {
-            'stable': [],
-            'anxious': ['audio_glitch', 'screen_flicker'],
-            'panicked': ['visual_hallucination', 'false_alarm'],
-            'fractured': ['severe_distortion', 'color_inversion']
-        }
-        return effects.get(self.state, [])
+        return VISUAL_EFFECTS.get(self.state, [])
@@ -0,0 +1,100 @@
+"""
+Simulation Thread
+Runs GameState at a fixed rate on its own thread and publishes immutable
+double-buffered state for the render thread
+"""
+
+import queue
+import threading
+import time
+from types import MappingProxyType
+from settings import SIMULATION_RATE
+
+
+class PublishedState:
+    """Read-only view of the game published after a simulation step
+
+    Has the same get_status() interface screens already use on GameState.
+    """
+
+    __slots__ = ('status', 'step')
+
+    def __init__(self, status, step):
+        self.status = status
+        self.step = step
+
+    def get_status(self):
+        """Get the frozen status dict"""
+        return self.status
+
+
+class SimulationThread(threading.Thread):
+    """Fixed-rate simulation loop decoupled from rendering
+
+    The render thread reads latest() without taking a lock: the simulation
+    fills the back buffer, then flips the front index with a single
+    assignment. Game commands (sedative, repairs...) arrive over a queue and
+    are applied between steps.
+    """
+
+    def __init__(self, game_state, rate=SIMULATION_RATE):
+        super().__init__(name='simulation', daemon=True)
+        self.game_state = game_state
+        self.step_time = 1.0 / rate
+        self.commands = queue.SimpleQueue()
+        self.running = False
+        self.steps = 0
+
+        # Double buffer of published states; readers only ever see `front`
+        self.buffers = [None, None]
+        self.front = 0
+        self._publish()
+
+    def submit(self, method_name, *args):
+        """Queue a GameState method call to run on the simulation thread"""
+        self.commands.put((method_name, args))
+
+    def latest(self):
+        """Get the most recently published state (never blocks)"""
+        return self.buffers[self.front]
+
+    def run(self):
+        """Step the simulation at a fixed rate until stopped"""
+        self.running = True
+        next_step = time.perf_counter()
+
+        while self.running:
+            self._drain_commands()
+            self.game_state.update(self.step_time)
+            self.steps += 1
+            self._publish()
+
+            next_step += self.step_time
+            delay = next_step - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -self.step_time * 5:
+                # Fell far behind (debugger, suspend) - don't try to catch up
+                next_step = time.perf_counter()
+
+    def stop(self):
+        """Stop the loop and wait for the thread to exit"""
+        self.running = False
+        if self.is_alive():
+            self.join(timeout=1.0)
+
+    def _drain_commands(self):
+        """Apply queued commands"""
+        while True:
+            try:
+                method_name, args = self.commands.get_nowait()
+            except queue.Empty:
+                return
+            getattr(self.game_state, method_name)(*args)
+
+    def _publish(self):
+        """Write a new state into the back buffer and flip"""
+        back = 1 - self.front
+        status = self.game_state.get_status()
+        self.buffers[back] = PublishedState(MappingProxyType(status), self.steps)
+        self.front = back
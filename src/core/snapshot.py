@@ -0,0 +1,201 @@
+"""
+Game Snapshots
+Compact fixed-layout GameState snapshots and a bounded rewind history
+"""
+
+import struct
+from array import array
+from settings import RESOURCES, SPECIAL_RESOURCES, DIFFICULTIES, STATIONS
+
+RESOURCE_NAMES = tuple(RESOURCES)
+SPECIAL_NAMES = tuple(SPECIAL_RESOURCES)
+DIFFICULTY_NAMES = tuple(DIFFICULTIES)
+ENDING_TYPES = (None, 'survival', 'compromise', 'failure')
+
+# ticks, tick_remainder, day, difficulty, game_over, ending, focus,
+# resources..., special resources..., sanity, fractured_timer, broken,
+# events_this_day, lengths of the four append-only history lists, entity
+# breaches
+_LAYOUT = struct.Struct(
+    '<qdHBBBB'
+    + 'd' * len(RESOURCE_NAMES)
+    + 'H' * len(SPECIAL_NAMES)
+    + 'ddBH'
+    + 'IIII'
+    + 'I'
+)
+_TICKS = struct.Struct('<q')
+_DIFFICULTY_OFFSET = struct.calcsize('<qdH')
+_RNG_VERSION = 3  # random.Random.getstate() format
+
+
+def pack_rng_state(rng):
+    """Mersenne Twister state as packed 32-bit words plus gauss_next
+
+    2.5 KB of bytes instead of a tuple of 625 int objects (~20 KB).
+    """
+    _, internal, gauss_next = rng.getstate()
+    return array('I', internal).tobytes(), gauss_next
+
+
+def unpack_rng_state(rng, packed):
+    """Restore state produced by pack_rng_state()"""
+    words, gauss_next = packed
+    rng.setstate((_RNG_VERSION, tuple(array('I', words)), gauss_next))
+
+
+class GameSnapshot:
+    """Immutable point-in-time copy of a GameState
+
+    Scalar state is packed into one struct; active modifiers are kept as a
+    tuple of tuples, the event and entity RNGs packed by pack_rng_state()
+    and entities as one room index byte plus one 32-bit decision delay
+    each. Event history lists are append-only, so only
+    their lengths are stored and restoring truncates them.
+    """
+
+    __slots__ = ('data', 'modifiers', 'rng_state', 'entity_rooms', 'entity_delays',
+                 'entity_rng_state')
+
+    def __init__(self, data, modifiers, rng_state, entity_rooms, entity_delays,
+                 entity_rng_state):
+        self.data = data
+        self.modifiers = modifiers
+        self.rng_state = rng_state
+        self.entity_rooms = entity_rooms
+        self.entity_delays = entity_delays
+        self.entity_rng_state = entity_rng_state
+
+    @classmethod
+    def capture(cls, game_state):
+        """Capture a GameState"""
+        tm = game_state.time_manager
+        rm = game_state.resource_manager
+        ss = game_state.sanity_system
+        resources = rm.resources
+        special = rm.special_resources
+
+        data = _LAYOUT.pack(
+            tm.ticks, tm.tick_remainder, game_state.current_day,
+            DIFFICULTY_NAMES.index(game_state.difficulty),
+            game_state.game_over, ENDING_TYPES.index(game_state.ending_type),
+            STATIONS.index(game_state.focus),
+            *[resources[name] for name in RESOURCE_NAMES],
+            *[special[name] for name in SPECIAL_NAMES],
+            ss.sanity, ss.fractured_timer, ss.broken,
+            game_state.event_generator.events_this_day,
+            len(game_state.events_triggered), len(game_state.choices_made),
+            len(game_state.director_logs_found), len(game_state.anomalies_observed),
+            game_state.entities.breaches
+        )
+        # RNGs only advance when an event is rolled or an entity decides,
+        # so per-minute snapshots often share the previous one's state
+        rng_state = pack_rng_state(game_state.event_generator.rng)
+        entity_rng_state = pack_rng_state(game_state.entities.rng)
+        previous = game_state.history.latest() if game_state.history is not None else None
+        if previous is not None:
+            if previous.rng_state == rng_state:
+                rng_state = previous.rng_state
+            if previous.entity_rng_state == entity_rng_state:
+                entity_rng_state = previous.entity_rng_state
+        entity_rooms, entity_delays = game_state.entities.capture()
+        return cls(data, tuple(game_state.modifiers.capture()), rng_state,
+                   entity_rooms, entity_delays, entity_rng_state)
+
+    @property
+    def difficulty(self):
+        """Difficulty the snapshot was taken on"""
+        return DIFFICULTY_NAMES[self.data[_DIFFICULTY_OFFSET]]
+
+    @property
+    def ticks(self):
+        """Game tick the snapshot was taken at"""
+        return _TICKS.unpack_from(self.data)[0]
+
+    def apply(self, game_state):
+        """Restore this snapshot into a GameState of the same difficulty"""
+        values = _LAYOUT.unpack(self.data)
+        ticks, tick_remainder, day, _, game_over, ending, focus = values[:7]
+        index = 7
+        resources = dict(zip(RESOURCE_NAMES, values[index:index + len(RESOURCE_NAMES)]))
+        index += len(RESOURCE_NAMES)
+        special = dict(zip(SPECIAL_NAMES, values[index:index + len(SPECIAL_NAMES)]))
+        index += len(SPECIAL_NAMES)
+        sanity, fractured_timer, broken, events_this_day = values[index:index + 4]
+        lengths = values[index + 4:index + 8]
+        breaches = values[index + 8]
+
+        game_state.current_day = day
+        game_state.game_over = bool(game_over)
+        game_state.ending_type = ENDING_TYPES[ending]
+        game_state.focus = STATIONS[focus]
+        game_state.time_manager.set_ticks(ticks, tick_remainder)
+        game_state.resource_manager.restore(resources, special)
+        game_state.modifiers.restore(self.modifiers)
+        game_state.sanity_system.restore(sanity, fractured_timer, bool(broken))
+        game_state.event_generator.events_this_day = events_this_day
+        unpack_rng_state(game_state.event_generator.rng, self.rng_state)
+        # After set_ticks: the clock jump cancelled the old decision timers
+        unpack_rng_state(game_state.entities.rng, self.entity_rng_state)
+        game_state.entities.restore(self.entity_rooms, self.entity_delays, breaches)
+
+        histories = (game_state.events_triggered, game_state.choices_made,
+                     game_state.director_logs_found, game_state.anomalies_observed)
+        for history, length in zip(histories, lengths):
+            del history[length:]
+
+
+class SnapshotHistory:
+    """Fixed-size ring buffer of snapshots, one per game minute
+
+    Memory is bounded by capacity; recording overwrites the oldest slot, so
+    cost does not grow with how long the game has run.
+    """
+
+    def __init__(self, hours):
+        """Preallocate room for `hours` game hours of snapshots"""
+        self.capacity = int(hours * 60)
+        self.slots = [None] * self.capacity
+        self.head = 0  # Next slot to write
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def record(self, snapshot):
+        """Store a snapshot, evicting the oldest when full"""
+        self.slots[self.head] = snapshot
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def get(self, minutes_ago=0):
+        """Get the snapshot recorded `minutes_ago` minutes before the latest"""
+        if minutes_ago < 0 or minutes_ago >= self.size:
+            return None
+        return self.slots[(self.head - 1 - minutes_ago) % self.capacity]
+
+    def latest(self):
+        """Get the most recent snapshot"""
+        return self.get(0)
+
+    def rewind(self, game_state, minutes):
+        """Restore the state from `minutes` game minutes ago
+
+        Snapshots newer than the restored one are discarded. Returns False if
+        the history does not reach that far back.
+        """
+        snapshot = self.get(minutes)
+        if snapshot is None:
+            return False
+        snapshot.apply(game_state)
+        for _ in range(minutes):
+            self.head = (self.head - 1) % self.capacity
+            self.slots[self.head] = None
+        self.size -= minutes
+        return True
+
+    def clear(self):
+        """Drop all snapshots"""
+        self.slots = [None] * self.capacity
+        self.head = 0
+        self.size = 0
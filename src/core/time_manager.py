@@ -3,84 +3,180 @@ Time Manager
 Handles game time simulation including day/night cycles
 """
 
+from src.core.timer_wheel import TimerWheel
 from settings import (
-    DAY_START, NIGHT_START, SECONDS_PER_GAME_MINUTE, 
-    SECONDS_PER_GAME_HOUR, TOTAL_DAYS
+    DAY_START, NIGHT_START, SECONDS_PER_GAME_MINUTE,
+    TICKS_PER_GAME_MINUTE, TOTAL_DAYS
 )
 
+TICKS_PER_HOUR = TICKS_PER_GAME_MINUTE * 60
+TICKS_PER_DAY = TICKS_PER_HOUR * 24
+SECONDS_PER_TICK = SECONDS_PER_GAME_MINUTE / TICKS_PER_GAME_MINUTE
+GAME_SECONDS_PER_TICK = 60.0 / TICKS_PER_GAME_MINUTE
+
 
 class TimeManager:
-    """Manages game time and day/night cycles"""
-    
+    """Manages game time and day/night cycles
+
+    Time is kept as an integer tick count since 00:00 of day 1, so clock
+    boundaries are exact. Callbacks can be scheduled on the clock instead of
+    polling it every frame.
+    """
+
     def __init__(self):
         """Initialize time manager"""
-        self.current_hour = DAY_START  # Start at 8 AM
-        self.current_minute = 0
-        self.current_day = 1
-        self.elapsed_seconds = 0
-        
+        # Start at 8 AM on day 1
+        self.timers = TimerWheel(DAY_START * TICKS_PER_HOUR)
+        self.tick_remainder = 0.0  # Real seconds not yet converted to ticks
+        self.days_completed = 0
+        self.ticks_per_minute = TICKS_PER_GAME_MINUTE
+
+        self.phase_listeners = []
+
+        # Days run from DAY_START to DAY_START of the next morning
+        self.schedule_daily(DAY_START, 0, self._on_day_boundary)
+        self.schedule_daily(DAY_START, 0, self._on_phase_change)
+        self.schedule_daily(NIGHT_START, 0, self._on_phase_change)
+
+    @property
+    def ticks(self):
+        """Absolute game ticks since 00:00 of day 1"""
+        return self.timers.now
+
+    @property
+    def current_hour(self):
+        """Current hour (0-23)"""
+        return (self.ticks // TICKS_PER_HOUR) % 24
+
+    @property
+    def current_minute(self):
+        """Current minute (0-59)"""
+        return (self.ticks // TICKS_PER_GAME_MINUTE) % 60
+
+    @property
+    def current_day(self):
+        """Day number, rolling over at DAY_START"""
+        return (self.ticks - DAY_START * TICKS_PER_HOUR) // TICKS_PER_DAY + 1
+
     def update(self, delta_time):
-        """Update game time based on real time passed"""
-        self.elapsed_seconds += delta_time
-        
-        # Convert real seconds to game time
-        game_minutes = self.elapsed_seconds / SECONDS_PER_GAME_MINUTE
-        self.current_minute += game_minutes
-        self.elapsed_seconds = 0
-        
-        # Handle hour rollovers
-        if self.current_minute >= 60:
-            hours_added = int(self.current_minute / 60)
-            self.current_hour += hours_added
-            self.current_minute = self.current_minute % 60
-        
-        # Handle day rollovers (24-hour clock)
-        if self.current_hour >= 24:
-            self.current_hour = self.current_hour % 24
-            # Note: day increment is handled by GameState
-    
+        """Update game time based on real time passed
+
+        Returns the number of ticks the clock advanced.
+        """
+        self.tick_remainder += delta_time
+        ticks = int(self.tick_remainder / SECONDS_PER_TICK)
+        if ticks <= 0:
+            return 0
+
+        self.tick_remainder -= ticks * SECONDS_PER_TICK
+        self.timers.advance(ticks)
+        return ticks
+
+    def advance_ticks(self, ticks):
+        """Advance game time directly by a number of ticks"""
+        self.timers.advance(ticks)
+
+    def set_ticks(self, ticks, tick_remainder=0.0):
+        """Jump the clock to an absolute tick without firing callbacks (restore)"""
+        self.timers.rebase(ticks)
+        self.tick_remainder = tick_remainder
+        self.days_completed = 0
+
+    def _on_day_boundary(self):
+        """Record that a full day has passed"""
+        self.days_completed += 1
+
+    def _on_phase_change(self):
+        """Notify listeners that day turned to night or back"""
+        is_night = self.is_night()
+        for callback in self.phase_listeners:
+            callback(is_night)
+
+    def add_phase_listener(self, callback):
+        """Call callback(is_night) at every day/night transition"""
+        self.phase_listeners.append(callback)
+
+    # ========== SCHEDULING ==========
+
+    def schedule_in(self, minutes, callback):
+        """Run callback once after the given number of game minutes"""
+        return self.timers.schedule(minutes * TICKS_PER_GAME_MINUTE, callback)
+
+    def schedule_in_ticks(self, ticks, callback):
+        """Run callback once after the given number of ticks (restoring timers)"""
+        return self.timers.schedule(ticks, callback)
+
+    def schedule_every(self, minutes, callback, first_in=None):
+        """Run callback every N game minutes (first run after first_in minutes)"""
+        interval = int(minutes * TICKS_PER_GAME_MINUTE)
+        delay = interval if first_in is None else first_in * TICKS_PER_GAME_MINUTE
+        return self.timers.schedule(delay, callback, interval)
+
+    def schedule_at(self, hour, minute, callback):
+        """Run callback once at the next occurrence of HH:MM"""
+        return self.timers.schedule(self.ticks_until(hour, minute), callback)
+
+    def schedule_daily(self, hour, minute, callback):
+        """Run callback at HH:MM every day"""
+        return self.timers.schedule(self.ticks_until(hour, minute), callback, TICKS_PER_DAY)
+
+    def schedule_hourly(self, callback):
+        """Run callback at the top of every game hour"""
+        delay = TICKS_PER_HOUR - self.ticks % TICKS_PER_HOUR
+        return self.timers.schedule(delay, callback, TICKS_PER_HOUR)
+
+    def cancel(self, timer):
+        """Cancel a scheduled callback"""
+        self.timers.cancel(timer)
+
+    def ticks_until(self, hour, minute=0):
+        """Get ticks until the next occurrence of HH:MM (never zero)"""
+        target = (hour * 60 + minute) * TICKS_PER_GAME_MINUTE
+        delta = (target - self.ticks) % TICKS_PER_DAY
+        return delta or TICKS_PER_DAY
+
+    # ========== QUERIES ==========
+
     def is_night(self):
         """Check if current time is night (20:00 - 07:59)"""
         return self.current_hour >= NIGHT_START or self.current_hour < DAY_START
-    
+
     def is_day(self):
         """Check if current time is day (08:00 - 19:59)"""
         return not self.is_night()
-    
+
     def get_time_string(self):
         """Return formatted time string HH:MM"""
-        return f"{int(self.current_hour):02d}:{int(self.current_minute):02d}"
-    
+        return f"{self.current_hour:02d}:{self.current_minute:02d}"
+
+    def ticks_until_phase_change(self):
+        """Get ticks until the next day/night transition"""
+        if self.is_night():
+            return self.ticks_until(DAY_START)
+        return self.ticks_until(NIGHT_START)
+
     def day_complete(self):
-        """Check if the day has completed (passed midnight)"""
-        # This is checked when time wraps from 23:59 to 00:00
-        return self.current_hour < DAY_START and self.elapsed_seconds == 0
-    
+        """Check if a day has completed since the last reset_day()"""
+        return self.days_completed > 0
+
     def reset_day(self):
-        """Reset time to start of next day"""
-        self.current_hour = DAY_START
-        self.current_minute = 0
-        self.elapsed_seconds = 0
-    
+        """Acknowledge a completed day"""
+        self.days_completed = max(0, self.days_completed - 1)
+
     def get_day(self):
         """Get current day number"""
         return self.current_day
-    
+
     def get_hour(self):
         """Get current hour (0-23)"""
-        return int(self.current_hour)
-    
+        return self.current_hour
+
     def get_minute(self):
         """Get current minute (0-59)"""
-        return int(self.current_minute)
-    
+        return self.current_minute
+
     def get_progress_day_percent(self):
         """Get percentage of day completed (0-100)"""
         # From 8 AM to next 8 AM is 24 hours
-        total_minutes = 24 * 60
-        current_minutes = (self.current_hour - DAY_START) * 60 + self.current_minute
-        
-        if current_minutes < 0:
-            current_minutes += 24 * 60
-        
-        return (current_minutes / total_minutes) * 100
+        day_ticks = (self.ticks - DAY_START * TICKS_PER_HOUR) % TICKS_PER_DAY
+        return (day_ticks / TICKS_PER_DAY) * 100
@@ -0,0 +1,193 @@
+"""
+Timer Wheel
+Hierarchical timing wheel for scheduling callbacks on integer game ticks
+"""
+
+WHEEL_BITS = 6
+WHEEL_SIZE = 1 << WHEEL_BITS  # 64 slots per level
+WHEEL_MASK = WHEEL_SIZE - 1
+WHEEL_LEVELS = 4  # 64^4 ticks (~194 game days at 60 ticks/minute)
+
+
+class Timer:
+    """Handle for a scheduled callback"""
+
+    __slots__ = ('expires', 'interval', 'callback', 'level', 'slot', 'active')
+
+    def __init__(self, expires, callback, interval=None):
+        self.expires = expires
+        self.interval = interval
+        self.callback = callback
+        self.level = 0
+        self.slot = 0
+        self.active = True
+
+
+class TimerWheel:
+    """Hierarchical timer wheel with O(1) insert, cancel and expiry
+
+    Level 0 holds timers due within the next 64 ticks, one slot per tick.
+    Each higher level covers 64x the span of the one below and is cascaded
+    down whenever the level below wraps around.
+    """
+
+    def __init__(self, start_tick=0):
+        """Initialize empty wheel at the given tick"""
+        self.now = start_tick
+        # Each slot is an insertion-ordered dict used as a set of timers
+        self.wheels = [[{} for _ in range(WHEEL_SIZE)] for _ in range(WHEEL_LEVELS)]
+        self.level_counts = [0] * WHEEL_LEVELS
+        self.level0_mask = 0  # Bit per occupied level 0 slot
+        self.count = 0
+
+    def schedule(self, delay, callback, interval=None):
+        """Schedule callback to run after delay ticks (minimum 1)
+
+        If interval is given the timer re-arms itself every interval ticks
+        until cancelled.
+        """
+        timer = Timer(self.now + max(1, int(delay)), callback, interval)
+        self._insert(timer)
+        self.count += 1
+        return timer
+
+    def cancel(self, timer):
+        """Cancel a pending timer"""
+        if not timer.active:
+            return
+        timer.active = False
+        if timer.slot is not None:
+            slot = self.wheels[timer.level][timer.slot]
+            del slot[timer]
+            self.level_counts[timer.level] -= 1
+            if timer.level == 0 and not slot:
+                self.level0_mask &= ~(1 << timer.slot)
+        self.count -= 1
+
+    def advance(self, ticks):
+        """Advance the wheel by a number of ticks, firing expired timers
+
+        Returns the number of callbacks fired.
+        """
+        target = self.now + ticks
+        fired = 0
+
+        while self.now < target:
+            if self.count == 0:
+                self.now = target
+                break
+
+            # Jump straight to the next occupied level 0 slot in this block,
+            # or to the block boundary where higher levels cascade
+            later_slots = self.level0_mask >> ((self.now & WHEEL_MASK) + 1)
+            if later_slots:
+                next_tick = self.now + (later_slots & -later_slots).bit_length()
+            else:
+                next_tick = (self.now | WHEEL_MASK) + 1
+            if next_tick > target:
+                self.now = target
+                break
+
+            self.now = next_tick - 1
+            fired += self._tick()
+
+        return fired
+
+    def rebase(self, now):
+        """Move the wheel to an arbitrary tick without firing anything
+
+        Repeating timers keep their phase (expires modulo interval), so clock
+        aligned callbacks stay aligned. One-shot timers are cancelled; their
+        owners are expected to re-arm them.
+        """
+        pending = [timer for level in self.wheels for slot in level for timer in slot]
+        self.now = now
+        self.wheels = [[{} for _ in range(WHEEL_SIZE)] for _ in range(WHEEL_LEVELS)]
+        self.level_counts = [0] * WHEEL_LEVELS
+        self.level0_mask = 0
+        self.count = 0
+
+        for timer in pending:
+            if timer.interval:
+                timer.expires = now + ((timer.expires - now) % timer.interval or timer.interval)
+                self._insert(timer)
+                self.count += 1
+            else:
+                timer.active = False
+                timer.slot = None
+
+    def ticks_until_next(self):
+        """Get ticks until the next timer fires, or None if nothing is pending"""
+        if self.count == 0:
+            return None
+        soonest = None
+        for level in range(WHEEL_LEVELS):
+            if not self.level_counts[level]:
+                continue
+            for slot in self.wheels[level]:
+                for timer in slot:
+                    if soonest is None or timer.expires < soonest:
+                        soonest = timer.expires
+        return soonest - self.now
+
+    def _insert(self, timer):
+        """Place timer in the slot matching its distance from now"""
+        delta = timer.expires - self.now
+        level = 0
+        while level < WHEEL_LEVELS - 1 and delta >= (1 << (WHEEL_BITS * (level + 1))):
+            level += 1
+
+        slot = (timer.expires >> (WHEEL_BITS * level)) & WHEEL_MASK
+        timer.level = level
+        timer.slot = slot
+        self.wheels[level][slot][timer] = None
+        self.level_counts[level] += 1
+        if level == 0:
+            self.level0_mask |= 1 << slot
+
+    def _cascade(self, level):
+        """Move timers from the current slot of a higher level down"""
+        slot_index = (self.now >> (WHEEL_BITS * level)) & WHEEL_MASK
+        slot = self.wheels[level][slot_index]
+        if not slot:
+            return
+        self.wheels[level][slot_index] = {}
+        self.level_counts[level] -= len(slot)
+        for timer in slot:
+            self._insert(timer)
+
+    def _tick(self):
+        """Advance exactly one tick and fire its slot"""
+        self.now += 1
+
+        # Cascade each level whose lower neighbour just wrapped
+        level = 1
+        while level < WHEEL_LEVELS and (self.now & ((1 << (WHEEL_BITS * level)) - 1)) == 0:
+            self._cascade(level)
+            level += 1
+
+        slot_index = self.now & WHEEL_MASK
+        slot = self.wheels[0][slot_index]
+        if not slot:
+            return 0
+
+        self.wheels[0][slot_index] = {}
+        self.level_counts[0] -= len(slot)
+        self.level0_mask &= ~(1 << slot_index)
+        for timer in slot:
+            timer.slot = None
+
+        fired = 0
+        for timer in slot:
+            # A callback earlier in this slot may have cancelled it
+            if not timer.active:
+                continue
+            if timer.interval:
+                timer.expires += timer.interval
+                self._insert(timer)
+            else:
+                timer.active = False
+                self.count -= 1
+            timer.callback()
+            fired += 1
+        return fired
@@ -0,0 +1,262 @@
+"""
+Anomaly Map for Breach game
+Zoomable map of observed anomalies drawn from cached tiles
+"""
+import time
+from collections import OrderedDict
+import pygame
+from src.ui.layout import get_layout
+from settings import (
+    ANOMALY_MAP_TILE, ANOMALY_MAP_MAX_ZOOM, ANOMALY_MAP_GRID, ANOMALY_MAP_TILE_CACHE,
+    ANOMALY_MAP_BUDGET_MS
+)
+
+MARKER_RADIUS = 3
+MARKER_COLORS = {
+    'anomalous': (170, 110, 255),
+    'critical': (230, 60, 60),
+}
+BACKGROUND = (8, 18, 24)
+GRID_COLOR = (18, 40, 50)
+GRID_SPACING = 32  # Map grid line spacing in pixels at every zoom
+
+
+class MarkerGrid:
+    """Uniform grid over the 0..1 map square, cell -> marker indices"""
+
+    def __init__(self, cells=ANOMALY_MAP_GRID):
+        self.cells = cells
+        self.buckets = {}
+
+    def _cell(self, value):
+        """Cell coordinate of a 0..1 position"""
+        return min(self.cells - 1, max(0, int(value * self.cells)))
+
+    def add(self, index, x, y):
+        """Index a marker by its position"""
+        self.buckets.setdefault((self._cell(x), self._cell(y)), []).append(index)
+
+    def query(self, left, top, right, bottom):
+        """Indices of markers in cells overlapping a 0..1 rectangle"""
+        found = []
+        buckets = self.buckets
+        for cx in range(self._cell(left), self._cell(right) + 1):
+            for cy in range(self._cell(top), self._cell(bottom) + 1):
+                bucket = buckets.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def clear(self):
+        """Remove all markers"""
+        self.buckets.clear()
+
+
+class AnomalyMap:
+    """Pan/zoom view over the anomaly markers
+
+    At zoom z the map is the view size scaled by 2**z, cut into fixed-size
+    tiles. Tiles are rendered on demand (only the markers the grid returns
+    for them) and kept in an LRU; adding a marker drops just the tiles it
+    touches at each zoom level, so a frame is a couple of dozen tile blits
+    whatever the marker count. Tile rendering is capped per frame; tiles
+    over budget show as empty background until a later frame draws them.
+    """
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.font = get_layout().font(16)
+        self.zoom = 0
+        self.camera = [0, 0]  # Top-left of the view in zoomed map pixels
+
+        self.markers = []
+        self.grid = MarkerGrid()
+        self.tiles = OrderedDict()  # (zoom, tx, ty) -> Surface
+        self.sprites = {}
+        for kind, color in MARKER_COLORS.items():
+            sprite = pygame.Surface((MARKER_RADIUS * 2 + 1,) * 2, pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (MARKER_RADIUS, MARKER_RADIUS), MARKER_RADIUS)
+            self.sprites[kind] = sprite
+
+        self.blank = pygame.Surface((ANOMALY_MAP_TILE, ANOMALY_MAP_TILE))
+        self.blank.fill(BACKGROUND)
+
+        self.pointer = None
+        self.drag_from = None
+        self.hovered = None
+        self.tooltip = None
+
+    def map_size(self, zoom=None):
+        """Size of the whole map in pixels at a zoom level"""
+        zoom = self.zoom if zoom is None else zoom
+        return self.rect.width << zoom, self.rect.height << zoom
+
+    # ---- Markers ----
+
+    def sync(self, anomalies):
+        """Pick up markers appended to the observed list (rebuild if it shrank)"""
+        if len(anomalies) < len(self.markers):
+            self.markers = []
+            self.grid.clear()
+            self.tiles.clear()
+            self.hovered = self.tooltip = None
+        for anomaly in anomalies[len(self.markers):]:
+            self.add(anomaly)
+
+    def add(self, anomaly):
+        """Add one marker and invalidate the tiles it covers"""
+        index = len(self.markers)
+        self.markers.append(anomaly)
+        self.grid.add(index, anomaly['x'], anomaly['y'])
+        if not self.tiles:
+            return
+        for zoom in range(ANOMALY_MAP_MAX_ZOOM + 1):
+            width, height = self.map_size(zoom)
+            px, py = anomaly['x'] * width, anomaly['y'] * height
+            for tx in range(int(px - MARKER_RADIUS) // ANOMALY_MAP_TILE,
+                            int(px + MARKER_RADIUS) // ANOMALY_MAP_TILE + 1):
+                for ty in range(int(py - MARKER_RADIUS) // ANOMALY_MAP_TILE,
+                                int(py + MARKER_RADIUS) // ANOMALY_MAP_TILE + 1):
+                    self.tiles.pop((zoom, tx, ty), None)
+
+    # ---- Tiles ----
+
+    def _render_tile(self, zoom, tx, ty):
+        """Draw the background and markers of one tile"""
+        size = ANOMALY_MAP_TILE
+        tile = pygame.Surface((size, size))
+        tile.fill(BACKGROUND)
+        for x in range(-(tx * size) % GRID_SPACING, size, GRID_SPACING):
+            pygame.draw.line(tile, GRID_COLOR, (x, 0), (x, size - 1))
+        for y in range(-(ty * size) % GRID_SPACING, size, GRID_SPACING):
+            pygame.draw.line(tile, GRID_COLOR, (0, y), (size - 1, y))
+
+        # Markers whose circle reaches into this tile
+        width, height = self.map_size(zoom)
+        left, top = tx * size - MARKER_RADIUS, ty * size - MARKER_RADIUS
+        right, bottom = left + size + 2 * MARKER_RADIUS, top + size + 2 * MARKER_RADIUS
+        sprites = self.sprites
+        markers = self.markers
+        blits = []
+        for index in self.grid.query(left / width, top / height, right / width, bottom / height):
+            marker = markers[index]
+            px = int(marker['x'] * width) - tx * size - MARKER_RADIUS
+            py = int(marker['y'] * height) - ty * size - MARKER_RADIUS
+            if -2 * MARKER_RADIUS <= px < size and -2 * MARKER_RADIUS <= py < size:
+                blits.append((sprites.get(marker['type'], sprites['anomalous']), (px, py)))
+        tile.blits(blits, doreturn=False)
+        return tile
+
+    def _tile(self, zoom, tx, ty, deadline):
+        """Cached tile, rendered on a miss while time is left"""
+        key = (zoom, tx, ty)
+        tile = self.tiles.get(key)
+        if tile is None:
+            if time.perf_counter() > deadline:
+                return self.blank
+            tile = self.tiles[key] = self._render_tile(zoom, tx, ty)
+            if len(self.tiles) > ANOMALY_MAP_TILE_CACHE:
+                self.tiles.popitem(last=False)
+        else:
+            self.tiles.move_to_end(key)
+        return tile
+
+    # ---- View ----
+
+    def pan(self, dx, dy):
+        """Move the view by a number of screen pixels"""
+        width, height = self.map_size()
+        self.camera[0] = max(0, min(width - self.rect.width, self.camera[0] + dx))
+        self.camera[1] = max(0, min(height - self.rect.height, self.camera[1] + dy))
+
+    def zoom_at(self, steps, pos):
+        """Zoom in (steps > 0) or out keeping the map point under pos fixed"""
+        zoom = max(0, min(ANOMALY_MAP_MAX_ZOOM, self.zoom + steps))
+        if zoom == self.zoom:
+            return
+        local_x, local_y = pos[0] - self.rect.x, pos[1] - self.rect.y
+        scale = 2.0 ** (zoom - self.zoom)
+        self.camera[0] = (self.camera[0] + local_x) * scale - local_x
+        self.camera[1] = (self.camera[1] + local_y) * scale - local_y
+        self.zoom = zoom
+        self.pan(0, 0)  # Clamp
+        self._update_hover()
+
+    # ---- Input ----
+
+    def point(self, pos):
+        """Drag the view or update the hovered marker"""
+        if self.drag_from is not None:
+            self.pan(self.drag_from[0] - pos[0], self.drag_from[1] - pos[1])
+            self.drag_from = pos
+        self.pointer = pos
+        self._update_hover()
+
+    def click(self, pos):
+        """Start dragging, returns True if pos is on the map"""
+        if not self.rect.collidepoint(pos):
+            return False
+        self.drag_from = pos
+        return True
+
+    def release(self):
+        """Stop dragging"""
+        self.drag_from = None
+
+    def wheel(self, steps):
+        """Zoom around the pointer"""
+        if self.pointer is not None and self.rect.collidepoint(self.pointer):
+            self.zoom_at(steps, self.pointer)
+
+    def _update_hover(self):
+        """Find the marker under the pointer through the grid"""
+        hovered = None
+        pos = self.pointer
+        if pos is not None and self.rect.collidepoint(pos):
+            width, height = self.map_size()
+            px = self.camera[0] + pos[0] - self.rect.x
+            py = self.camera[1] + pos[1] - self.rect.y
+            reach = MARKER_RADIUS + 2
+            best = reach * reach
+            for index in self.grid.query((px - reach) / width, (py - reach) / height,
+                                         (px + reach) / width, (py + reach) / height):
+                marker = self.markers[index]
+                dx = marker['x'] * width - px
+                dy = marker['y'] * height - py
+                distance = dx * dx + dy * dy
+                if distance <= best:
+                    best, hovered = distance, index
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.tooltip = None
+            if hovered is not None:
+                marker = self.markers[hovered]
+                text = f"Day {marker['day']} {marker['time']}  {marker['name']}"
+                self.tooltip = self.font.render(text, True, (255, 255, 255), (0, 0, 0))
+
+    def render(self, surface):
+        """Blit the visible tiles, the hover ring and its tooltip"""
+        size = ANOMALY_MAP_TILE
+        camera_x, camera_y = int(self.camera[0]), int(self.camera[1])
+        first_x, first_y = camera_x // size, camera_y // size
+        last_x = (camera_x + self.rect.width - 1) // size
+        last_y = (camera_y + self.rect.height - 1) // size
+        origin_x, origin_y = self.rect.x - camera_x, self.rect.y - camera_y
+
+        deadline = time.perf_counter() + ANOMALY_MAP_BUDGET_MS / 1000.0
+        previous_clip = surface.get_clip()
+        surface.set_clip(self.rect)
+        surface.blits([(self._tile(self.zoom, tx, ty, deadline),
+                        (origin_x + tx * size, origin_y + ty * size))
+                       for ty in range(first_y, last_y + 1)
+                       for tx in range(first_x, last_x + 1)], doreturn=False)
+
+        if self.hovered is not None:
+            width, height = self.map_size()
+            marker = self.markers[self.hovered]
+            center = (origin_x + int(marker['x'] * width), origin_y + int(marker['y'] * height))
+            pygame.draw.circle(surface, (255, 255, 255), center, MARKER_RADIUS + 3, 1)
+            tip_x = min(center[0] + 8, self.rect.right - self.tooltip.get_width())
+            tip_y = max(self.rect.y, center[1] - self.tooltip.get_height() - 6)
+            surface.blit(self.tooltip, (tip_x, tip_y))
+        surface.set_clip(previous_clip)
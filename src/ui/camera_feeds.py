@@ -0,0 +1,196 @@
+"""
+Camera Feeds for Breach game
+Renders monitor camera feeds into offscreen surfaces on a refresh budget
+"""
+import time
+import pygame
+from src.assets.noise_frames import NoiseFramePool, feed_noise_intensity
+from src.assets.job_system import get_job_system
+from src.ui.layout import get_layout
+from settings import CAMERA_FEED_BACKGROUND_FPS, CAMERA_FEED_BUDGET_MS
+
+
+def _draw_corridor(surface):
+    """Long corridor in one-point perspective"""
+    w, h = surface.get_size()
+    cx, cy = w // 2, h // 2
+    surface.fill((22, 24, 22))
+    far = pygame.Rect(cx - w // 10, cy - h // 8, w // 5, h // 4)
+    pygame.draw.polygon(surface, (32, 34, 30), [(0, h), (far.left, far.bottom), (far.right, far.bottom), (w, h)])
+    pygame.draw.polygon(surface, (16, 18, 16), [(0, 0), (far.left, far.top), (far.right, far.top), (w, 0)])
+    pygame.draw.rect(surface, (8, 8, 8), far)
+    for corner in ((0, 0), (w, 0), (0, h), (w, h)):
+        pygame.draw.line(surface, (50, 55, 50), corner,
+                         (far.left if corner[0] == 0 else far.right, far.top if corner[1] == 0 else far.bottom))
+    # Doors along the walls
+    for i in range(1, 4):
+        t = i / 4
+        x = int(far.left * t)
+        pygame.draw.line(surface, (45, 48, 42), (x, int(h * (1 - t) * 0.2 + far.top * t)),
+                         (x, int(h - (h - far.bottom) * t)), 2)
+        pygame.draw.line(surface, (45, 48, 42), (w - x, int(h * (1 - t) * 0.2 + far.top * t)),
+                         (w - x, int(h - (h - far.bottom) * t)), 2)
+
+
+def _draw_engine_room(surface):
+    """Generator block with pipes"""
+    w, h = surface.get_size()
+    surface.fill((26, 22, 18))
+    pygame.draw.rect(surface, (38, 32, 26), (0, h * 2 // 3, w, h // 3))
+    generator = pygame.Rect(w // 4, h // 4, w // 2, h // 2)
+    pygame.draw.rect(surface, (55, 50, 40), generator)
+    pygame.draw.rect(surface, (85, 75, 55), generator, 3)
+    for i in range(5):
+        y = generator.y + 12 + i * (generator.height - 24) // 5
+        pygame.draw.line(surface, (35, 32, 26), (generator.x + 10, y), (generator.right - 10, y), 3)
+    for x in (w // 8, w * 7 // 8):
+        pygame.draw.line(surface, (70, 60, 50), (x, 0), (x, h * 2 // 3), 8)
+    pygame.draw.line(surface, (70, 60, 50), (w // 8, h // 6), (generator.x, h // 6), 8)
+
+
+def _draw_entrance(surface):
+    """Front door and porch light"""
+    w, h = surface.get_size()
+    surface.fill((14, 18, 22))
+    pygame.draw.rect(surface, (24, 30, 26), (0, h * 3 // 4, w, h // 4))
+    door = pygame.Rect(w // 2 - w // 10, h // 4, w // 5, h // 2)
+    pygame.draw.rect(surface, (40, 34, 28), door)
+    pygame.draw.rect(surface, (70, 60, 48), door, 3)
+    pygame.draw.circle(surface, (90, 80, 60), (door.right - 12, door.centery), 4)
+    pygame.draw.circle(surface, (60, 58, 40), (door.centerx, door.y - 18), 8)
+
+
+def _draw_roof(surface):
+    """Roof edge with antenna against the sky"""
+    w, h = surface.get_size()
+    surface.fill((12, 16, 24))
+    pygame.draw.polygon(surface, (30, 30, 34), [(0, h), (0, h * 2 // 3), (w, h // 2), (w, h)])
+    base = (w * 2 // 3, h * 5 // 9)
+    pygame.draw.line(surface, (70, 70, 80), base, (base[0], h // 8), 3)
+    for i in range(3):
+        y = h // 8 + 14 + i * 18
+        pygame.draw.line(surface, (70, 70, 80), (base[0] - 20 + i * 5, y), (base[0] + 20 - i * 5, y), 2)
+
+
+# Backdrop painter for each camera, by panel title
+BACKDROPS = {
+    'Corridor': _draw_corridor,
+    'Engine Room': _draw_engine_room,
+    'Entrance': _draw_entrance,
+    'Roof': _draw_roof,
+}
+
+
+class CameraFeed:
+    """One camera: a prebaked backdrop plus a live overlay in its own surface"""
+
+    def __init__(self, index, name, rect):
+        self.index = index
+        self.name = name
+        self.rect = rect
+        self.surface = pygame.Surface(rect.size).convert()
+        self.backdrop = pygame.Surface(rect.size).convert()
+        BACKDROPS.get(name, lambda s: s.fill((20, 20, 20)))(self.backdrop)
+        self.enabled = True
+        self.proximity = 0.0  # 0..1, how close something anomalous is
+        self.last_refresh = None
+        self.frames = 0
+
+    def overdue(self, now, interval):
+        """Seconds past the feed's next scheduled refresh (negative = not due)"""
+        if self.last_refresh is None:
+            return float('inf')
+        return now - self.last_refresh - interval
+
+    def refresh(self, now, noise, battery, font, caption):
+        """Redraw the feed into its offscreen surface"""
+        surface = self.surface
+        w, h = surface.get_size()
+        self.last_refresh = now
+        self.frames += 1
+
+        if not self.enabled:
+            surface.fill((8, 8, 8))
+            label = font.render("NO SIGNAL", True, (160, 160, 160))
+            surface.blit(label, label.get_rect(center=(w // 2, h // 2)))
+            return
+
+        surface.blit(self.backdrop, (0, 0))
+
+        # Static from the precomputed pool; full dropouts hide the caption too
+        if noise.draw(surface, feed_noise_intensity(battery, self.proximity)):
+            return
+
+        # Rolling interference bar
+        bar_y = int(now * 40 + self.index * h / 4) % h
+        surface.fill((45, 50, 45), (0, bar_y, w, 3))
+
+        # Caption and blinking REC dot
+        text = font.render(f"CAM {self.index + 1}  {self.name.upper()}  {caption}", True, (200, 220, 200))
+        px = get_layout().px
+        surface.blit(text, (px(8), h - px(18)))
+        if int(now * 2) % 2 == 0:
+            pygame.draw.circle(surface, (220, 30, 30), (w - px(16), px(14)), max(2, px(5)))
+
+
+class CameraFeedSystem:
+    """Refreshes camera feeds within a per-frame time budget
+
+    The selected feed refreshes every frame; the rest aim for
+    CAMERA_FEED_BACKGROUND_FPS and are refreshed most-overdue first until
+    the frame's budget is spent. When the budget runs out the remaining
+    feeds keep their last frame, so background feeds slow down instead of
+    the frame rate dropping. Nothing is refreshed while the monitors are not
+    on screen.
+    """
+
+    def __init__(self, feeds, background_fps=CAMERA_FEED_BACKGROUND_FPS,
+                 budget_ms=CAMERA_FEED_BUDGET_MS):
+        self.feeds = [CameraFeed(i, name, rect) for i, (name, rect) in enumerate(feeds)]
+        self.background_interval = 1.0 / background_fps
+        self.budget = budget_ms / 1000.0
+        self.font = get_layout().font(16)
+        self.noise = NoiseFramePool((max(feed.rect.width for feed in self.feeds),
+                                     max(feed.rect.height for feed in self.feeds)),
+                                    jobs=get_job_system(), group='monitors')
+        self.battery = 1.0  # Fraction of max batteries
+        self.skipped = 0  # Due refreshes dropped for lack of budget, last frame
+
+    def set_conditions(self, battery, proximity):
+        """Set battery fraction and per-feed anomaly proximity (0..1)"""
+        self.battery = battery
+        for feed, value in zip(self.feeds, proximity):
+            feed.proximity = value
+
+    def set_enabled(self, enabled):
+        """Turn all feeds on or off (e.g. batteries flat)"""
+        for feed in self.feeds:
+            if feed.enabled != enabled:
+                feed.enabled = enabled
+                feed.last_refresh = None  # Redraw the change straight away
+
+    def update(self, selected, caption=""):
+        """Refresh due feeds for this frame"""
+        start = time.perf_counter()
+        now = pygame.time.get_ticks() / 1000.0
+
+        selected_feed = self.feeds[selected]
+        selected_feed.refresh(now, self.noise, self.battery, self.font, caption)
+
+        due = [(feed.overdue(now, self.background_interval), feed)
+               for feed in self.feeds if feed is not selected_feed]
+        due = [entry for entry in due if entry[0] >= 0]
+        due.sort(key=lambda entry: entry[0], reverse=True)
+
+        self.skipped = 0
+        for index, (_, feed) in enumerate(due):
+            if time.perf_counter() - start >= self.budget:
+                self.skipped = len(due) - index
+                break
+            feed.refresh(now, self.noise, self.battery, self.font, caption)
+
+    def render(self, surface):
+        """Blit every feed's last frame"""
+        for feed in self.feeds:
+            if feed.last_refresh is not None:
+                surface.blit(feed.surface, feed.rect)
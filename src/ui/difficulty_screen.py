@@ -4,29 +4,33 @@ Player selects game difficulty
 """
 import pygame
 from src.ui.ui_elements import Button, TextDisplay, Panel
-from src.assets.asset_loader import get_asset_loader
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_WHITE, COLOR_GREEN, COLOR_YELLOW
+from src.assets.texture_generator import get_texture_generator
+from src.ui.layout import get_layout
+from settings import COLOR_WHITE, COLOR_GREEN, COLOR_YELLOW
 
 
 class DifficultyScreen:
     """Difficulty selection screen"""
 
+    # Static: only redrawn on input
+    animation_fps = 0
+
     def __init__(self, on_start_callback):
         """Initialize difficulty selection
 
         on_start_callback: function that takes difficulty as parameter
         """
-        self.title_font = pygame.font.Font(None, 72)
-        self.subtitle_font = pygame.font.Font(None, 32)
-        self.font = pygame.font.Font(None, 20)
-        self.info_font = pygame.font.Font(None, 16)
+        self.layout = layout = get_layout()
+        self.title_font = layout.font(72)
+        self.subtitle_font = layout.font(32)
+        self.font = layout.font(20)
+        self.info_font = layout.font(16)
 
         # Загрузи фон (тот же фон, что и главное меню, но можно другой)
-        asset_loader = get_asset_loader()
-        self.bg_texture = asset_loader.load('bg_main_menu')
-        if self.bg_texture is None:
-            self.bg_texture = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.bg_texture.fill((20, 20, 30))
+        self.bg_texture = get_texture_generator().get('image', layout.size, name='bg_main_menu')
+        self.overlay = pygame.Surface(layout.size)
+        self.overlay.set_alpha(80)
+        self.overlay.fill((0, 0, 0))
 
         # State
         self.selected_difficulty = 'normal'  # normal, hard, insane
@@ -70,28 +74,32 @@ class DifficultyScreen:
         if self.on_start_callback:
             self.on_start_callback(self.selected_difficulty)
 
-    def handle_event(self, event):
+    def handle_action(self, action, value):
         """Handle user input"""
-        if event.type == pygame.MOUSEBUTTONDOWN:
+        if action == 'click':
             # Check difficulty panel clicks
             for diff, panel in self.difficulty_panels.items():
-                if panel.rect.collidepoint(event.pos):
+                if panel.rect.collidepoint(value):
                     self.selected_difficulty = diff
 
             # Check start button
-            self.start_button.handle_event(event)
+            self.start_button.click(value)
+
+        elif action == 'point':
+            self.start_button.point(value)
+
+        elif action == 'release':
+            self.start_button.release()
 
-        elif event.type == pygame.KEYDOWN:
+        elif action in ('left', 'right'):
             # Arrow keys to select difficulty
             difficulties = ['normal', 'hard', 'insane']
             current_idx = difficulties.index(self.selected_difficulty)
+            step = -1 if action == 'left' else 1
+            self.selected_difficulty = difficulties[(current_idx + step) % 3]
 
-            if event.key == pygame.K_LEFT:
-                self.selected_difficulty = difficulties[(current_idx - 1) % 3]
-            elif event.key == pygame.K_RIGHT:
-                self.selected_difficulty = difficulties[(current_idx + 1) % 3]
-            elif event.key == pygame.K_RETURN:
-                self._on_start_clicked()
+        elif action == 'confirm':
+            self._on_start_clicked()
 
     def update(self, game_state):
         """Update menu state"""
@@ -103,18 +111,16 @@ class DifficultyScreen:
         surface.blit(self.bg_texture, (0, 0))
 
         # Overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(80)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self.overlay, (0, 0))
+        layout = self.layout
 
         # Title
         title_surf = self.title_font.render("SELECT DIFFICULTY", True, COLOR_GREEN)
-        surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 30))
+        surface.blit(title_surf, title_surf.get_rect(midtop=layout.anchor(0.5, 0, 0, 30)))
 
         # Subtitle
         subtitle_surf = self.subtitle_font.render("Choose your challenge", True, COLOR_WHITE)
-        surface.blit(subtitle_surf, (SCREEN_WIDTH // 2 - subtitle_surf.get_width() // 2, 120))
+        surface.blit(subtitle_surf, subtitle_surf.get_rect(midtop=layout.anchor(0.5, 0, 0, 120)))
 
         # Draw difficulty panels
         for diff, panel in self.difficulty_panels.items():
@@ -122,19 +128,19 @@ class DifficultyScreen:
 
             # Highlight selected difficulty with green border
             if diff == self.selected_difficulty:
-                pygame.draw.rect(surface, COLOR_GREEN, panel.rect, 5)
+                pygame.draw.rect(surface, COLOR_GREEN, panel.rect, max(1, layout.px(5)))
 
             # Draw info text inside panels
             info_text = self.info_displays[diff]
-            y_offset = panel.rect.y + 40
+            y_offset = panel.rect.y + layout.px(40)
             for line in info_text:
                 line_surf = self.info_font.render(line, True, COLOR_WHITE)
-                surface.blit(line_surf, (panel.rect.x + 15, y_offset))
-                y_offset += 35
+                surface.blit(line_surf, (panel.rect.x + layout.px(15), y_offset))
+                y_offset += layout.px(35)
 
         # Start button
         self.start_button.render(surface)
 
         # Instructions
         instructions = self.font.render("ARROW KEYS: Select | ENTER: Start | MOUSE: Click", True, COLOR_YELLOW)
-        surface.blit(instructions, (SCREEN_WIDTH // 2 - instructions.get_width() // 2, SCREEN_HEIGHT - 40))
+        surface.blit(instructions, instructions.get_rect(midtop=layout.anchor(0.5, 1, 0, -40)))
@@ -0,0 +1,65 @@
+"""
+Frame Scheduler for Breach game
+Paces the main loop by what the active screen needs to animate
+"""
+import pygame
+from settings import FPS, IDLE_FPS, INPUT_ACTIVE_SECONDS, MAX_FRAME_DELTA
+
+# Events that count as the player doing something
+INPUT_EVENTS = (
+    pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.TEXTINPUT
+)
+
+
+class FrameScheduler:
+    """Decides how long each frame waits and whether it needs a redraw
+
+    Screens declare an animation_fps. Animating screens run at that rate
+    (capped at FPS). Static screens (animation_fps 0) block in
+    pygame.event.wait until input arrives, waking at IDLE_FPS to run their
+    update, and are only redrawn when an event came in. Any input switches
+    to the full rate for INPUT_ACTIVE_SECONDS so hover and press feedback
+    stay smooth.
+    """
+
+    def __init__(self, max_fps=FPS, idle_fps=IDLE_FPS, active_seconds=INPUT_ACTIVE_SECONDS):
+        self.clock = pygame.time.Clock()
+        self.max_fps = max_fps
+        self.idle_timeout = int(1000 / idle_fps)
+        self.active_ms = int(active_seconds * 1000)
+        self.active_until = 0
+        self.last_frame = pygame.time.get_ticks()
+        self.delta_time = 0.0
+        self.needs_render = True
+
+    def wait(self, animation_fps):
+        """Wait for the next frame, returns the events that arrived"""
+        if pygame.time.get_ticks() < self.active_until:
+            animation_fps = self.max_fps
+
+        if animation_fps > 0:
+            self.clock.tick(min(animation_fps, self.max_fps))
+            events = pygame.event.get()
+            self.needs_render = True
+        else:
+            event = pygame.event.wait(self.idle_timeout)
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+            self.needs_render = self.needs_render or bool(events)
+
+        now = pygame.time.get_ticks()
+        if any(event.type in INPUT_EVENTS for event in events):
+            self.active_until = now + self.active_ms
+
+        # Clamp so leaving a long idle wait doesn't jump the simulation
+        self.delta_time = min((now - self.last_frame) / 1000.0, MAX_FRAME_DELTA)
+        self.last_frame = now
+        return events
+
+    def request_render(self):
+        """Force a redraw on the next frame (e.g. after a screen switch)"""
+        self.needs_render = True
+
+    def frame_rendered(self):
+        """Mark the current frame as drawn"""
+        self.needs_render = False
@@ -0,0 +1,98 @@
+"""
+Input Mapper for Breach game
+Filters raw pygame events and translates them into named actions
+"""
+import pygame
+from settings import STATIONS
+
+# Only these event types reach the queue; everything else is dropped by SDL
+ALLOWED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSIZECHANGED,
+]
+
+# Key -> (action, value)
+KEY_ACTIONS = {
+    pygame.K_ESCAPE: ('quit', None),
+    pygame.K_UP: ('up', None),
+    pygame.K_DOWN: ('down', None),
+    pygame.K_LEFT: ('left', None),
+    pygame.K_RIGHT: ('right', None),
+    pygame.K_RETURN: ('confirm', None),
+    pygame.K_KP_ENTER: ('confirm', None),
+    pygame.K_SPACE: ('morse_key', None),
+    pygame.K_F11: ('fullscreen', None),
+}
+# Keys that also report their release
+KEY_RELEASE_ACTIONS = {
+    pygame.K_SPACE: ('morse_release', None),
+}
+# Number keys 1-5 switch stations
+for _index, _station in enumerate(STATIONS):
+    KEY_ACTIONS[pygame.K_1 + _index] = ('station', _station)
+
+
+class InputMapper:
+    """Turns one frame's events into a list of (action, value) pairs
+
+    Mouse motion is coalesced: however many MOUSEMOTION events arrive in a
+    frame, screens get a single ('point', pos) with the last position, so
+    hit-testing cost does not grow with mouse speed. Clicks become
+    ('click', pos) / ('release', pos) and the wheel ('wheel', steps).
+    Positions go through `transform` (window -> render target pixels).
+    """
+
+    def __init__(self, key_actions=None, transform=None):
+        self.key_actions = key_actions or KEY_ACTIONS
+        self.transform = transform or (lambda pos: pos)
+        self.pointer = (0, 0)
+
+    def install(self):
+        """Restrict the event queue to the types we handle"""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENTS)
+
+    def translate(self, events):
+        """Translate a frame's events into actions"""
+        actions = []
+        motion = None
+        key_actions = self.key_actions
+        transform = self.transform
+
+        for event in events:
+            event_type = event.type
+            if event_type == pygame.MOUSEMOTION:
+                motion = transform(event.pos)
+            elif event_type == pygame.KEYDOWN:
+                action = key_actions.get(event.key)
+                if action is not None:
+                    actions.append(action)
+            elif event_type == pygame.KEYUP:
+                action = KEY_RELEASE_ACTIONS.get(event.key)
+                if action is not None:
+                    actions.append(action)
+            elif event_type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:
+                    actions.append(('click', transform(event.pos)))
+            elif event_type == pygame.MOUSEBUTTONUP:
+                if event.button == 1:
+                    actions.append(('release', transform(event.pos)))
+            elif event_type == pygame.MOUSEWHEEL:
+                actions.append(('wheel', event.y))
+            elif event_type == pygame.WINDOWSIZECHANGED:
+                actions.append(('resize', (event.x, event.y)))
+            elif event_type == pygame.QUIT:
+                actions.append(('quit', None))
+
+        if motion is not None:
+            self.pointer = motion
+            actions.insert(0, ('point', motion))
+        return actions
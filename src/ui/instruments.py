@@ -0,0 +1,185 @@
+"""
+Laboratory Instruments for Breach game
+Spectrometer and magnetometer signals synthesized with NumPy
+"""
+import numpy as np
+import pygame
+from settings import (
+    SPECTROMETER_DIFFICULTY, SPECTRUM_BINS, SPECTRUM_HISTORY, SPECTRUM_NOISE,
+    SENSOR_CALIBRATION_GAIN, PEAK_MATCH_TOLERANCE, MAGNETOMETER_SAMPLES, MAGNETOMETER_RATE,
+    COLOR_GREEN
+)
+
+TRACE_COLORS = ((255, 90, 90), (90, 255, 120), (110, 150, 255))  # Magnetometer X/Y/Z
+MARKER_COLOR = (255, 220, 0)
+
+
+def noise_scale(accuracy):
+    """Noise multiplier for a 'sensor_accuracy' bonus (isotope calibration)"""
+    return 1.0 / (1.0 + SENSOR_CALIBRATION_GAIN * max(0.0, accuracy))
+
+
+class Spectrometer:
+    """Anomaly spectrum: a sum of Gaussian peaks under noise
+
+    Each update adds one noisy reading to a ring buffer; the display is the
+    running mean of the last SPECTRUM_HISTORY readings, kept as a running
+    sum so a reading costs one subtraction and one addition per bin.
+    """
+
+    def __init__(self, rect, peaks=SPECTROMETER_DIFFICULTY, bins=SPECTRUM_BINS,
+                 history=SPECTRUM_HISTORY, seed=None):
+        self.rect = pygame.Rect(rect)
+        self.peaks = peaks
+        self.rng = np.random.default_rng(seed)
+        self.channels = np.linspace(0.0, 1.0, bins, dtype=np.float32)
+        self.noise = SPECTRUM_NOISE
+
+        self.history = np.zeros((history, bins), dtype=np.float32)
+        self.total = np.zeros(bins, dtype=np.float32)
+        self.head = 0
+        self.filled = 0
+
+        # Screen x of every bin never changes; only y is recomputed
+        self.xs = self.rect.left + self.channels * (self.rect.width - 1)
+        self.points = []
+
+        self.markers = []  # Channel positions (0..1) placed by the player
+        self.score = None
+        self.new_sample()
+
+    def new_sample(self):
+        """Generate a fresh unknown spectrum and clear readings and markers"""
+        rng = self.rng
+        self.centers = np.sort(rng.uniform(0.08, 0.92, self.peaks)).astype(np.float32)
+        self.widths = rng.uniform(0.012, 0.035, self.peaks).astype(np.float32)
+        heights = rng.uniform(0.45, 1.0, self.peaks).astype(np.float32)
+        # (peaks, bins) Gaussians summed over peaks
+        offsets = (self.channels[None, :] - self.centers[:, None]) / self.widths[:, None]
+        self.signal = (heights[:, None] * np.exp(-0.5 * offsets * offsets)).sum(axis=0)
+
+        self.history.fill(0)
+        self.total.fill(0)
+        self.head = 0
+        self.filled = 0
+        self.markers = []
+        self.score = None
+
+    def set_calibration(self, accuracy):
+        """Lower the noise floor for a 'sensor_accuracy' bonus"""
+        self.noise = SPECTRUM_NOISE * noise_scale(accuracy)
+
+    def update(self):
+        """Take one reading and refresh the trace"""
+        reading = self.signal + self.rng.normal(0.0, self.noise, self.signal.shape).astype(np.float32)
+        self.total -= self.history[self.head]
+        self.total += reading
+        self.history[self.head] = reading
+        self.head = (self.head + 1) % len(self.history)
+        self.filled = min(self.filled + 1, len(self.history))
+
+        level = np.clip(self.total / self.filled, 0.0, 1.2) / 1.2
+        ys = self.rect.bottom - 1 - level * (self.rect.height - 1)
+        self.points = np.column_stack((self.xs, ys)).tolist()
+
+    def click(self, pos):
+        """Place or remove a peak marker, returns True if pos was on the plot"""
+        if not self.rect.collidepoint(pos):
+            return False
+        if self.score is not None:
+            self.new_sample()
+            return True
+
+        channel = (pos[0] - self.rect.left) / (self.rect.width - 1)
+        for marker in self.markers:
+            if abs(marker - channel) < PEAK_MATCH_TOLERANCE:
+                self.markers.remove(marker)
+                return True
+        self.markers.append(channel)
+        if len(self.markers) == self.peaks:
+            self.score = self.match_score(self.markers)
+        return True
+
+    def match_score(self, markers):
+        """0..1: how close the nearest marker is to every true peak"""
+        markers = np.asarray(markers, dtype=np.float32)
+        distance = np.abs(markers[:, None] - self.centers[None, :]).min(axis=0)
+        return float(np.exp(-(distance / PEAK_MATCH_TOLERANCE) ** 2).mean())
+
+    def render(self, surface):
+        """Draw the averaged spectrum and the markers"""
+        pygame.draw.rect(surface, (5, 15, 10), self.rect)
+        if len(self.points) > 1:
+            pygame.draw.lines(surface, COLOR_GREEN, False, self.points)
+        top, bottom = self.rect.top, self.rect.bottom - 1
+        for marker in self.markers:
+            x = self.rect.left + marker * (self.rect.width - 1)
+            pygame.draw.line(surface, MARKER_COLOR, (x, top), (x, bottom))
+
+
+class Magnetometer:
+    """Rolling three-axis field trace
+
+    Samples are written into a (3, n) ring buffer in vectorized batches;
+    rendering reads it in time order through a precomputed index array and
+    draws each axis with one draw.lines call in its own lane.
+    """
+
+    def __init__(self, rect, samples=MAGNETOMETER_SAMPLES, rate=MAGNETOMETER_RATE, seed=None):
+        self.rect = pygame.Rect(rect)
+        self.rate = rate
+        self.rng = np.random.default_rng(seed)
+        self.buffer = np.zeros((3, samples), dtype=np.float32)
+        self.head = 0
+        self.time = 0.0
+        self.pending = 0.0  # Fractional samples carried to the next update
+        self.noise = SPECTRUM_NOISE * 0.4
+        self.proximity = 0.0
+
+        self.order = np.arange(samples)
+        self.xs = self.rect.left + np.linspace(0.0, self.rect.width - 1, samples, dtype=np.float32)
+        lane = self.rect.height / 3
+        self.lane_centers = self.rect.top + lane * (np.arange(3, dtype=np.float32) + 0.5)
+        self.lane_scale = lane * 0.45
+        self.phases = self.rng.uniform(0, 2 * np.pi, (3, 1)).astype(np.float32)
+        self.traces = [[], [], []]
+
+    def set_calibration(self, accuracy):
+        """Lower the noise floor for a 'sensor_accuracy' bonus"""
+        self.noise = SPECTRUM_NOISE * 0.4 * noise_scale(accuracy)
+
+    def set_proximity(self, proximity):
+        """How strongly the anomaly disturbs the field (0..1)"""
+        self.proximity = proximity
+
+    def update(self, dt):
+        """Append the samples that elapsed during dt and refresh the traces"""
+        self.pending += dt * self.rate
+        count = min(int(self.pending), self.buffer.shape[1])
+        if count == 0:
+            return
+        self.pending -= int(self.pending)
+
+        t = self.time + np.arange(1, count + 1, dtype=np.float32) / self.rate
+        self.time = float(t[-1])
+        # Slow background drift plus an anomalous oscillation that pulses in and out
+        drift = 0.25 * np.sin(0.4 * t + self.phases)
+        pulse = np.maximum(0.0, np.sin(0.7 * t + self.phases * 2)) ** 2
+        anomaly = self.proximity * 0.7 * pulse * np.sin(9.0 * t + self.phases)
+        noise = self.rng.normal(0.0, self.noise, (3, count))
+        values = np.clip(drift + anomaly + noise, -1.0, 1.0)
+
+        size = self.buffer.shape[1]
+        self.buffer[:, (self.head + np.arange(count)) % size] = values
+        self.head = (self.head + count) % size
+
+        ordered = self.buffer[:, (self.order + self.head) % size]
+        ys = self.lane_centers[:, None] - ordered * self.lane_scale
+        self.traces = [np.column_stack((self.xs, row)).tolist() for row in ys]
+
+    def render(self, surface):
+        """Draw the three axis traces"""
+        pygame.draw.rect(surface, (5, 10, 15), self.rect)
+        for color, points in zip(TRACE_COLORS, self.traces):
+            if len(points) > 1:
+                pygame.draw.lines(surface, color, False, points)
@@ -0,0 +1,64 @@
+"""
+Layout for Breach game
+Resolution-independent positions: screens are laid out on the
+SCREEN_WIDTH x SCREEN_HEIGHT grid and mapped onto the render target
+"""
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class Layout:
+    """Scales layout units to render-target pixels
+
+    rect()/pos() place things relative to the top-left corner; anchor()
+    places them relative to any point of the target (0.5, 0.5 = centre,
+    1, 1 = bottom-right) with an offset in layout units. Fonts are scaled
+    with everything else and shared per pixel size.
+    """
+
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.fonts = {}
+        self.resize(size)
+
+    def resize(self, size):
+        """Set the render target size (screens must be rebuilt afterwards)"""
+        self.width, self.height = size
+        self.size = (self.width, self.height)
+        self.scale = min(self.width / SCREEN_WIDTH, self.height / SCREEN_HEIGHT)
+
+    def px(self, value):
+        """Layout units to pixels"""
+        return int(round(value * self.scale))
+
+    def pos(self, x, y):
+        """Layout position to pixels"""
+        return self.px(x), self.px(y)
+
+    def rect(self, x, y, width, height):
+        """Layout rectangle to a pixel Rect (never empty)"""
+        return pygame.Rect(self.px(x), self.px(y), max(1, self.px(width)), max(1, self.px(height)))
+
+    def anchor(self, anchor_x, anchor_y, dx=0, dy=0):
+        """Pixel position of a point on the target plus an offset in layout units"""
+        return (int(round(anchor_x * self.width + dx * self.scale)),
+                int(round(anchor_y * self.height + dy * self.scale)))
+
+    def font(self, size):
+        """Default font at a layout size"""
+        pixels = max(8, self.px(size))
+        font = self.fonts.get(pixels)
+        if font is None:
+            font = self.fonts[pixels] = pygame.font.Font(None, pixels)
+        return font
+
+
+# Global layout
+_layout = None
+
+
+def get_layout():
+    """Get the global layout"""
+    global _layout
+    if _layout is None:
+        _layout = Layout()
+    return _layout
@@ -0,0 +1,146 @@
+"""
+Lighting for Breach game
+Darkens screens with prebaked light masks when power fails
+"""
+import random
+import numpy as np
+import pygame
+from src.assets.job_system import pack_pixels, unpack_surface
+from settings import (
+    SCREEN_HEIGHT, RESOURCES, LIGHT_LOW_FUEL, LIGHT_GENERATOR_OUT, LIGHT_AMBIENT,
+    FLASHLIGHT_RADIUS, LIGHT_FLICKER_STEPS
+)
+
+# (kind, size) -> mask surface, built once per resolution
+_mask_cache = {}
+
+
+def _to_pixels(light):
+    """Turn a (w, h) array of light levels 0..1 into packed gray mask pixels"""
+    values = (np.clip(light, 0.0, 1.0) * 255).astype(np.uint8)
+    return pack_pixels(np.repeat(values[:, :, None], 3, axis=2))
+
+
+def _build_radial(size):
+    """Bright centre falling off towards the corners"""
+    width, height = size
+    x = np.linspace(-1.0, 1.0, width)[:, None]
+    y = np.linspace(-1.0, 1.0, height)[None, :]
+    distance = np.sqrt(x * x + y * y) / np.sqrt(2.0)
+    return _to_pixels(1.0 - 0.75 * distance ** 1.5)
+
+
+def _build_flashlight(size):
+    """Beam on ambient darkness, twice the screen size so it can be aimed anywhere"""
+    width, height = size[0] * 2, size[1] * 2
+    x = (np.arange(width) - width / 2)[:, None]
+    y = (np.arange(height) - height / 2)[None, :]
+    radius = FLASHLIGHT_RADIUS * size[1] / SCREEN_HEIGHT  # Same share of the view at any resolution
+    falloff = np.clip(1.0 - (x * x + y * y) / radius ** 2, 0.0, 1.0)
+    return _to_pixels(LIGHT_AMBIENT + (1.0 - LIGHT_AMBIENT) * falloff)
+
+
+_MASK_BUILDERS = {
+    'radial': _build_radial,
+    'flashlight': _build_flashlight,
+}
+
+
+def get_light_mask(kind, size):
+    """Get a cached light mask for a resolution, building it on first use"""
+    key = (kind, size)
+    mask = _mask_cache.get(key)
+    if mask is None:
+        mask = _mask_cache[key] = unpack_surface(_MASK_BUILDERS[kind](size))
+    return mask
+
+
+class LightingCompositor:
+    """Multiplies the finished screen by the current lighting
+
+    powered   - generator running: nothing drawn
+    failing   - fuel low: radial falloff plus generator flicker
+    emergency - generator out, batteries left: flashlight beam at the
+                pointer, dimmer as batteries drain
+    dark      - nothing left: flat ambient darkness
+
+    Fuel is measured as the share of the reserve left above the critical
+    level, since reaching critical ends the game.
+
+    Every mode is at most two BLEND_MULT blits per frame.
+    """
+
+    def __init__(self):
+        self.mode = 'powered'
+        self.level = 1.0
+        self.pointer = None
+        self.tint = None  # Flat gray surface, refilled only when the level changes
+        self.tint_value = None
+
+        # Generator flicker: mostly steady with occasional dips
+        rng = random.Random(7)
+        self.flicker = [rng.uniform(0.35, 0.7) if rng.random() < 0.15 else rng.uniform(0.9, 1.0)
+                        for _ in range(LIGHT_FLICKER_STEPS)]
+
+    def prebake(self, size, jobs=None):
+        """Build the masks for a resolution up front so power loss doesn't hitch
+
+        With a job system the pixels are computed on its workers; a mask
+        needed before its job is done is simply built on the spot.
+        """
+        for kind, builder in _MASK_BUILDERS.items():
+            key = (kind, size)
+            if key in _mask_cache:
+                continue
+            if jobs is None:
+                get_light_mask(kind, size)
+            else:
+                jobs.submit(lambda builder=builder: builder(size),
+                            lambda pixels, key=key: _mask_cache.setdefault(key, unpack_surface(pixels)))
+
+    def update(self, resources):
+        """Pick the lighting mode from fuel and battery levels"""
+        critical = RESOURCES['fuel']['critical']
+        fuel = (resources['fuel'] - critical) / (RESOURCES['fuel']['max'] - critical)
+        battery = resources['batteries'] / RESOURCES['batteries']['max']
+
+        if fuel > LIGHT_LOW_FUEL:
+            self.mode = 'powered'
+            self.level = 1.0
+        elif fuel > LIGHT_GENERATOR_OUT:
+            self.mode = 'failing'
+            self.level = 0.5 + 0.5 * (fuel - LIGHT_GENERATOR_OUT) / (LIGHT_LOW_FUEL - LIGHT_GENERATOR_OUT)
+        elif battery > 0:
+            self.mode = 'emergency'
+            self.level = 0.4 + 0.6 * battery
+        else:
+            self.mode = 'dark'
+            self.level = LIGHT_AMBIENT
+
+    def apply(self, surface):
+        """Darken a rendered frame in place"""
+        if self.mode == 'powered':
+            return
+        size = surface.get_size()
+
+        if self.mode == 'failing':
+            surface.blit(get_light_mask('radial', size), (0, 0), special_flags=pygame.BLEND_MULT)
+            step = (pygame.time.get_ticks() // 60) % len(self.flicker)
+            value = int(255 * self.level * self.flicker[step])
+        elif self.mode == 'emergency':
+            x, y = self.pointer or (size[0] // 2, size[1] // 2)
+            area = pygame.Rect(size[0] - x, size[1] - y, size[0], size[1])
+            surface.blit(get_light_mask('flashlight', size), (0, 0), area,
+                         special_flags=pygame.BLEND_MULT)
+            value = int(255 * self.level)
+        else:
+            value = int(255 * self.level)
+
+        # fill() with BLEND_MULT has no SIMD path; a blit of a flat surface does
+        if self.tint is None or self.tint.get_size() != size:
+            self.tint = pygame.Surface(size).convert()
+            self.tint_value = None
+        if value != self.tint_value:
+            self.tint.fill((value, value, value))
+            self.tint_value = value
+        surface.blit(self.tint, (0, 0), special_flags=pygame.BLEND_MULT)
@@ -4,13 +4,17 @@ Beautiful start menu with game title and navigation
 """
 import pygame
 from src.ui.ui_elements import Button, TextDisplay, Panel
-from src.assets.asset_loader import get_asset_loader
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_WHITE, COLOR_GREEN, COLOR_YELLOW
+from src.assets.texture_generator import get_texture_generator
+from src.ui.layout import get_layout
+from settings import COLOR_WHITE, COLOR_GREEN, COLOR_YELLOW
 
 
 class MainMenuScreen:
     """Beautiful main menu screen"""
 
+    # Static: only redrawn on input
+    animation_fps = 0
+
     def __init__(self, on_new_game_callback, on_exit_callback):
         """Initialize main menu
 
@@ -20,29 +24,32 @@ class MainMenuScreen:
         self.on_new_game_callback = on_new_game_callback
         self.on_exit_callback = on_exit_callback
 
+        self.layout = layout = get_layout()
+
         # Загрузи фон
-        asset_loader = get_asset_loader()
-        self.bg_texture = asset_loader.load('bg_main_menu')
-        if self.bg_texture is None:
-            self.bg_texture = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.bg_texture.fill((20, 20, 30))
+        self.bg_texture = get_texture_generator().get('image', layout.size, name='bg_main_menu')
+
+        # Полупрозрачный слой поверх фона (затемнение)
+        self.overlay = pygame.Surface(layout.size)
+        self.overlay.set_alpha(100)
+        self.overlay.fill((0, 0, 0))
 
         # Шрифты
-        self.title_font = pygame.font.Font(None, 120)  # Большой для названия
-        self.subtitle_font = pygame.font.Font(None, 40)  # Подзаголовок
-        self.button_font = pygame.font.Font(None, 32)  # Кнопки
-        self.small_font = pygame.font.Font(None, 20)  # Мелкий текст
+        self.title_font = layout.font(120)  # Большой для названия
+        self.subtitle_font = layout.font(40)  # Подзаголовок
+        self.button_font = layout.font(32)  # Кнопки
+        self.small_font = layout.font(20)  # Мелкий текст
 
         # Кнопки меню
         # Кнопка "NEW GAME"
         self.btn_new_game = Button(
-            SCREEN_WIDTH // 2 - 150, 350, 300, 70, "NEW GAME",
+            490, 350, 300, 70, "NEW GAME",
             self._on_new_game_clicked
         )
 
         # Кнопка "EXIT"
         self.btn_exit = Button(
-            SCREEN_WIDTH // 2 - 150, 500, 300, 70, "EXIT",
+            490, 500, 300, 70, "EXIT",
             self._on_exit_clicked
         )
 
@@ -60,10 +67,17 @@ class MainMenuScreen:
         if self.on_exit_callback:
             self.on_exit_callback()
 
-    def handle_event(self, event):
+    def handle_action(self, action, value):
         """Handle user input"""
-        self.btn_new_game.handle_event(event)
-        self.btn_exit.handle_event(event)
+        for button in (self.btn_new_game, self.btn_exit):
+            if action == 'point':
+                button.point(value)
+            elif action == 'click':
+                button.click(value)
+            elif action == 'release':
+                button.release()
+        if action == 'confirm':
+            self._on_new_game_clicked()
 
     def update(self, game_state):
         """Update menu state"""
@@ -79,22 +93,20 @@ class MainMenuScreen:
         # Фон
         surface.blit(self.bg_texture, (0, 0))
 
-        # Полупрозрачный слой поверх фона (затемнение)
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(100)
-        overlay.fill((0, 0, 0))
-        surface.blit(overlay, (0, 0))
+        # Затемнение
+        surface.blit(self.overlay, (0, 0))
+        layout = self.layout
 
         # Название игры - "BREACH"
         title_text = "BREACH"
         title_surf = self.title_font.render(title_text, True, COLOR_GREEN)
-        title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 80))
+        title_rect = title_surf.get_rect(center=layout.anchor(0.5, 0, 0, 80))
 
         # Эффект свечения вокруг текста
         for i in range(3):
             glow_surf = self.title_font.render(title_text, True, (0, 100, 150))
             glow_surf.set_alpha(50 - i * 15)
-            glow_rect = glow_surf.get_rect(center=(SCREEN_WIDTH // 2, 80))
+            glow_rect = glow_surf.get_rect(center=layout.anchor(0.5, 0, 0, 80))
             surface.blit(glow_surf, glow_rect)
 
         surface.blit(title_surf, title_rect)
@@ -102,18 +114,18 @@ class MainMenuScreen:
         # Подзаголовок - "Management Horror Game"
         subtitle_text = "Management Horror Game"
         subtitle_surf = self.subtitle_font.render(subtitle_text, True, COLOR_WHITE)
-        subtitle_rect = subtitle_surf.get_rect(center=(SCREEN_WIDTH // 2, 170))
+        subtitle_rect = subtitle_surf.get_rect(center=layout.anchor(0.5, 0, 0, 170))
         surface.blit(subtitle_surf, subtitle_rect)
 
         # Линия под названием (для красоты)
         pygame.draw.line(surface, COLOR_GREEN,
-                         (SCREEN_WIDTH // 2 - 300, 220),
-                         (SCREEN_WIDTH // 2 + 300, 220), 3)
+                         layout.anchor(0.5, 0, -300, 220),
+                         layout.anchor(0.5, 0, 300, 220), max(1, layout.px(3)))
 
         # Небольшая информация
         info_text = "Watch the forest. Keep your sanity. Survive the anomalies."
         info_surf = self.small_font.render(info_text, True, COLOR_YELLOW)
-        info_rect = info_surf.get_rect(center=(SCREEN_WIDTH // 2, 260))
+        info_rect = info_surf.get_rect(center=layout.anchor(0.5, 0, 0, 260))
         surface.blit(info_surf, info_rect)
 
         # Кнопки
@@ -123,4 +135,4 @@ class MainMenuScreen:
         # Версия в углу
         version_text = "v0.1 Alpha"
         version_surf = self.small_font.render(version_text, True, (100, 100, 100))
-        surface.blit(version_surf, (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 30))
+        surface.blit(version_surf, layout.anchor(1, 1, -150, -30))
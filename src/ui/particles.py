@@ -0,0 +1,187 @@
+"""
+Particle System for Breach game
+Anomaly manifestation effects stored as NumPy structure-of-arrays
+"""
+import numpy as np
+import pygame
+from settings import PARTICLE_CAPACITY
+
+# Look and motion of each particle kind; speeds in px/s, life in seconds
+PARTICLE_KINDS = {
+    'fog': {'color': (150, 160, 170), 'radius': 20, 'alpha': 40, 'speed': 12,
+            'life': (4.0, 8.0), 'gravity': -2.0, 'drag': 0.3, 'swirl': 0.0},
+    'dust': {'color': (170, 150, 120), 'radius': 1, 'alpha': 170, 'speed': 25,
+             'life': (2.0, 5.0), 'gravity': 15.0, 'drag': 0.8, 'swirl': 0.0},
+    'sparks': {'color': (255, 200, 90), 'radius': 1, 'alpha': 255, 'speed': 160,
+               'life': (0.3, 1.0), 'gravity': 220.0, 'drag': 1.5, 'swirl': 0.0},
+    'motes': {'color': (170, 110, 255), 'radius': 1, 'alpha': 230, 'speed': 40,
+              'life': (1.5, 4.0), 'gravity': -10.0, 'drag': 0.2, 'swirl': 60.0},
+}
+KIND_NAMES = tuple(PARTICLE_KINDS)
+FADE_LEVELS = 8  # Pre-rendered alpha steps per kind
+
+# Event name -> bursts of (kind, count)
+EVENT_EFFECTS = {
+    'Manifestation Sighting': [('fog', 200), ('motes', 1500)],
+    'Sensor Anomaly': [('sparks', 800)],
+    'Physical Phenomenon': [('dust', 3000)],
+    "Director's Body Discovery": [('fog', 150), ('dust', 1500)],
+    'Dimensional Breach': [('motes', 6000), ('sparks', 3000), ('fog', 250)],
+    'Anomaly Offer': [('motes', 1500)],
+}
+
+# Per-kind parameters as arrays, indexed by each particle's kind
+_GRAVITY = np.array([PARTICLE_KINDS[k]['gravity'] for k in KIND_NAMES], dtype=np.float32)
+_DRAG = np.array([PARTICLE_KINDS[k]['drag'] for k in KIND_NAMES], dtype=np.float32)
+_SWIRL = np.array([PARTICLE_KINDS[k]['swirl'] for k in KIND_NAMES], dtype=np.float32)
+_RADIUS = np.array([PARTICLE_KINDS[k]['radius'] for k in KIND_NAMES], dtype=np.float32)
+_COLOR = np.array([PARTICLE_KINDS[k]['color'] for k in KIND_NAMES], dtype=np.float32)
+_ALPHA = np.array([PARTICLE_KINDS[k]['alpha'] / 255.0 for k in KIND_NAMES], dtype=np.float32)
+# Single-pixel kinds are blended straight into the pixel array; a Python
+# blit per particle would cost more than the whole vectorized pass
+_IS_POINT = _RADIUS <= 1
+
+
+def _build_sprites():
+    """Pre-render every kind at every fade level"""
+    sprites = []
+    for name in KIND_NAMES:
+        kind = PARTICLE_KINDS[name]
+        radius = kind['radius']
+        for level in range(FADE_LEVELS):
+            alpha = kind['alpha'] * (1.0 - level / FADE_LEVELS)
+            sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            # Soft edge: concentric rings fading outwards
+            for ring in range(radius, 0, -1):
+                ring_alpha = int(alpha * (1.0 - (ring - 1) / radius) ** 0.5)
+                pygame.draw.circle(sprite, kind['color'] + (ring_alpha,), (radius, radius), ring)
+            if radius == 1:
+                sprite.fill(kind['color'] + (int(alpha),))
+            sprites.append(sprite.convert_alpha())
+    return sprites
+
+
+class ParticleSystem:
+    """Fixed-capacity particle pool updated in vectorized batches
+
+    Live particles are packed at the front of each array; update() drops
+    expired and out-of-bounds particles by compacting the arrays. Only the
+    few large soft particles (fog) are blitted one by one.
+    """
+
+    def __init__(self, bounds, capacity=PARTICLE_CAPACITY, seed=None):
+        self.bounds = pygame.Rect(bounds)
+        self.capacity = capacity
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.life = np.ones(capacity, dtype=np.float32)
+        self.phase = np.zeros(capacity, dtype=np.float32)
+        self.kind = np.zeros(capacity, dtype=np.uint8)
+        self._arrays = (self.x, self.y, self.vx, self.vy, self.age, self.life, self.phase, self.kind)
+
+        self.sprites = _build_sprites()
+
+    def emit(self, kind_name, count, position=None, spread=None):
+        """Spawn particles of one kind around a point (default: random in bounds)"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        kind = PARTICLE_KINDS[kind_name]
+        start, end = self.count, self.count + count
+        rng = self.rng
+
+        if position is None:
+            self.x[start:end] = rng.uniform(self.bounds.left, self.bounds.right, count)
+            self.y[start:end] = rng.uniform(self.bounds.top, self.bounds.bottom, count)
+        else:
+            spread = spread if spread is not None else 40
+            self.x[start:end] = position[0] + rng.normal(0, spread, count)
+            self.y[start:end] = position[1] + rng.normal(0, spread, count)
+
+        angle = rng.uniform(0, 2 * np.pi, count)
+        speed = rng.uniform(0.2, 1.0, count) * kind['speed']
+        self.vx[start:end] = np.cos(angle) * speed
+        self.vy[start:end] = np.sin(angle) * speed
+        self.age[start:end] = 0
+        self.life[start:end] = rng.uniform(*kind['life'], count)
+        self.phase[start:end] = rng.uniform(0, 2 * np.pi, count)
+        self.kind[start:end] = KIND_NAMES.index(kind_name)
+        self.count = end
+
+    def burst(self, event_name, position=None):
+        """Spawn the effect for a game event, if it has one"""
+        for kind_name, count in EVENT_EFFECTS.get(event_name, ()):
+            self.emit(kind_name, count, position, spread=self.bounds.width / 6)
+
+    def update(self, dt):
+        """Advance and cull all particles"""
+        n = self.count
+        if n == 0:
+            return
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+        age, kind = self.age[:n], self.kind[:n]
+
+        age += dt
+        damping = np.maximum(0.0, 1.0 - _DRAG[kind] * dt)
+        vx *= damping
+        vy *= damping
+        vy += _GRAVITY[kind] * dt
+        vx += _SWIRL[kind] * np.sin(age * 3.0 + self.phase[:n]) * dt
+        x += vx * dt
+        y += vy * dt
+
+        bounds = self.bounds
+        alive = ((age < self.life[:n])
+                 & (x >= bounds.left) & (x < bounds.right)
+                 & (y >= bounds.top) & (y < bounds.bottom))
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for array in self._arrays:
+                array[:len(keep)] = array[keep]
+            self.count = len(keep)
+
+    def render(self, surface):
+        """Draw every live particle"""
+        n = self.count
+        if n == 0:
+            return
+        kind = self.kind[:n]
+        fade = self.age[:n] / self.life[:n]
+        point = _IS_POINT[kind]
+
+        # Points: one vectorized alpha blend into the surface pixels
+        width, height = surface.get_size()
+        px = self.x[:n][point].astype(np.int32)
+        py = self.y[:n][point].astype(np.int32)
+        inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        if inside.any():
+            px, py = px[inside], py[inside]
+            point_kind = kind[point][inside]
+            alpha = (_ALPHA[point_kind] * (1.0 - fade[point][inside]))[:, None]
+            pixels = pygame.surfarray.pixels3d(surface)
+            dst = pixels[px, py].astype(np.float32)
+            pixels[px, py] = (dst + (_COLOR[point_kind] - dst) * alpha).astype(np.uint8)
+            del pixels  # Release the surface lock
+
+        # Larger soft particles: blit from the pre-rendered sprite set
+        sprite = ~point
+        if sprite.any():
+            sprite_kind = kind[sprite]
+            level = np.minimum((fade[sprite] * FADE_LEVELS).astype(np.int32), FADE_LEVELS - 1)
+            sprite_index = sprite_kind.astype(np.int32) * FADE_LEVELS + level
+            offset = _RADIUS[sprite_kind]
+            sx = (self.x[:n][sprite] - offset).astype(np.int32)
+            sy = (self.y[:n][sprite] - offset).astype(np.int32)
+            sprites = self.sprites
+            surface.blits(zip(map(sprites.__getitem__, sprite_index.tolist()),
+                              zip(sx.tolist(), sy.tolist())), doreturn=False)
+
+    def clear(self):
+        """Remove all particles"""
+        self.count = 0
@@ -0,0 +1,73 @@
+"""
+Presenter for Breach game
+Owns the window and scales the fixed-size render target onto it
+"""
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, WINDOW_RESIZABLE, FULLSCREEN, SMOOTH_SCALING
+
+
+class Presenter:
+    """Draw into `target` at the internal resolution; present() shows it
+
+    The target is letterboxed into the window at the largest size that
+    keeps its aspect ratio. Whole-number scale factors use a plain
+    nearest-neighbour scale, other sizes smoothscale; both write into a
+    scaled buffer that is only reallocated when the window size changes.
+    """
+
+    def __init__(self, render_size, fullscreen=FULLSCREEN):
+        self.render_size = tuple(render_size)
+        self.fullscreen = fullscreen
+        self.window = self._open_window()
+        self.target = pygame.Surface(self.render_size).convert()
+        self._fit()
+
+    def _open_window(self):
+        """Create (or recreate) the display surface"""
+        if self.fullscreen:
+            return pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        flags = pygame.RESIZABLE if WINDOW_RESIZABLE else 0
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
+
+    def _fit(self):
+        """Recompute the letterboxed destination for the window size"""
+        window_width, window_height = self.window.get_size()
+        render_width, render_height = self.render_size
+        scale = min(window_width / render_width, window_height / render_height)
+        size = (max(1, int(render_width * scale)), max(1, int(render_height * scale)))
+        self.dest = pygame.Rect((0, 0), size)
+        self.dest.center = (window_width // 2, window_height // 2)
+
+        self.scaled = None if size == self.render_size else pygame.Surface(size).convert()
+        self.smooth = SMOOTH_SCALING and bool(size[0] % render_width or size[1] % render_height)
+        self.window.fill((0, 0, 0))
+
+    def resized(self):
+        """Window size changed (VIDEORESIZE / WINDOWSIZECHANGED)"""
+        self.window = pygame.display.get_surface()
+        self._fit()
+
+    def toggle_fullscreen(self):
+        """Switch between fullscreen and windowed"""
+        self.fullscreen = not self.fullscreen
+        self.window = self._open_window()
+        self._fit()
+
+    def to_render(self, pos):
+        """Map a window position to render-target pixels"""
+        render_width, render_height = self.render_size
+        x = (pos[0] - self.dest.x) * render_width // self.dest.width
+        y = (pos[1] - self.dest.y) * render_height // self.dest.height
+        return min(max(x, 0), render_width - 1), min(max(y, 0), render_height - 1)
+
+    def present(self):
+        """Scale the target into the window and flip"""
+        if self.scaled is None:
+            self.window.blit(self.target, self.dest)
+        else:
+            if self.smooth:
+                pygame.transform.smoothscale(self.target, self.dest.size, self.scaled)
+            else:
+                pygame.transform.scale(self.target, self.dest.size, self.scaled)
+            self.window.blit(self.scaled, self.dest)
+        pygame.display.flip()
@@ -2,13 +2,33 @@
 Screen Manager for Breach game
 Manages switching between game screens
 """
+import random
 import pygame
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_DARK_GRAY, COLOR_WHITE, COLOR_GREEN
+from settings import (
+    FPS, PALETTE_RENDERING, COLOR_DARK_GRAY, COLOR_WHITE, COLOR_GREEN,
+    MORSE_CODE_LENGTH, MORSE_UNIT_MS, SPECIAL_RESOURCES, JOURNAL_NOTES, ADVISOR_HORIZON_HOURS
+)
 from enum import Enum
 from src.ui.ui_elements import Button, TextDisplay, Panel, StatusBar
+from src.ui.camera_feeds import CameraFeedSystem
+from src.ui.lighting import LightingCompositor
+from src.ui.particles import ParticleSystem
+from src.ui.instruments import Spectrometer, Magnetometer
+from src.ui.text_layout import TextLayout, TextView
+from src.ui.anomaly_map import AnomalyMap
+from src.ui.layout import get_layout
+from src.ui.transitions import ScreenTransitions
 from src.assets.texture_generator import get_texture_generator
+from src.assets.palette_renderer import PalettizedScene
+from src.assets.audio_manager import get_audio_manager
+from src.assets.job_system import get_job_system
+from src.assets.morse_synth import MorseSynth, MORSE_CODE
 from src.ui.main_menu_screen import MainMenuScreen
 from src.ui.difficulty_screen import DifficultyScreen
+from src.core.game_state import GameState
+from src.core.advisor import DEFAULT_OPTIONS as ADVISOR_OPTIONS
+from src.core.sanity_system import STATE_NAMES as SANITY_STATE_NAMES
+from src.core.entity_system import CLOSENESS, ROOM_INDEX
 
 
 class ScreenType(Enum):
@@ -23,16 +43,39 @@ class ScreenType(Enum):
     GAME_OVER = 7
 
 
+def anomaly_proximity(status, room=None):
+    """How close the anomaly seems (0..1), seen from one room or the whole station
+
+    The nearest manifestation sets it; a darkening mind and the night add
+    a background unease of up to 0.5 even when the rooms are empty.
+    """
+    unease = SANITY_STATE_NAMES.index(status['sanity_state']) / (len(SANITY_STATE_NAMES) - 1)
+    if status['is_night']:
+        unease = min(1.0, unease + 0.2)
+    occupancy = status['room_occupancy']
+    rooms = (room,) if room is not None else occupancy
+    nearest = max((CLOSENESS[ROOM_INDEX[name]] for name in rooms if occupancy.get(name)), default=0.0)
+    return max(nearest, unease * 0.5)
+
+
+def sensor_accuracy(status):
+    """Total 'sensor_accuracy' bonus from active modifiers (isotopes)"""
+    return sum(modifier['additive'] for modifier in status['modifiers']
+               if modifier['target'] == 'sensor_accuracy')
+
+
 class BaseScreen:
     """Base class for all screens"""
 
+    # Frames per second the screen needs to look right; 0 = static
+    animation_fps = FPS
+
     def __init__(self, game_state):
         self.game_state = game_state
-        self.bg_texture = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.bg_texture.fill((20, 20, 30))
+        self.bg_texture = get_texture_generator().generate_screen_background(*get_layout().size)
 
-    def handle_event(self, event):
-        """Handle event - override in subclass"""
+    def handle_action(self, action, value):
+        """Handle a named input action - override in subclass"""
         pass
 
     def update(self, game_state):
@@ -49,18 +92,18 @@ class ObservationScreen(BaseScreen):
 
     def __init__(self, game_state):
         super().__init__(game_state)
-        self.title_font = pygame.font.Font(None, 48)
-        self.font = pygame.font.Font(None, 20)
-        self.small_font = pygame.font.Font(None, 16)
+        layout = get_layout()
+        self.title_font = layout.font(48)
+        self.font = layout.font(20)
+        self.small_font = layout.font(16)
 
         # Create UI elements
-        self.title_bar = pygame.Surface((SCREEN_WIDTH, 60))
-        self.title_bar.fill((30, 30, 50))
+        self.title_bar = get_texture_generator().generate_title_bar(layout.width, layout.px(60))
 
         self.main_panel = Panel(50, 100, 1180, 600, "OBSERVATION ROOM")
 
         # Window view area (large central area)
-        self.window_rect = pygame.Rect(70, 130, 800, 550)
+        self.window_rect = layout.rect(70, 130, 800, 550)
 
         # Status bars (right side)
         self.fuel_bar = StatusBar(900, 180, 250, 20, "Fuel", (255, 220, 50))
@@ -73,34 +116,64 @@ class ObservationScreen(BaseScreen):
         self.time_display = TextDisplay(900, 150, "Time: 08:00", 18, COLOR_WHITE)
         self.day_display = TextDisplay(900, 500, "Day: 1/20", 18, COLOR_WHITE)
         self.status_display = TextDisplay(900, 530, "Status: Stable", 18, COLOR_GREEN)
+        self.forecast_display = TextDisplay(900, 560, "Fuel critical in: --", 18, COLOR_WHITE)
+
+        self.border_width = max(1, layout.px(2))
+        self.view_label_pos = layout.pos(70, 695)
 
         self.current_view = 'forest'
+        self.sanity_state = 'stable'
+
+        # Window views come from the shared texture cache; with
+        # PALETTE_RENDERING they are kept 8-bit so sanity color effects are
+        # palette swaps. Views not baked yet are generated in the background
+        self.views = {}
+        self._request_views()
+
+        # Anomaly particles drift across the window
+        self.particles = ParticleSystem(self.window_rect)
+        self.seen_events = 0
+        self.last_update = None
 
         # Hint text
         self.hint_text = TextDisplay(70, 690, "Press 1-5 to switch screens", 14, COLOR_WHITE)
 
-    def handle_event(self, event):
+    def _request_views(self):
+        """Pick up window views as they become ready"""
+        textures = get_texture_generator()
+        for name in ('forest', 'control_room', 'table'):
+            if name in self.views:
+                continue
+            if PALETTE_RENDERING:
+                view = textures.request('quantized_view', self.window_rect.size, 'observation', name=name)
+                if view is not None:
+                    self.views[name] = PalettizedScene.from_quantized(view)
+            else:
+                self.views[name] = textures.get('view', self.window_rect.size, name=name)
+
+    def handle_action(self, action, value):
         """Handle input"""
-        if event.type == pygame.KEYDOWN:
-            # Switch views with arrow keys
-            if event.key == pygame.K_UP:
-                if self.current_view == 'forest':
-                    self.current_view = 'control_room'
-                elif self.current_view == 'control_room':
-                    self.current_view = 'table'
-                else:
-                    self.current_view = 'forest'
-            elif event.key == pygame.K_DOWN:
-                if self.current_view == 'forest':
-                    self.current_view = 'table'
-                elif self.current_view == 'table':
-                    self.current_view = 'control_room'
-                else:
-                    self.current_view = 'forest'
+        # Switch views with arrow keys
+        if action == 'up':
+            if self.current_view == 'forest':
+                self.current_view = 'control_room'
+            elif self.current_view == 'control_room':
+                self.current_view = 'table'
+            else:
+                self.current_view = 'forest'
+        elif action == 'down':
+            if self.current_view == 'forest':
+                self.current_view = 'table'
+            elif self.current_view == 'table':
+                self.current_view = 'control_room'
+            else:
+                self.current_view = 'forest'
 
     def update(self, game_state):
         """Update observation screen"""
         status = game_state.get_status()
+        if len(self.views) < 3:
+            self._request_views()
 
         # Update bars with actual values
         self.fuel_bar.set_value(status['resources']['fuel'], 100)
@@ -125,6 +198,25 @@ class ObservationScreen(BaseScreen):
 
         self.status_display.color = sanity_color
         self.status_display.update(f"Status: {sanity_state.upper()}")
+        self.sanity_state = sanity_state
+
+        # Show events that happen while the window is being watched; ones
+        # missed on other screens are only caught up on
+        now = pygame.time.get_ticks()
+        watching = self.last_update is not None and now - self.last_update < 500
+        if status['event_count'] > self.seen_events and watching:
+            self.particles.burst(status['last_event'])
+        self.seen_events = status['event_count']
+        self.particles.update((now - self.last_update) / 1000.0 if watching else 0.0)
+        self.last_update = now
+
+        # Fuel forecast (cached in ResourceManager, cheap to query every frame)
+        hours_left = status['fuel_critical_in']
+        if hours_left is None:
+            self.forecast_display.update("Fuel critical in: --")
+        else:
+            self.forecast_display.update(
+                f"Fuel critical in: {int(hours_left)}h {int(hours_left * 60) % 60:02d}m")
 
     def render(self, surface):
         """Render observation screen"""
@@ -135,14 +227,23 @@ class ObservationScreen(BaseScreen):
 
         # Draw title
         title_surf = self.title_font.render("OBSERVATION ROOM", True, COLOR_GREEN)
-        surface.blit(title_surf, (30, 10))
+        surface.blit(title_surf, get_layout().pos(30, 10))
 
         # Draw main panel
         self.main_panel.render(surface)
 
-        # Draw window with simple view
-        pygame.draw.rect(surface, (100, 100, 100), self.window_rect, 2)
-        pygame.draw.rect(surface, (40, 60, 80), self.window_rect)
+        # Draw window view
+        view = self.views.get(self.current_view)
+        if view is None:
+            surface.fill((20, 20, 30), self.window_rect)  # Still being generated
+        elif PALETTE_RENDERING:
+            view.render(surface, self.window_rect.topleft, self.sanity_state)
+        else:
+            surface.blit(view, self.window_rect)
+        surface.set_clip(self.window_rect)
+        self.particles.render(surface)
+        surface.set_clip(None)
+        pygame.draw.rect(surface, (100, 100, 100), self.window_rect, self.border_width)
 
         # Draw status bars
         self.fuel_bar.render(surface)
@@ -155,10 +256,11 @@ class ObservationScreen(BaseScreen):
         self.time_display.render(surface)
         self.day_display.render(surface)
         self.status_display.render(surface)
+        self.forecast_display.render(surface)
 
         # Draw view label
         view_label = self.small_font.render(f"View: {self.current_view.upper()}", True, (255, 255, 0))
-        surface.blit(view_label, (70, 695))
+        surface.blit(view_label, self.view_label_pos)
 
         # Draw hint
         self.hint_text.render(surface)
@@ -167,12 +269,12 @@ class ObservationScreen(BaseScreen):
 class ControlPanelScreen(BaseScreen):
     """Control panel screen"""
 
-    def __init__(self, game_state):
+    def __init__(self, game_state, advisor=None, on_forecast=None):
         super().__init__(game_state)
-        self.title_font = pygame.font.Font(None, 48)
-        self.font = pygame.font.Font(None, 20)
-        self.title_bar = pygame.Surface((SCREEN_WIDTH, 60))
-        self.title_bar.fill((30, 30, 50))
+        layout = get_layout()
+        self.title_font = layout.font(48)
+        self.font = layout.font(20)
+        self.title_bar = get_texture_generator().generate_title_bar(layout.width, layout.px(60))
 
         self.main_panel = Panel(50, 100, 900, 600, "CONTROL PANEL")
 
@@ -184,17 +286,72 @@ class ControlPanelScreen(BaseScreen):
         self.power_up_btn = Button(500, 180, 150, 40, "Increase Power", lambda: None)
         self.power_down_btn = Button(680, 180, 150, 40, "Decrease Power", lambda: None)
 
+        # Lookahead forecast: survival odds of each day-phase choice
+        self.advisor = advisor
+        self.forecast_panel = Panel(100, 280, 800, 400, f"Forecast ({ADVISOR_HORIZON_HOURS}h)")
+        self.forecast_btn = Button(680, 320, 200, 40, "Run Forecast", on_forecast)
+        self.forecast_status = TextDisplay(120, 330, "", 18, COLOR_WHITE)
+        self.forecast_lines = [TextDisplay(120, 390 + 40 * i, "", 18, COLOR_WHITE)
+                               for i in range(len(ADVISOR_OPTIONS))]
+
+    def handle_action(self, action, value):
+        """Handle input"""
+        if action == 'point':
+            self.forecast_btn.point(value)
+        elif action == 'click':
+            self.forecast_btn.click(value)
+        elif action == 'release':
+            self.forecast_btn.release()
+        elif action == 'confirm' and self.forecast_btn.callback:
+            self.forecast_btn.callback()
+
+    def update(self, game_state):
+        """Update control panel screen"""
+        self.forecast_btn.update()
+        if self.advisor is None:
+            self.forecast_status.update("Forecast offline")
+            return
+
+        # The owner polls the advisor every frame; just show where it got to
+        results = self.advisor.get_results()
+        completed = sum(result['completed'] for result in results.values())
+        runs = sum(result['runs'] for result in results.values())
+        if game_state.get_status()['is_night'] and completed == runs:
+            self.forecast_status.update("Forecasts run during the day")
+        elif not results:
+            self.forecast_status.update("No forecast yet (ENTER)")
+        elif completed < runs:
+            self.forecast_status.update(f"Simulating... {completed}/{runs}")
+        else:
+            self.forecast_status.update(f"{completed} futures simulated")
+
+        for line, option in zip(self.forecast_lines, ADVISOR_OPTIONS):
+            result = results.get(option)
+            label = option.replace('_', ' ').capitalize()
+            if result is None or result['survival'] is None:
+                line.update(f"{label}: -")
+            else:
+                # "Survive" = not failed by the horizon; some runs are still undecided
+                line.update(f"{label}: {result['survival'] * 100:.0f}% survive "
+                            f"({result['ongoing'] * 100:.0f}% undecided), "
+                            f"likely {result['expected_ending']}")
+
     def render(self, surface):
         """Render control panel screen"""
         super().render(surface)
         surface.blit(self.title_bar, (0, 0))
         title_surf = self.title_font.render("CONTROL PANEL", True, COLOR_GREEN)
-        surface.blit(title_surf, (30, 10))
+        surface.blit(title_surf, get_layout().pos(30, 10))
         self.main_panel.render(surface)
         self.power_mode_display.render(surface)
         self.generator_output.render(surface)
         self.power_up_btn.render(surface)
         self.power_down_btn.render(surface)
+        self.forecast_panel.render(surface)
+        self.forecast_btn.render(surface)
+        self.forecast_status.render(surface)
+        for line in self.forecast_lines:
+            line.render(surface)
 
 
 class MonitorsScreen(BaseScreen):
@@ -202,11 +359,11 @@ class MonitorsScreen(BaseScreen):
 
     def __init__(self, game_state):
         super().__init__(game_state)
-        self.title_font = pygame.font.Font(None, 48)
-        self.font = pygame.font.Font(None, 16)
-        self.small_font = pygame.font.Font(None, 14)
-        self.title_bar = pygame.Surface((SCREEN_WIDTH, 60))
-        self.title_bar.fill((30, 30, 50))
+        layout = get_layout()
+        self.title_font = layout.font(48)
+        self.font = layout.font(16)
+        self.small_font = layout.font(14)
+        self.title_bar = get_texture_generator().generate_title_bar(layout.width, layout.px(60))
 
         self.main_panel = Panel(50, 100, 1180, 600, "ANOMALY MONITORS")
 
@@ -218,19 +375,26 @@ class MonitorsScreen(BaseScreen):
             Panel(640, 420, 540, 240, "Roof"),
         ]
 
+        # Each feed renders offscreen inside its panel, below the title
+        self.feeds = CameraFeedSystem([
+            (monitor.title, pygame.Rect(monitor.x + layout.px(10), monitor.y + layout.px(36),
+                                        monitor.width - layout.px(20), monitor.height - layout.px(46)))
+            for monitor in self.monitors
+        ])
+
         # Battery display
         self.battery_display = TextDisplay(70, 680, "Battery: 100%", 16, (255, 255, 0))
         self.hint_text = TextDisplay(70, 710, "UP/DOWN ARROWS: Switch cameras", 14, COLOR_WHITE)
 
         self.selected_monitor = 0
+        self.selection_width = max(1, layout.px(4))
 
-    def handle_event(self, event):
+    def handle_action(self, action, value):
         """Handle input"""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_UP:
-                self.selected_monitor = (self.selected_monitor - 1) % 4
-            elif event.key == pygame.K_DOWN:
-                self.selected_monitor = (self.selected_monitor + 1) % 4
+        if action == 'up':
+            self.selected_monitor = (self.selected_monitor - 1) % 4
+        elif action == 'down':
+            self.selected_monitor = (self.selected_monitor + 1) % 4
 
     def update(self, game_state):
         """Update monitor screen"""
@@ -238,21 +402,29 @@ class MonitorsScreen(BaseScreen):
         battery_pct = (status['resources']['batteries'] / 20) * 100
         self.battery_display.update(f"Battery: {battery_pct:.0f}%")
 
+        # Static gets worse as batteries drain and as manifestations close in
+        self.feeds.set_conditions(battery_pct / 100,
+                                  [anomaly_proximity(status, monitor.title) for monitor in self.monitors])
+        self.feeds.set_enabled(status['resources']['batteries'] > 0)
+        self.feeds.update(self.selected_monitor, f"DAY {status['day']}  {status['time']}")
+
     def render(self, surface):
         """Render monitors screen"""
         super().render(surface)
         surface.blit(self.title_bar, (0, 0))
         title_surf = self.title_font.render("ANOMALY MONITORS", True, COLOR_GREEN)
-        surface.blit(title_surf, (30, 10))
+        surface.blit(title_surf, get_layout().pos(30, 10))
         self.main_panel.render(surface)
 
         # Draw all 4 monitors
-        for i, monitor in enumerate(self.monitors):
+        for monitor in self.monitors:
             monitor.render(surface)
+        self.feeds.render(surface)
 
-            # Highlight selected monitor
+        # Highlight selected monitor
+        for i, monitor in enumerate(self.monitors):
             if i == self.selected_monitor:
-                pygame.draw.rect(surface, COLOR_GREEN, monitor.rect, 4)
+                pygame.draw.rect(surface, COLOR_GREEN, monitor.rect, self.selection_width)
 
         # Draw battery and hints
         self.battery_display.render(surface)
@@ -262,11 +434,11 @@ class MonitorsScreen(BaseScreen):
 class LaboratoryScreen(BaseScreen):
     """Laboratory screen with mini-games"""
 
-    def __init__(self, game_state):
+    def __init__(self, game_state, on_calibrate_callback):
         super().__init__(game_state)
-        self.title_font = pygame.font.Font(None, 48)
-        self.title_bar = pygame.Surface((SCREEN_WIDTH, 60))
-        self.title_bar.fill((30, 30, 50))
+        layout = get_layout()
+        self.title_font = layout.font(48)
+        self.title_bar = get_texture_generator().generate_title_bar(layout.width, layout.px(60))
 
         self.main_panel = Panel(50, 100, 900, 600, "LABORATORY")
 
@@ -276,19 +448,97 @@ class LaboratoryScreen(BaseScreen):
         self.magnetometer_panel = Panel(740, 180, 150, 250, "Magnetometer")
         self.chemistry_panel = Panel(100, 480, 790, 180, "Chemistry")
 
+        # Instruments
+        self.spectrometer = Spectrometer(layout.rect(110, 215, 230, 115))
+        self.magnetometer = Magnetometer(layout.rect(750, 215, 130, 205))
+        self.spectrum_score = TextDisplay(110, 338, "Mark the peaks", 16, COLOR_WHITE)
+        self.calibrate_btn = Button(110, 382, 230, 36, "Calibrate (isotope)", on_calibrate_callback)
+        self.last_update = None
+
+        # Radio: incoming message and the player's keyed reply
+        self.synth = MorseSynth(get_audio_manager().reserved_channel())
+        letters = [char for char in MORSE_CODE if char.isalpha()]
+        self.message = ''.join(random.choice(letters) for _ in range(MORSE_CODE_LENGTH))
+        self.synth.prepare(self.message, get_job_system(), 'laboratory')
+        self.keyed = ''
+        self.key_pressed_at = None
+        self.key_released_at = None
+        self.radio_status = TextDisplay(435, 220, "ENTER: Receive", 16, COLOR_WHITE)
+        self.radio_hint = TextDisplay(435, 245, "SPACE: Key", 16, COLOR_WHITE)
+        self.radio_keyed = TextDisplay(435, 290, "", 18, COLOR_GREEN)
+
         # Info display
         self.isotope_display = TextDisplay(100, 680, "Isotopes: 3/8", 16, COLOR_WHITE)
 
+    def handle_action(self, action, value):
+        """Handle input"""
+        if action == 'point':
+            self.calibrate_btn.point(value)
+        elif action == 'click':
+            if not self.spectrometer.click(value):
+                self.calibrate_btn.click(value)
+        elif action == 'release':
+            self.calibrate_btn.release()
+        elif action == 'confirm':
+            length = self.synth.play_message(self.message)
+            self.radio_status.update(f"Receiving... {length:.0f}s" if length else "Radio silent")
+        elif action == 'morse_key':
+            now = pygame.time.get_ticks()
+            # A pause longer than a letter gap starts a new letter
+            if self.key_released_at is not None and now - self.key_released_at > MORSE_UNIT_MS * 3:
+                self.keyed += ' '
+            self.key_pressed_at = now
+            self.synth.key_down()
+        elif action == 'morse_release' and self.key_pressed_at is not None:
+            self.synth.key_up()
+            now = pygame.time.get_ticks()
+            self.keyed += '.' if now - self.key_pressed_at < MORSE_UNIT_MS * 2 else '-'
+            self.key_pressed_at = None
+            self.key_released_at = now
+            self.radio_keyed.update(self.keyed[-24:])
+
+    def update(self, game_state):
+        """Update laboratory screen"""
+        status = game_state.get_status()
+        isotopes = status['special_resources']['isotopes']
+        self.isotope_display.update(f"Isotopes: {isotopes}/{SPECIAL_RESOURCES['isotopes']['max']}")
+
+        accuracy = sensor_accuracy(status)
+        self.spectrometer.set_calibration(accuracy)
+        self.magnetometer.set_calibration(accuracy)
+        self.magnetometer.set_proximity(anomaly_proximity(status))
+
+        now = pygame.time.get_ticks()
+        dt = (now - self.last_update) / 1000.0 if self.last_update is not None else 0.0
+        self.last_update = now
+        self.spectrometer.update()
+        self.magnetometer.update(min(dt, 0.5))  # Don't replay a long absence
+
+        score = self.spectrometer.score
+        if score is not None:
+            self.spectrum_score.update(f"Match: {score * 100:.0f}%  (click: new sample)")
+        else:
+            marked = len(self.spectrometer.markers)
+            self.spectrum_score.update(f"Peaks marked: {marked}/{self.spectrometer.peaks}")
+        self.calibrate_btn.update()
+
     def render(self, surface):
         """Render laboratory screen"""
         super().render(surface)
         surface.blit(self.title_bar, (0, 0))
         title_surf = self.title_font.render("LABORATORY", True, COLOR_GREEN)
-        surface.blit(title_surf, (30, 10))
+        surface.blit(title_surf, get_layout().pos(30, 10))
         self.main_panel.render(surface)
         self.spectrometer_panel.render(surface)
+        self.spectrometer.render(surface)
+        self.spectrum_score.render(surface)
+        self.calibrate_btn.render(surface)
         self.radio_panel.render(surface)
+        self.radio_status.render(surface)
+        self.radio_hint.render(surface)
+        self.radio_keyed.render(surface)
         self.magnetometer_panel.render(surface)
+        self.magnetometer.render(surface)
         self.chemistry_panel.render(surface)
         self.isotope_display.render(surface)
 
@@ -298,10 +548,10 @@ class JournalScreen(BaseScreen):
 
     def __init__(self, game_state):
         super().__init__(game_state)
-        self.title_font = pygame.font.Font(None, 48)
-        self.font = pygame.font.Font(None, 18)
-        self.title_bar = pygame.Surface((SCREEN_WIDTH, 60))
-        self.title_bar.fill((30, 30, 50))
+        layout = get_layout()
+        self.title_font = layout.font(48)
+        self.font = layout.font(18)
+        self.title_bar = get_texture_generator().generate_title_bar(layout.width, layout.px(60))
 
         self.main_panel = Panel(50, 100, 900, 600, "JOURNAL & ARCHIVE")
 
@@ -311,5 +561,301 @@ class JournalScreen(BaseScreen):
         self.director_logs_panel = Panel(740, 180, 150, 250, "Director's Logs")
         self.anomaly_map_panel = Panel(100, 480, 790, 180, "Anomaly Map")
 
+        # Text inside the panels, below their titles
+        self.layout = TextLayout(self.font)
+        self.duty_log = TextView(layout.rect(110, 215, 250, 205), self.layout, COLOR_WHITE, typewriter=True)
+        self.personal_notes = TextView(layout.rect(430, 215, 250, 180), self.layout, COLOR_WHITE)
+        self.personal_notes.set_text(JOURNAL_NOTES)
+        self.director_logs = TextView(layout.rect(750, 215, 130, 205), self.layout, COLOR_WHITE)
+        self.notes_page = TextDisplay(430, 405, "", 16, COLOR_WHITE)
+        self.anomaly_map = AnomalyMap(layout.rect(110, 512, 770, 138))
+        self.hint_text = TextDisplay(
+            420, 680, "UP/DOWN: Scroll log   LEFT/RIGHT: Turn page   MAP: Drag, wheel to zoom", 14, COLOR_WHITE)
+
+        self.entries = []
+        self.event_count = 0
+        self.last_record = None  # Newest event the duty log shows
+        self.logs = None
+        self.last_update = None
+
         # Log counter
-        self.log_count = TextDisplay(100, 680, "Logs Found: 2/20", 16, COLOR
+        self.log_count = TextDisplay(100, 680, "Logs Found: 0/20", 16, COLOR_WHITE)
+
+    def handle_action(self, action, value):
+        """Handle input"""
+        if action == 'up':
+            self.duty_log.scroll(-1)
+        elif action == 'down':
+            self.duty_log.scroll(1)
+        elif action == 'left':
+            self.personal_notes.turn_page(-1)
+        elif action == 'right':
+            self.personal_notes.turn_page(1)
+        elif action == 'confirm':
+            self.duty_log.finish()
+        elif action == 'point':
+            self.anomaly_map.point(value)
+        elif action == 'click':
+            self.anomaly_map.click(value)
+        elif action == 'release':
+            self.anomaly_map.release()
+        elif action == 'wheel':
+            self.anomaly_map.wheel(value)
+
+    def update(self, game_state):
+        """Update journal screen"""
+        status = game_state.get_status()
+        logs = status['special_resources']['director_logs']
+        max_logs = SPECIAL_RESOURCES['director_logs']['max']
+        self.log_count.update(f"Logs Found: {logs}/{max_logs}")
+        if logs != self.logs:
+            self.logs = logs
+            self.director_logs.set_text(
+                f"{logs} of {max_logs} recovered." if logs else "No logs recovered yet.")
+
+        # One duty log line per event, stamped with when it happened. The
+        # status carries the whole (immutable) log, so events while another
+        # screen was up are not lost; a rewind republishes it from scratch
+        events = status['event_log']
+        count = self.event_count
+        if count > len(events) or (count and events[count - 1] is not self.last_record):
+            self.entries = []
+            count = 0
+        for record in events[count:]:
+            self.entries.append(f"Day {record['day']} {record['time']}: {record['name']}")
+        if count != len(events) or not self.entries:
+            self.event_count = len(events)
+            self.last_record = events[-1] if events else None
+            self.duty_log.set_text('\n'.join(self.entries) or "Nothing to report.", scroll_to_end=True)
+
+        now = pygame.time.get_ticks()
+        if self.last_update is not None:
+            self.duty_log.update((now - self.last_update) / 1000.0)
+        self.last_update = now
+
+        page, pages = self.personal_notes.page_number()
+        self.notes_page.update(f"Page {page}/{pages}")
+
+        # Observations are append-only (rewind truncates), so the map only
+        # picks up the new tail
+        self.anomaly_map.sync(status['anomalies'])
+
+    def render(self, surface):
+        """Render journal screen"""
+        super().render(surface)
+        surface.blit(self.title_bar, (0, 0))
+        title_surf = self.title_font.render("JOURNAL & ARCHIVE", True, COLOR_GREEN)
+        surface.blit(title_surf, get_layout().pos(30, 10))
+        self.main_panel.render(surface)
+        self.duty_log_panel.render(surface)
+        self.duty_log.render(surface)
+        self.personal_notes_panel.render(surface)
+        self.personal_notes.render(surface)
+        self.notes_page.render(surface)
+        self.director_logs_panel.render(surface)
+        self.director_logs.render(surface)
+        self.anomaly_map_panel.render(surface)
+        self.anomaly_map.render(surface)
+        self.log_count.render(surface)
+        self.hint_text.render(surface)
+
+
+class GameOverScreen(BaseScreen):
+    """Shown when the run ends"""
+
+    animation_fps = 0
+
+    def __init__(self, game_state, on_continue_callback):
+        super().__init__(game_state)
+        layout = get_layout()
+        self.title_font = layout.font(96)
+        self.font = layout.font(32)
+        self.on_continue_callback = on_continue_callback
+        self.ending = None
+        self.day = 1
+
+    def handle_action(self, action, value):
+        """Return to the main menu on ENTER"""
+        if action == 'confirm':
+            self.on_continue_callback()
+
+    def update(self, game_state):
+        """Update game over screen"""
+        status = game_state.get_status()
+        self.ending = status['ending']
+        self.day = status['day']
+
+    def render(self, surface):
+        """Render game over screen"""
+        super().render(surface)
+        layout = get_layout()
+        title_surf = self.title_font.render("GAME OVER", True, COLOR_GREEN)
+        surface.blit(title_surf, title_surf.get_rect(midtop=layout.anchor(0.5, 0, 0, 220)))
+
+        ending_text = f"Ending: {(self.ending or 'unknown').upper()} - Day {self.day}"
+        ending_surf = self.font.render(ending_text, True, COLOR_WHITE)
+        surface.blit(ending_surf, ending_surf.get_rect(midtop=layout.anchor(0.5, 0, 0, 340)))
+
+        hint_surf = self.font.render("ENTER: Main menu", True, COLOR_WHITE)
+        surface.blit(hint_surf, hint_surf.get_rect(midtop=layout.anchor(0.5, 0, 0, 420)))
+
+
+class ScreenManager:
+    """Manages all screens and switching between them"""
+
+    # Station each game screen puts the player at
+    SCREEN_STATIONS = {
+        ScreenType.OBSERVATION: 'observation',
+        ScreenType.CONTROL_PANEL: 'control_panel',
+        ScreenType.MONITORS: 'monitors',
+        ScreenType.LABORATORY: 'laboratory',
+        ScreenType.JOURNAL: 'journal',
+    }
+    STATION_SCREENS = {station: screen for screen, station in SCREEN_STATIONS.items()}
+
+    def __init__(self, game_state, on_game_created=None, advisor=None):
+        self.game_state = game_state
+        # Called with each new GameState before its first update
+        self.on_game_created = on_game_created
+        self.advisor = advisor  # LookaheadAdvisor; polled by the owner
+        self.advice_due = False  # Morning came; forecast on the next update()
+        # Where game commands go; replaced by SimulationThread.submit when
+        # the simulation runs on its own thread
+        self.command_sink = None
+        self.lighting = LightingCompositor()
+        self.lighting.prebake(get_layout().size, get_job_system())
+        self.transitions = ScreenTransitions()
+        self.frame = None  # Surface the last frame was rendered into
+        self.frame_screen = None  # Screen shown in that frame
+        self.screens = {
+            ScreenType.MAIN_MENU: MainMenuScreen(self._on_new_game, self._on_exit),
+            ScreenType.DIFFICULTY: DifficultyScreen(self._on_difficulty_selected),
+        }
+        self._create_game_screens()
+        self.current_screen = ScreenType.MAIN_MENU
+        self._focus_jobs()
+
+    def _create_game_screens(self):
+        """Create station screens bound to the current game state"""
+        self.transitions.clear()  # Snapshots of the old screens are stale
+        self.screens[ScreenType.OBSERVATION] = ObservationScreen(self.game_state)
+        self.screens[ScreenType.CONTROL_PANEL] = ControlPanelScreen(
+            self.game_state, self.advisor, self.request_advice)
+        self.screens[ScreenType.MONITORS] = MonitorsScreen(self.game_state)
+        self.screens[ScreenType.LABORATORY] = LaboratoryScreen(
+            self.game_state, lambda: self.send_command('use_isotope'))
+        self.screens[ScreenType.JOURNAL] = JournalScreen(self.game_state)
+        self.screens[ScreenType.GAME_OVER] = GameOverScreen(
+            self.game_state, lambda: self.switch_screen(ScreenType.MAIN_MENU))
+
+    def _on_new_game(self):
+        """Main menu: NEW GAME"""
+        self.switch_screen(ScreenType.DIFFICULTY)
+
+    def _on_exit(self):
+        """Main menu: EXIT"""
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    def _on_difficulty_selected(self, difficulty):
+        """Difficulty screen: start a fresh game"""
+        self.game_state = GameState(difficulty)
+        self.command_sink = None  # Any simulation thread belongs to the old game
+        if self.on_game_created is not None:
+            self.on_game_created(self.game_state)
+        self._create_game_screens()
+        if self.advisor is not None:
+            self.advisor.clear()
+            self.advice_due = False
+            self.game_state.time_manager.add_phase_listener(self._on_phase_change)
+            self.request_advice()
+        self.switch_screen(ScreenType.OBSERVATION)
+
+    def _on_phase_change(self, is_night):
+        """New forecast every morning (may run on the simulation thread)
+
+        Only flags it: this runs inside the morning tick, before that tick's
+        complete_day() has moved the game to the new day.
+        """
+        if not is_night:
+            self.advice_due = True
+
+    def request_advice(self):
+        """Have the advisor evaluate the day's choices (ignored at night)"""
+        if self.advisor is not None:
+            self.send_command('consult', self.advisor)
+
+    def switch_screen(self, screen_type):
+        """Switch to another screen"""
+        if screen_type != self.current_screen:
+            # Remember what the old screen looked like; show the new one's
+            # last frame right away if it was visited recently
+            if self.frame is not None and self.frame_screen == self.current_screen:
+                self.transitions.store(self.current_screen, self.frame)
+            self.transitions.begin(screen_type)
+        self.current_screen = screen_type
+        self._focus_jobs()
+        if screen_type in self.SCREEN_STATIONS:
+            self.send_command('set_focus', self.SCREEN_STATIONS[screen_type])
+
+    def _focus_jobs(self):
+        """Background generation serves the screen on view, then recently left stations"""
+        active = self.SCREEN_STATIONS.get(self.current_screen)
+        recent = [self.SCREEN_STATIONS[screen] for screen in reversed(self.transitions.snapshots)
+                  if screen in self.SCREEN_STATIONS and screen != self.current_screen]
+        # Nothing visited yet: a new game starts in the observation room
+        get_job_system().set_focus(active, recent or ['observation'])
+
+    def send_command(self, method_name, *args):
+        """Call a GameState method, via the command sink if one is set"""
+        if self.command_sink is not None:
+            self.command_sink(method_name, *args)
+        else:
+            getattr(self.game_state, method_name)(*args)
+
+    def get_animation_fps(self):
+        """Frame rate the active screen asks for (0 = static)"""
+        if self.transitions.is_active():
+            return FPS  # Cross-fades need every frame
+        return self.screens[self.current_screen].animation_fps
+
+    def is_playing(self):
+        """Check if one of the station screens is active"""
+        return self.current_screen in self.SCREEN_STATIONS
+
+    def handle_action(self, action, value=None):
+        """Route a named input action to the active screen"""
+        if action == 'point':
+            self.lighting.pointer = value
+        if action == 'station':
+            if self.is_playing():
+                self.switch_screen(self.STATION_SCREENS[value])
+            return
+
+        self.screens[self.current_screen].handle_action(action, value)
+
+    def update(self, state=None):
+        """Update the active screen
+
+        state: anything with get_status(); defaults to the live GameState.
+        """
+        state = state or self.game_state
+        if self.advice_due:
+            self.advice_due = False
+            self.request_advice()
+        if self.is_playing():
+            status = state.get_status()
+            if status['game_over']:
+                self.switch_screen(ScreenType.GAME_OVER)
+            self.lighting.update(status['resources'])
+        self.screens[self.current_screen].update(state)
+
+    def render(self, surface):
+        """Render the active screen, or its snapshot right after a switch"""
+        self.frame = surface
+        self.frame_screen = self.current_screen
+        if self.transitions.show_snapshot(surface):
+            return
+        self.screens[self.current_screen].render(surface)
+        if self.is_playing():
+            self.lighting.apply(surface)
+        self.transitions.overlay(surface)
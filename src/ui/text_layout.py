@@ -0,0 +1,194 @@
+"""
+Text Layout for Breach game
+Word wrapping, pagination and typewriter reveal with cached measurements
+"""
+from collections import OrderedDict
+import pygame
+from settings import TEXT_LAYOUT_CACHE, TYPEWRITER_CPS
+
+
+class TextLayout:
+    """Line breaking for one font
+
+    Word widths are measured once per font; wrapped results are cached per
+    (text, width) in a small LRU, so re-laying out a log that has not
+    changed is a dict lookup.
+    """
+
+    def __init__(self, font, cache_size=TEXT_LAYOUT_CACHE):
+        self.font = font
+        self.line_height = font.get_linesize()
+        self.space_width = font.size(' ')[0]
+        self.widths = {}  # word -> pixel width
+        self.layouts = OrderedDict()  # (text, width) -> tuple of lines
+        self.cache_size = cache_size
+
+    def measure(self, word):
+        """Pixel width of a word (cached)"""
+        width = self.widths.get(word)
+        if width is None:
+            width = self.widths[word] = self.font.size(word)[0]
+        return width
+
+    def wrap(self, text, width):
+        """Break text into lines no wider than width; '\\n' starts a new paragraph"""
+        key = (text, width)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            self.layouts.move_to_end(key)
+            return lines
+
+        lines = []
+        for paragraph in text.split('\n'):
+            lines.extend(self._wrap_paragraph(paragraph, width))
+        lines = self.layouts[key] = tuple(lines)
+        if len(self.layouts) > self.cache_size:
+            self.layouts.popitem(last=False)
+        return lines
+
+    def _wrap_paragraph(self, paragraph, width):
+        """Greedy wrap of a single paragraph"""
+        words = paragraph.split()
+        if not words:
+            return ['']
+        lines = []
+        line = []
+        line_width = 0
+        space = self.space_width
+        for word in words:
+            word_width = self.measure(word)
+            if word_width > width:
+                # A word wider than the box is split by characters
+                if line:
+                    lines.append(' '.join(line))
+                    line, line_width = [], 0
+                pieces = self._split_word(word, width)
+                lines.extend(pieces[:-1])
+                word = pieces[-1]
+                word_width = self.measure(word)
+            elif line and line_width + space + word_width > width:
+                lines.append(' '.join(line))
+                line, line_width = [], 0
+            line_width += (space if line else 0) + word_width
+            line.append(word)
+        lines.append(' '.join(line))
+        return lines
+
+    def _split_word(self, word, width):
+        """Split an over-long word into pieces that fit"""
+        pieces = []
+        start = 0
+        for end in range(1, len(word) + 1):
+            if end - start > 1 and self.font.size(word[start:end])[0] > width:
+                pieces.append(word[start:end - 1])
+                start = end - 1
+        pieces.append(word[start:])
+        return pieces
+
+
+class TextView:
+    """Scrollable, paginated block of text inside a rect
+
+    Each line is rendered to a surface once per text; the visible window is
+    composed into a cached page surface that is rebuilt only when the text,
+    scroll position or revealed length changes. While a typewriter reveal
+    is running, only the partially revealed line is rendered each frame.
+    """
+
+    def __init__(self, rect, layout, color=(255, 255, 255), typewriter=False):
+        self.rect = pygame.Rect(rect)
+        self.layout = layout
+        self.color = color
+        self.typewriter = typewriter
+        self.lines_per_page = max(1, self.rect.height // layout.line_height)
+
+        self.text = ''
+        self.lines = ()
+        self.line_surfaces = {}  # line index -> rendered surface
+        self.offset = 0  # First visible line
+        self.revealed = 0.0  # Characters shown so far (typewriter)
+        self.line_starts = [0]  # Character index where each line starts
+        self.page = None
+        self.page_key = None
+
+    def set_text(self, text, scroll_to_end=False):
+        """Replace the text; already revealed characters stay revealed"""
+        if text == self.text:
+            return
+        keep = text.startswith(self.text)
+        self.text = text
+        self.lines = self.layout.wrap(text, self.rect.width)
+        self.line_surfaces = {}
+        self.line_starts = [0]
+        for line in self.lines:
+            self.line_starts.append(self.line_starts[-1] + len(line))
+        if not keep or not self.typewriter:
+            self.revealed = self.line_starts[-1] if not self.typewriter else 0.0
+        self.offset = self.max_offset() if scroll_to_end else min(self.offset, self.max_offset())
+        # Never type out lines that are scrolled out of view
+        self.revealed = max(self.revealed, self.line_starts[self.offset])
+        self.page_key = None
+
+    def max_offset(self):
+        """Largest scroll position that still fills the view"""
+        return max(0, len(self.lines) - self.lines_per_page)
+
+    def scroll(self, lines):
+        """Scroll by a number of lines"""
+        self.offset = max(0, min(self.max_offset(), self.offset + lines))
+
+    def turn_page(self, pages):
+        """Scroll by whole pages"""
+        self.scroll(pages * self.lines_per_page)
+
+    def page_number(self):
+        """(current page, page count), 1-based"""
+        count = max(1, -(-len(self.lines) // self.lines_per_page))
+        return min(count, self.offset // self.lines_per_page + 1), count
+
+    def update(self, dt):
+        """Advance the typewriter reveal"""
+        total = self.line_starts[-1]
+        if self.revealed < total:
+            self.revealed = min(total, self.revealed + dt * TYPEWRITER_CPS)
+
+    def finish(self):
+        """Reveal everything at once"""
+        self.revealed = self.line_starts[-1]
+
+    def is_revealing(self):
+        """True while the typewriter is still typing"""
+        return self.revealed < self.line_starts[-1]
+
+    def _line_surface(self, index):
+        """Rendered surface for a whole line (cached per text)"""
+        surface = self.line_surfaces.get(index)
+        if surface is None:
+            surface = self.layout.font.render(self.lines[index], True, self.color)
+            self.line_surfaces[index] = surface
+        return surface
+
+    def render(self, surface):
+        """Draw the visible lines"""
+        revealed = int(self.revealed)
+        first = self.offset
+        last = min(len(self.lines), first + self.lines_per_page)
+        # Lines fully revealed within the window
+        full = first
+        while full < last and self.line_starts[full + 1] <= revealed:
+            full += 1
+
+        key = (first, full)
+        if key != self.page_key:
+            self.page = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            line_height = self.layout.line_height
+            self.page.blits([(self._line_surface(index), (0, (index - first) * line_height))
+                             for index in range(first, full)], doreturn=False)
+            self.page_key = key
+        surface.blit(self.page, self.rect.topleft)
+
+        # The line being typed
+        if full < last and revealed > self.line_starts[full]:
+            partial = self.lines[full][:revealed - self.line_starts[full]]
+            text_surf = self.layout.font.render(partial, True, self.color)
+            surface.blit(text_surf, (self.rect.x, self.rect.y + (full - first) * self.layout.line_height))
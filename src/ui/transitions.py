@@ -0,0 +1,92 @@
+"""
+Screen Transitions for Breach game
+Snapshots of recently visited screens, shown instantly on a switch and
+cross-faded into the live screen
+"""
+from collections import OrderedDict
+import pygame
+from settings import SCREEN_SNAPSHOT_CACHE_BYTES, SCREEN_TRANSITION_MS
+
+
+class ScreenTransitions:
+    """LRU of last rendered frames per screen plus the running cross-fade
+
+    A snapshot is taken of the frame a screen was showing when the player
+    leaves it, copied into that screen's existing surface when there is
+    one. Least recently left screens are evicted once the snapshots
+    exceed the byte cap. On return, the snapshot is the whole first frame
+    (the live screen is not rendered at all), then it fades out over the
+    live screen for SCREEN_TRANSITION_MS.
+    """
+
+    def __init__(self, max_bytes=SCREEN_SNAPSHOT_CACHE_BYTES, fade_ms=SCREEN_TRANSITION_MS):
+        self.max_bytes = max_bytes
+        self.fade_ms = fade_ms
+        self.snapshots = OrderedDict()  # screen -> Surface
+        self.bytes = 0
+        self.fading = None  # Snapshot being faded out
+        self.fade_start = None  # Ticks of the first live frame; None = snapshot only
+
+    def store(self, screen, frame):
+        """Keep a copy of the frame a screen was last showing"""
+        snapshot = self.snapshots.pop(screen, None)
+        if snapshot is not None and snapshot.get_size() == frame.get_size():
+            snapshot.blit(frame, (0, 0))
+        else:
+            if snapshot is not None:
+                self.bytes -= self._size(snapshot)
+            snapshot = frame.copy()
+            self.bytes += self._size(snapshot)
+        self.snapshots[screen] = snapshot
+
+        # Evict the screens left longest ago, never the one just stored
+        while self.bytes > self.max_bytes and len(self.snapshots) > 1:
+            _, evicted = self.snapshots.popitem(last=False)
+            self.bytes -= self._size(evicted)
+
+    def begin(self, screen):
+        """Start a transition to screen; True if there is a snapshot to show"""
+        snapshot = self.snapshots.get(screen)
+        if snapshot is not None:
+            self.snapshots.move_to_end(screen)
+        self.fading = snapshot
+        self.fade_start = None
+        return snapshot is not None
+
+    def is_active(self):
+        """True while a snapshot is on screen"""
+        return self.fading is not None
+
+    def show_snapshot(self, surface):
+        """Draw the snapshot alone (first frame); returns False if the fade has begun"""
+        if self.fading is None or self.fade_start is not None:
+            return False
+        self.fading.set_alpha(None)
+        surface.blit(self.fading, (0, 0))
+        self.fade_start = pygame.time.get_ticks()
+        return True
+
+    def overlay(self, surface):
+        """Blend the fading snapshot over a live frame"""
+        if self.fading is None:
+            return
+        elapsed = pygame.time.get_ticks() - self.fade_start
+        alpha = 255 - 255 * elapsed // self.fade_ms if self.fade_ms > 0 else 0
+        if alpha <= 0:
+            self.fading.set_alpha(None)
+            self.fading = None
+            return
+        self.fading.set_alpha(alpha)
+        surface.blit(self.fading, (0, 0))
+
+    def clear(self):
+        """Forget every snapshot (screens were rebuilt)"""
+        self.snapshots.clear()
+        self.bytes = 0
+        self.fading = None
+        self.fade_start = None
+
+    @staticmethod
+    def _size(surface):
+        """Pixel bytes of a surface"""
+        return surface.get_pitch() * surface.get_height()
@@ -1,21 +1,23 @@
 """
 UI Elements for Breach game
-Enhanced with proper rendering
+Enhanced with proper rendering. Constructor positions and sizes are in
+layout units and scaled to the render target (see layout.py).
 """
 import pygame
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_WHITE, COLOR_GREEN, COLOR_YELLOW
+from src.ui.layout import get_layout
 
 
 class TextDisplay:
     """Text display element"""
 
     def __init__(self, x: int, y: int, text: str, size: int = 18, color=(255, 255, 255)):
-        self.x = x
-        self.y = y
+        layout = get_layout()
+        self.x, self.y = layout.pos(x, y)
         self.text = text
         self.size = size
         self.color = color
-        self.font = pygame.font.Font(None, size)
+        self.font = layout.font(size)
 
     def update(self, text: str):
         """Update text"""
@@ -31,15 +33,14 @@ class StatusBar:
     """Status bar with value indicator"""
 
     def __init__(self, x: int, y: int, width: int, height: int, label: str = "", color=(0, 255, 0)):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+        layout = get_layout()
+        self.x, self.y, self.width, self.height = layout.rect(x, y, width, height)
         self.label = label
         self.color = color
         self.current_value = 100
         self.max_value = 100
-        self.font = pygame.font.Font(None, 16)
+        self.font = layout.font(16)
+        self.label_offset = layout.pos(5, 2)
 
     def set_value(self, current: float, max_val: float):
         """Set bar value"""
@@ -65,25 +66,24 @@ class StatusBar:
         # Label
         if self.label:
             label_surf = self.font.render(self.label, True, (255, 255, 255))
-            surface.blit(label_surf, (self.x + 5, self.y + 2))
+            surface.blit(label_surf, (self.x + self.label_offset[0], self.y + self.label_offset[1]))
 
 
 class Panel:
     """UI Panel element"""
 
     def __init__(self, x: int, y: int, width: int, height: int, title: str = ""):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+        layout = get_layout()
+        self.rect = layout.rect(x, y, width, height)
+        self.x, self.y, self.width, self.height = self.rect
         self.title = title
-        self.rect = pygame.Rect(x, y, width, height)
-        self.font = pygame.font.Font(None, 24)
+        self.font = layout.font(24)
+        self.title_offset = layout.px(10)
 
         # Цвета для панели
         self.bg_color = (20, 35, 60)  # Тёмный синий
         self.border_color = (0, 150, 200)  # Светлый голубой
-        self.border_width = 2
+        self.border_width = max(1, layout.px(2))
 
     def render(self, surface):
         """Render panel"""
@@ -96,21 +96,20 @@ class Panel:
         # Title
         if self.title:
             title_surf = self.font.render(self.title, True, (0, 200, 255))
-            surface.blit(title_surf, (self.x + 10, self.y + 10))
+            surface.blit(title_surf, (self.x + self.title_offset, self.y + self.title_offset))
 
 
 class Button:
     """Interactive button element"""
 
     def __init__(self, x: int, y: int, width: int, height: int, text: str = "", callback=None):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
+        layout = get_layout()
+        self.rect = layout.rect(x, y, width, height)
+        self.x, self.y, self.width, self.height = self.rect
         self.text = text
         self.callback = callback
-        self.rect = pygame.Rect(x, y, width, height)
-        self.font = pygame.font.Font(None, 20)
+        self.font = layout.font(20)
+        self.inset = layout.px(5)
         self.hovered = False
         self.pressed = False
 
@@ -124,16 +123,30 @@ class Button:
     def handle_event(self, event):
         """Handle user input"""
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                self.pressed = True
-                if self.callback:
-                    self.callback()
+            self.click(event.pos)
 
         elif event.type == pygame.MOUSEBUTTONUP:
-            self.pressed = False
+            self.release()
 
         elif event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            self.point(event.pos)
+
+    def point(self, pos):
+        """Update hover state for the pointer position"""
+        self.hovered = self.rect.collidepoint(pos)
+
+    def click(self, pos):
+        """Press the button if pos is inside, returns True if it was hit"""
+        if not self.rect.collidepoint(pos):
+            return False
+        self.pressed = True
+        if self.callback:
+            self.callback()
+        return True
+
+    def release(self):
+        """Release the button"""
+        self.pressed = False
 
     def update(self):
         """Update button state"""
@@ -156,8 +169,8 @@ class Button:
 
         # Highlight on top (3D effect)
         pygame.draw.line(surface, (100, 200, 255),
-                        (self.x + 5, self.y + 5),
-                        (self.x + self.width - 5, self.y + 5), 2)
+                        (self.x + self.inset, self.y + self.inset),
+                        (self.x + self.width - self.inset, self.y + self.inset), 2)
 
         # Text
         if self.text: